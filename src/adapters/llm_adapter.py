@@ -9,14 +9,78 @@ Future:
 - Cloud escalation (when network enabled)
 """
 
+import copy
 import json
 import re
-import requests
-from typing import Optional, Any
+import time
+import random
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import lru_cache
+from typing import Optional, Any, Iterator, AsyncIterator
 from dataclasses import dataclass
 
+from core.cache import SemanticCache
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    _json_dumps = orjson.dumps
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+class JSONParseError(ValueError):
+    """The model answered, but no JSON object could be extracted from the text."""
+    
+    def __init__(self, raw: str):
+        super().__init__("Could not parse JSON from response")
+        self.raw = raw
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+@lru_cache(maxsize=16)
+def _field_pattern(key: str) -> "re.Pattern":
+    return re.compile(r'"%s"\s*:\s*' % re.escape(key))
+
+
+def extract_json_field(text: str, key: str) -> Optional[Any]:
+    """
+    Decode one field's value from possibly incomplete or malformed JSON text.
+    
+    Args:
+        text: Raw model output
+        key: Field name to look for
+        
+    Returns:
+        The first complete value found for key, or None
+    """
+    match = _field_pattern(key).search(text)
+    if not match:
+        return None
+    try:
+        value, _ = _JSON_DECODER.raw_decode(text, match.end())
+    except json.JSONDecodeError:
+        return None
+    return value
+
+
+@dataclass(slots=True)
 class LLMConfig:
     """Configuration for an LLM adapter."""
     model: str
@@ -24,6 +88,8 @@ class LLMConfig:
     timeout: int = 120
     default_temperature: float = 0.7
     default_max_tokens: int = 2048
+    embedding_model: Optional[str] = None  # Defaults to model
+    keep_alive: Optional[str] = "10m"  # Keep model (and its KV prefix cache) loaded between calls
 
 
 class OllamaAdapter:
@@ -33,22 +99,150 @@ class OllamaAdapter:
     Ollama must be running locally with a model pulled.
     """
     
-    def __init__(self, config: LLMConfig):
+    # Payloads are pre-serialized (orjson when available) and sent as raw bytes
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+    
+    def __init__(self, config: LLMConfig, session: Optional[Any] = None):
+        """
+        Args:
+            config: LLM configuration
+            session: requests.Session to share with other adapters on the same
+                host (e.g. Worker and Auditor); only its creator closes it
+        """
         self.config = config
         self.base_url = config.base_url.rstrip('/')
+        
+        # Imported here so MockAdapter-only use never pays for requests/urllib3
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+        except ImportError:
+            raise ImportError("requests not installed. Run: pip install requests")
+        self._requests = requests
+        
+        # Pooled session so every call reuses a keep-alive connection
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+            session.headers.update({"Connection": "keep-alive"})
+        self._session = session
+        
+        # Async client is created lazily so it binds to the caller's event loop
+        self._aclient = None
+        
+        # monotonic() time of the last successful availability probe
+        self._available_at: Optional[float] = None
+    
+    @property
+    def session(self) -> Any:
+        """The pooled requests.Session (pass to another adapter to share it)."""
+        return self._session
+    
+    def close(self) -> None:
+        """Close the pooled HTTP session, unless it was borrowed."""
+        if self._owns_session:
+            self._session.close()
+    
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client, if one was created."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+    
+    def _get_aclient(self) -> "httpx.AsyncClient":
+        """Get the shared async client, creating it on first use."""
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("httpx not installed. Run: pip install httpx")
+        
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.config.timeout,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32)
+            )
+        return self._aclient
+    
+    def _generate_payload(
+        self,
+        prompt: str,
+        system: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> dict:
+        """Build the /api/generate request body."""
+        payload = {
+            "model": self.config.model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {
+                "temperature": temperature or self.config.default_temperature,
+                "num_predict": max_tokens or self.config.default_max_tokens
+            }
+        }
+        
+        if system:
+            payload["system"] = system
+        
+        if self.config.keep_alive:
+            payload["keep_alive"] = self.config.keep_alive
+        
+        return payload
+    
+    def _chat_payload(
+        self,
+        messages: list[dict],
+        system: Optional[str],
+        temperature: Optional[float]
+    ) -> dict:
+        """Build the /api/chat request body."""
+        payload = {
+            "model": self.config.model,
+            "messages": messages,
+            "stream": False,
+            "options": {
+                "temperature": temperature or self.config.default_temperature
+            }
+        }
+        
+        if system:
+            payload["messages"] = [{"role": "system", "content": system}] + messages
+        
+        if self.config.keep_alive:
+            payload["keep_alive"] = self.config.keep_alive
+        
+        return payload
+    
+    # How long a positive is_available() result is trusted (seconds)
+    AVAILABILITY_TTL = 30.0
     
     def is_available(self) -> bool:
-        """Check if Ollama is running and model is available."""
+        """
+        Check if Ollama is running and model is available.
+        
+        A positive result is cached for AVAILABILITY_TTL seconds; any failed
+        request clears it so the next check probes again.
+        """
+        if (
+            self._available_at is not None
+            and time.monotonic() - self._available_at < self.AVAILABILITY_TTL
+        ):
+            return True
+        
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=5)
             if response.status_code != 200:
                 return False
             
-            data = response.json()
+            data = _json_loads(response.content)
             models = [m.get("name", "").split(":")[0] for m in data.get("models", [])]
-            return self.config.model.split(":")[0] in models
-        except requests.RequestException:
-            return False
+            available = self.config.model.split(":")[0] in models
+        except (self._requests.RequestException, ValueError):
+            available = False
+        
+        self._available_at = time.monotonic() if available else None
+        return available
     
     def generate(
         self,
@@ -69,29 +263,20 @@ class OllamaAdapter:
         Returns:
             Generated text
         """
-        payload = {
-            "model": self.config.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature or self.config.default_temperature,
-                "num_predict": max_tokens or self.config.default_max_tokens
-            }
-        }
-        
-        if system:
-            payload["system"] = system
+        payload = self._generate_payload(prompt, system, temperature, max_tokens)
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/generate",
-                json=payload,
+                data=_json_dumps(payload),
+                headers=self._JSON_HEADERS,
                 timeout=self.config.timeout
             )
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             return data.get("response", "")
-        except requests.RequestException as e:
+        except (self._requests.RequestException, ValueError) as e:
+            self._available_at = None
             raise RuntimeError(f"Ollama request failed: {str(e)}")
     
     def generate_json(
@@ -112,50 +297,83 @@ class OllamaAdapter:
             
         Returns:
             Parsed JSON dict
+            
+        Raises:
+            JSONParseError: If the response contains no parseable JSON
+            RuntimeError: If the request itself fails
         """
-        # Add JSON instruction to system prompt
-        json_system = system or ""
-        json_system += "\n\nIMPORTANT: Respond ONLY with valid JSON. No markdown, no explanation, just the JSON object."
-        
         raw = self.generate(
             prompt=prompt,
-            system=json_system,
+            system=self._json_system(system),
             temperature=temperature or 0.3,  # Lower temp for structured output
             max_tokens=self.config.default_max_tokens
         )
         
         # Try to extract JSON from response
-        return self._parse_json(raw)
+        return self._parse_json_strict(raw)
+    
+    _JSON_SYSTEM_SUFFIX = "\n\nIMPORTANT: Respond ONLY with valid JSON. No markdown, no explanation, just the JSON object."
+    
+    def _json_system(self, system: Optional[str]) -> str:
+        """
+        Add JSON instruction to system prompt.
+        
+        Normalized so the same system prompt always yields the same string,
+        letting Ollama reuse its cached prefill across calls.
+        """
+        if system and system.strip():
+            return system.rstrip() + self._JSON_SYSTEM_SUFFIX
+        return self._JSON_SYSTEM_SUFFIX.lstrip()
+    
+    # Compiled once; _parse_json runs on every structured LLM call
+    _CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+    _BRACE_RE = re.compile(r'\{[\s\S]*\}')
     
     def _parse_json(self, text: str) -> dict:
-        """Extract and parse JSON from text."""
-        # Try direct parse
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            pass
+        """Extract and parse JSON from text, or return an error structure."""
+        result = self._extract_json(text)
+        if result is None:
+            return {
+                "error": "Could not parse JSON from response",
+                "raw": text.strip()[:500]
+            }
+        return result
+    
+    def _parse_json_strict(self, text: str) -> dict:
+        """Extract and parse JSON from text, raising JSONParseError on failure."""
+        result = self._extract_json(text)
+        if result is None:
+            raise JSONParseError(text)
+        return result
+    
+    def _extract_json(self, text: str) -> Optional[dict]:
+        """Try direct, fenced, then brace-delimited JSON; None if all fail."""
+        text = text.strip()
+        
+        # Try direct parse (only worth attempting if it looks like JSON)
+        if text[:1] in ("{", "["):
+            try:
+                return _json_loads(text)
+            except json.JSONDecodeError:
+                pass
         
         # Try to find JSON in markdown code blocks
-        json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', text)
+        json_match = self._CODE_BLOCK_RE.search(text)
         if json_match:
             try:
-                return json.loads(json_match.group(1))
+                return _json_loads(json_match.group(1))
             except json.JSONDecodeError:
                 pass
         
         # Try to find JSON object in text
-        json_match = re.search(r'\{[\s\S]*\}', text)
+        json_match = self._BRACE_RE.search(text)
         if json_match:
             try:
-                return json.loads(json_match.group(0))
+                return _json_loads(json_match.group(0))
             except json.JSONDecodeError:
                 pass
         
-        # Last resort: return error structure
-        return {
-            "error": "Could not parse JSON from response",
-            "raw": text[:500]
-        }
+        return None
     
     def chat(
         self,
@@ -174,29 +392,353 @@ class OllamaAdapter:
         Returns:
             Assistant response
         """
-        payload = {
-            "model": self.config.model,
-            "messages": messages,
-            "stream": False,
-            "options": {
-                "temperature": temperature or self.config.default_temperature
-            }
-        }
+        payload = self._chat_payload(messages, system, temperature)
         
-        if system:
-            payload["messages"] = [{"role": "system", "content": system}] + messages
+        try:
+            response = self._session.post(
+                f"{self.base_url}/api/chat",
+                data=_json_dumps(payload),
+                headers=self._JSON_HEADERS,
+                timeout=self.config.timeout
+            )
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            return data.get("message", {}).get("content", "")
+        except (self._requests.RequestException, ValueError) as e:
+            self._available_at = None
+            raise RuntimeError(f"Ollama chat request failed: {str(e)}")
+    
+    def generate_stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Generate a text response, yielding chunks as they are decoded.
+        
+        Same arguments as generate().
+        """
+        payload = self._generate_payload(prompt, system, temperature, max_tokens)
+        payload["stream"] = True
+        
+        try:
+            with self._session.post(
+                f"{self.base_url}/api/generate",
+                data=_json_dumps(payload),
+                headers=self._JSON_HEADERS,
+                stream=True,
+                timeout=self.config.timeout
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    text = chunk.get("response", "")
+                    if text:
+                        yield text
+                    if chunk.get("done"):
+                        break
+        except (self._requests.RequestException, ValueError) as e:
+            self._available_at = None
+            raise RuntimeError(f"Ollama request failed: {str(e)}")
+    
+    def chat_stream(
+        self,
+        messages: list[dict],
+        system: Optional[str] = None,
+        temperature: Optional[float] = None
+    ) -> Iterator[str]:
+        """
+        Chat completion, yielding chunks as they are decoded.
+        
+        Same arguments as chat().
+        """
+        payload = self._chat_payload(messages, system, temperature)
+        payload["stream"] = True
         
         try:
-            response = requests.post(
+            with self._session.post(
                 f"{self.base_url}/api/chat",
-                json=payload,
+                data=_json_dumps(payload),
+                headers=self._JSON_HEADERS,
+                stream=True,
                 timeout=self.config.timeout
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    text = chunk.get("message", {}).get("content", "")
+                    if text:
+                        yield text
+                    if chunk.get("done"):
+                        break
+        except (self._requests.RequestException, ValueError) as e:
+            self._available_at = None
+            raise RuntimeError(f"Ollama chat request failed: {str(e)}")
+    
+    def embed(self, text: str) -> list[float]:
+        """
+        Compute an embedding vector for text.
+        
+        Uses config.embedding_model, falling back to the generation model.
+        """
+        payload = {
+            "model": self.config.embedding_model or self.config.model,
+            "prompt": text
+        }
+        
+        try:
+            response = self._session.post(
+                f"{self.base_url}/api/embeddings",
+                data=_json_dumps(payload),
+                headers=self._JSON_HEADERS,
+                timeout=self.config.timeout
+            )
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            return data.get("embedding", [])
+        except (self._requests.RequestException, ValueError) as e:
+            self._available_at = None
+            raise RuntimeError(f"Ollama embedding request failed: {str(e)}")
+    
+    # Marker used to split packed batch responses: "[1] answer"
+    _BATCH_MARKER_RE = re.compile(r'^\[(\d+)\]\s*', re.MULTILINE)
+    
+    def generate_batch(
+        self,
+        prompts: list[str],
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        mode: str = "concurrent"
+    ) -> list[str]:
+        """
+        Generate responses for several independent prompts.
+        
+        Args:
+            prompts: Prompts to answer, all sharing the same system prompt
+            system: Optional shared system prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate (per request)
+            mode: "concurrent" sends one request per prompt in parallel over
+                the pooled session; "pack" sends a single request with
+                indexed prompts and splits the indexed answers
+            
+        Returns:
+            List of responses, in the same order as prompts
+        """
+        if not prompts:
+            return []
+        
+        if mode == "pack":
+            raw = self.generate(
+                prompt=self._pack_prompts(prompts),
+                system=system,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+            return self._unpack_responses(raw, len(prompts))
+        
+        if mode != "concurrent":
+            raise ValueError(f"Unknown batch mode: {mode}")
+        
+        # Shared system prompt lets Ollama reuse the cached prefix
+        with ThreadPoolExecutor(max_workers=min(len(prompts), 16)) as executor:
+            return list(executor.map(
+                lambda p: self.generate(p, system, temperature, max_tokens),
+                prompts
+            ))
+    
+    def _pack_prompts(self, prompts: list[str]) -> str:
+        """Combine prompts into one indexed batch prompt."""
+        lines = [f"[{i}] {p}" for i, p in enumerate(prompts, start=1)]
+        lines.append("")
+        lines.append(
+            "Answer each numbered item in order. Start each answer on a new line "
+            "with its number in brackets, e.g. [1] ..."
+        )
+        return "\n".join(lines)
+    
+    def _unpack_responses(self, text: str, count: int) -> list[str]:
+        """Split an indexed batch response back into per-prompt answers."""
+        results = [""] * count
+        matches = list(self._BATCH_MARKER_RE.finditer(text))
+        
+        for i, match in enumerate(matches):
+            index = int(match.group(1)) - 1
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+            if 0 <= index < count:
+                results[index] = text[match.end():end].strip()
+        
+        return results
+    
+    def generate_json_batch(
+        self,
+        prompts: list[str],
+        system: Optional[str] = None,
+        schema: Optional[dict] = None,
+        temperature: Optional[float] = None
+    ) -> list[dict]:
+        """
+        Generate JSON responses for several prompts sharing a system prompt.
+        
+        Requests go out concurrently over the pooled session, so Ollama can
+        schedule them into its parallel decode slots together.
+        """
+        raw = self.generate_batch(
+            prompts,
+            system=self._json_system(system),
+            temperature=temperature or 0.3,
+            max_tokens=self.config.default_max_tokens
+        )
+        return [self._parse_json(text) for text in raw]
+    
+    def generate_json_stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        schema: Optional[dict] = None,
+        temperature: Optional[float] = None
+    ) -> Iterator[dict]:
+        """
+        Generate a JSON response, yielding partial results while decoding.
+        
+        Yields {"response": ...} as soon as that field is complete, then the
+        full parsed object (as generate_json() would return) at the end.
+        
+        Raises:
+            JSONParseError: If the full response contains no parseable JSON
+        """
+        parts = []
+        response_found = False
+        
+        for chunk in self.generate_stream(
+            prompt,
+            system=self._json_system(system),
+            temperature=temperature or 0.3,
+            max_tokens=self.config.default_max_tokens
+        ):
+            parts.append(chunk)
+            
+            # The key and a string value both end on a quote
+            if response_found or '"' not in chunk:
+                continue
+            value = extract_json_field("".join(parts), "response")
+            if value is None:
+                continue
+            response_found = True
+            yield {"response": value}
+        
+        yield self._parse_json_strict("".join(parts))
+    
+    # --- Async API ---
+    
+    async def agenerate(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Async version of generate() for concurrent callers."""
+        payload = self._generate_payload(prompt, system, temperature, max_tokens)
+        client = self._get_aclient()
+        
+        try:
+            response = await client.post(
+                "/api/generate", content=_json_dumps(payload), headers=self._JSON_HEADERS
+            )
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            return data.get("response", "")
+        except (httpx.HTTPError, ValueError) as e:
+            self._available_at = None
+            raise RuntimeError(f"Ollama request failed: {str(e)}")
+    
+    async def agenerate_stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Async version of generate_stream()."""
+        payload = self._generate_payload(prompt, system, temperature, max_tokens)
+        payload["stream"] = True
+        client = self._get_aclient()
+        
+        try:
+            async with client.stream(
+                "POST", "/api/generate", content=_json_dumps(payload), headers=self._JSON_HEADERS
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    text = chunk.get("response", "")
+                    if text:
+                        yield text
+                    if chunk.get("done"):
+                        break
+        except (httpx.HTTPError, ValueError) as e:
+            self._available_at = None
+            raise RuntimeError(f"Ollama request failed: {str(e)}")
+    
+    async def agenerate_json(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        schema: Optional[dict] = None,
+        temperature: Optional[float] = None
+    ) -> dict:
+        """Async version of generate_json()."""
+        raw = await self.agenerate(
+            prompt=prompt,
+            system=self._json_system(system),
+            temperature=temperature or 0.3,
+            max_tokens=self.config.default_max_tokens
+        )
+        return self._parse_json_strict(raw)
+    
+    async def achat(
+        self,
+        messages: list[dict],
+        system: Optional[str] = None,
+        temperature: Optional[float] = None
+    ) -> str:
+        """Async version of chat()."""
+        payload = self._chat_payload(messages, system, temperature)
+        client = self._get_aclient()
+        
+        try:
+            response = await client.post(
+                "/api/chat", content=_json_dumps(payload), headers=self._JSON_HEADERS
             )
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             return data.get("message", {}).get("content", "")
-        except requests.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
+            self._available_at = None
             raise RuntimeError(f"Ollama chat request failed: {str(e)}")
+    
+    async def agenerate_batch(
+        self,
+        prompts: list[str],
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> list[str]:
+        """Async concurrent batch: all prompts in flight at once on the shared client."""
+        return list(await asyncio.gather(*[
+            self.agenerate(p, system=system, temperature=temperature, max_tokens=max_tokens)
+            for p in prompts
+        ]))
 
 
 class MockAdapter:
@@ -222,6 +764,9 @@ class MockAdapter:
     def is_available(self) -> bool:
         return True
     
+    def close(self) -> None:
+        pass
+    
     def generate(
         self,
         prompt: str,
@@ -249,6 +794,382 @@ class MockAdapter:
             "reasoning": "Mock reasoning",
             "caveats": []
         }
+    
+    async def agenerate(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        return self.generate(prompt, system, temperature, max_tokens)
+    
+    async def agenerate_json(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        schema: Optional[dict] = None,
+        temperature: Optional[float] = None
+    ) -> dict:
+        return self.generate_json(prompt, system, schema, temperature)
+    
+    def generate_stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        yield self.generate(prompt, system, temperature, max_tokens)
+    
+    def generate_batch(
+        self,
+        prompts: list[str],
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        mode: str = "concurrent"
+    ) -> list[str]:
+        return [self.generate(p, system, temperature, max_tokens) for p in prompts]
+    
+    def generate_json_batch(
+        self,
+        prompts: list[str],
+        system: Optional[str] = None,
+        schema: Optional[dict] = None,
+        temperature: Optional[float] = None
+    ) -> list[dict]:
+        return [self.generate_json(p, system, schema, temperature) for p in prompts]
+    
+    def generate_json_stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        schema: Optional[dict] = None,
+        temperature: Optional[float] = None
+    ) -> Iterator[dict]:
+        result = self.generate_json(prompt, system, schema, temperature)
+        if "response" in result:
+            yield {"response": result["response"]}
+        yield result
+    
+    async def aclose(self) -> None:
+        pass
+
+
+class CachedAdapter:
+    """
+    Response cache in front of another adapter.
+    
+    Exact repeats are served from a hash lookup; near-identical prompts are
+    served when their embeddings are similar enough (see SemanticCache).
+    Everything else is delegated to the wrapped adapter.
+    
+    Entries are partitioned by call kind and system prompt: only the prompt
+    is embedded (a long shared system prompt would otherwise dominate the
+    similarity), and a semantic hit from another partition is a miss.
+    """
+    
+    _SEP = "\x00"
+    
+    def __init__(self, adapter: Any, cache: Optional[SemanticCache] = None):
+        self.adapter = adapter
+        self.config = adapter.config
+        if cache is None:
+            embed_fn = getattr(adapter, "embed", None)
+            prompt_embed = None
+            if embed_fn:
+                def prompt_embed(key: str) -> list[float]:
+                    return embed_fn(key.split(self._SEP, 2)[2])
+            cache = SemanticCache(embed_fn=prompt_embed)
+        self.cache = cache
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.adapter, name)
+    
+    @classmethod
+    def _cache_key(cls, kind: str, prompt: str, system: Optional[str]) -> tuple[str, str]:
+        """Return (partition, key); the key is "<kind>\\x00<system digest>\\x00<prompt>"."""
+        digest = hashlib.blake2b((system or "").encode(), digest_size=16).hexdigest()
+        partition = f"{kind}{cls._SEP}{digest}"
+        return partition, f"{partition}{cls._SEP}{prompt}"
+    
+    def _lookup(self, kind: str, prompt: str, system: Optional[str]) -> tuple[str, str, Any]:
+        """Return (partition, key, cached result or None)."""
+        partition, key = self._cache_key(kind, prompt, system)
+        entry = self.cache.get(key)
+        if not isinstance(entry, dict) or entry.get("partition") != partition:
+            return partition, key, None
+        return partition, key, entry["result"]
+    
+    def generate(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        partition, key, cached = self._lookup("text", prompt, system)
+        if cached is not None:
+            return cached
+        
+        result = self.adapter.generate(prompt, system, temperature, max_tokens)
+        self.cache.put(key, {"partition": partition, "result": result})
+        return result
+    
+    def generate_json(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        schema: Optional[dict] = None,
+        temperature: Optional[float] = None
+    ) -> dict:
+        partition, key, cached = self._lookup("json", prompt, system)
+        if cached is not None:
+            # Deep copies both ways: callers may mutate nested lists
+            # (caveats, citations) without touching the cached entry
+            return copy.deepcopy(cached)
+        
+        result = self.adapter.generate_json(prompt, system, schema, temperature)
+        # Don't cache parse failures
+        if "error" not in result:
+            self.cache.put(key, {"partition": partition, "result": copy.deepcopy(result)})
+        return result
+
+
+class BatchingAdapter:
+    """
+    Micro-batches concurrent generate_json calls.
+    
+    Calls from different threads that share a system prompt and temperature
+    (so Worker and Auditor calls land in separate batches) are queued and
+    sent together through the wrapped adapter's generate_json_batch, either
+    after max_latency seconds or once max_batch_size are waiting. Adapters
+    without generate_json_batch are called directly. Everything else is
+    delegated to the wrapped adapter.
+    """
+    
+    def __init__(self, adapter: Any, max_batch_size: int = 16, max_latency: float = 0.02):
+        self.adapter = adapter
+        self.config = adapter.config
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self._lock = threading.Lock()
+        # (system, temperature) -> queued (prompt, future) pairs
+        self._pending: dict[tuple, list[tuple[str, Future]]] = {}
+        self._timers: dict[tuple, threading.Timer] = {}
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.adapter, name)
+    
+    def generate_json(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        schema: Optional[dict] = None,
+        temperature: Optional[float] = None
+    ) -> dict:
+        if not hasattr(self.adapter, "generate_json_batch"):
+            return self.adapter.generate_json(prompt, system, schema, temperature)
+        
+        key = (system, temperature)
+        future: Future = Future()
+        ready = None
+        
+        with self._lock:
+            queued = self._pending.setdefault(key, [])
+            queued.append((prompt, future))
+            if len(queued) >= self.max_batch_size:
+                ready = self._take(key)
+            elif key not in self._timers:
+                timer = threading.Timer(self.max_latency, self._flush, args=(key,))
+                timer.daemon = True
+                self._timers[key] = timer
+                timer.start()
+        
+        if ready:
+            self._dispatch(key, ready)
+        return future.result()
+    
+    def _take(self, key: tuple) -> list[tuple[str, Future]]:
+        """Remove and return a queued batch (caller holds the lock)."""
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        return self._pending.pop(key, [])
+    
+    def _flush(self, key: tuple) -> None:
+        with self._lock:
+            ready = self._take(key)
+        if ready:
+            self._dispatch(key, ready)
+    
+    def _dispatch(self, key: tuple, batch: list[tuple[str, Future]]) -> None:
+        """Send one batch and resolve its futures."""
+        system, temperature = key
+        try:
+            results = self.adapter.generate_json_batch(
+                [prompt for prompt, _ in batch], system, None, temperature
+            )
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            # Batch APIs return error structures; generate_json raises
+            if "error" in result and "raw" in result:
+                future.set_exception(JSONParseError(result["raw"]))
+            else:
+                future.set_result(result)
+        
+        # A short result list must not leave callers blocked on result()
+        if len(results) < len(batch):
+            error = RuntimeError(
+                f"generate_json_batch returned {len(results)} results for {len(batch)} prompts"
+            )
+            for _, future in batch[len(results):]:
+                future.set_exception(error)
+
+
+class RouterLLMAdapter:
+    """
+    Spreads calls over several equivalent adapters (e.g. one per Ollama host).
+    
+    Each call goes to the less loaded of two randomly chosen backends
+    (power-of-two choices on in-flight calls). Wrap each backend in
+    BatchingAdapter first so every backend batches its own share. Other
+    attributes are read from the first adapter.
+    """
+    
+    def __init__(self, adapters: list[Any]):
+        if not adapters:
+            raise ValueError("RouterLLMAdapter needs at least one adapter")
+        self.adapters = list(adapters)
+        self.config = self.adapters[0].config
+        self._in_flight = [0] * len(self.adapters)
+        self._lock = threading.Lock()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.adapters[0], name)
+    
+    def _acquire(self) -> int:
+        """Pick a backend and count the call against it."""
+        with self._lock:
+            if len(self.adapters) == 1:
+                index = 0
+            else:
+                a, b = random.sample(range(len(self.adapters)), 2)
+                index = a if self._in_flight[a] <= self._in_flight[b] else b
+            self._in_flight[index] += 1
+        return index
+    
+    def _release(self, index: int) -> None:
+        with self._lock:
+            self._in_flight[index] -= 1
+    
+    def _call(self, method: str, *args: Any) -> Any:
+        index = self._acquire()
+        try:
+            return getattr(self.adapters[index], method)(*args)
+        finally:
+            self._release(index)
+    
+    def _stream(self, method: str, *args: Any) -> Iterator[Any]:
+        index = self._acquire()
+        try:
+            yield from getattr(self.adapters[index], method)(*args)
+        finally:
+            self._release(index)
+    
+    def is_available(self) -> bool:
+        return any(adapter.is_available() for adapter in self.adapters)
+    
+    def close(self) -> None:
+        for adapter in self.adapters:
+            adapter.close()
+    
+    def generate(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        return self._call("generate", prompt, system, temperature, max_tokens)
+    
+    def generate_json(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        schema: Optional[dict] = None,
+        temperature: Optional[float] = None
+    ) -> dict:
+        return self._call("generate_json", prompt, system, schema, temperature)
+    
+    def generate_json_batch(
+        self,
+        prompts: list[str],
+        system: Optional[str] = None,
+        schema: Optional[dict] = None,
+        temperature: Optional[float] = None
+    ) -> list[dict]:
+        return self._call("generate_json_batch", prompts, system, schema, temperature)
+    
+    def chat(
+        self,
+        messages: list[dict],
+        system: Optional[str] = None,
+        temperature: Optional[float] = None
+    ) -> str:
+        return self._call("chat", messages, system, temperature)
+    
+    def embed(self, text: str) -> list[float]:
+        return self._call("embed", text)
+    
+    def generate_stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        return self._stream("generate_stream", prompt, system, temperature, max_tokens)
+    
+    def generate_json_stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        schema: Optional[dict] = None,
+        temperature: Optional[float] = None
+    ) -> Iterator[dict]:
+        return self._stream("generate_json_stream", prompt, system, schema, temperature)
+    
+    async def agenerate(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        index = self._acquire()
+        try:
+            return await self.adapters[index].agenerate(prompt, system, temperature, max_tokens)
+        finally:
+            self._release(index)
+    
+    async def agenerate_json(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        schema: Optional[dict] = None,
+        temperature: Optional[float] = None
+    ) -> dict:
+        index = self._acquire()
+        try:
+            return await self.adapters[index].agenerate_json(prompt, system, schema, temperature)
+        finally:
+            self._release(index)
 
 
 def create_adapter(adapter_type: str, config: LLMConfig) -> Any:
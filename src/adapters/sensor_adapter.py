@@ -22,7 +22,7 @@ class SensorType(Enum):
     AUDIO = "audio"
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorReading:
     """A reading from a sensor."""
     sensor_type: SensorType
@@ -54,7 +54,7 @@ class SensorAdapter(Protocol):
 
 # --- Video Adapter Stub ---
 
-@dataclass
+@dataclass(slots=True)
 class VideoFrame:
     """A video frame."""
     width: int
@@ -135,7 +135,7 @@ class VideoAdapter:
 
 # --- Wearable Adapter Stub ---
 
-@dataclass
+@dataclass(slots=True)
 class WearableData:
     """Data from a wearable device."""
     heart_rate: Optional[int] = None  # BPM
@@ -230,7 +230,7 @@ class WearableAdapter:
 
 # --- Audio Adapter Stub ---
 
-@dataclass
+@dataclass(slots=True)
 class AudioSegment:
     """An audio segment."""
     duration_seconds: float
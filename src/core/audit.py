@@ -14,15 +14,51 @@ The log is designed to be:
 - Queryable (by time, type, session)
 """
 
+import os
+import sys
 import json
+import time
+import mmap
+import zlib
+import queue
+import atexit
+import bisect
+import struct
 import hashlib
 import threading
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, Any
+from datetime import datetime, timezone
+from typing import Optional, Any, Iterator
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    from blake3 import blake3 as _blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+
+# Checksum algorithms, recorded per event so older logs still verify.
+# Events without a hash_algo field predate this and use sha256.
+HASH_ALGORITHMS = ("sha256", "blake2b", "blake3")
+DEFAULT_HASH_ALGO = "blake3" if BLAKE3_AVAILABLE else "blake2b"
+
+
+def _digest(algo: str, data: bytes) -> str:
+    """Compute a 16-hex-char digest with the named algorithm."""
+    if algo == "blake3":
+        if not BLAKE3_AVAILABLE:
+            raise ValueError("blake3 not installed. Run: pip install blake3")
+        return _blake3(data).hexdigest(length=8)
+    if algo == "blake2b":
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+    if algo == "sha256":
+        return hashlib.sha256(data).hexdigest()[:16]
+    raise ValueError(f"Unknown hash algorithm: {algo}")
+
 
 class EventType(Enum):
     """Types of audit events."""
@@ -65,7 +101,11 @@ class EventType(Enum):
     RAO_BUNDLE_REJECTED = "rao_bundle_rejected"
 
 
-@dataclass
+# EventType -> interned value string, so log() skips isinstance + .value per call
+_EVENT_TYPE_VALUES: dict[EventType, str] = {e: sys.intern(e.value) for e in EventType}
+
+
+@dataclass(slots=True)
 class AuditEvent:
     """A single audit event."""
     timestamp: str
@@ -75,6 +115,7 @@ class AuditEvent:
     details: dict
     checksum: str = ""
     previous_checksum: str = ""
+    hash_algo: str = "sha256"
     
     def to_dict(self) -> dict:
         return asdict(self)
@@ -83,6 +124,199 @@ class AuditEvent:
         return json.dumps(self.to_dict())
 
 
+@lru_cache(maxsize=4096)
+def _hash_text(algo: str, text: str) -> str:
+    """Digest of a redacted text field, memoized for repeated queries/retries."""
+    return _digest(algo, text.encode())
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp
+_timestamp_prefix: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> tuple[str, int]:
+    """
+    Current UTC time as (ISO-8601 string with Z suffix, microseconds since epoch).
+    
+    Built from time.time_ns() with the date/time prefix reused within the
+    same second, so only the fraction is formatted per event. Always includes
+    microseconds so timestamps sort lexicographically.
+    """
+    global _timestamp_prefix
+    micros = time.time_ns() // 1000
+    seconds, fraction = divmod(micros, 1_000_000)
+    
+    cached_seconds, prefix = _timestamp_prefix
+    if cached_seconds != seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _timestamp_prefix = (seconds, prefix)
+    
+    return f"{prefix}.{fraction:06d}Z", micros
+
+
+def _timestamp_to_micros(value: datetime | str) -> int:
+    """Convert an event timestamp (naive = UTC) to microseconds since epoch."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.rstrip("Z"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _timestamp_bound(value: datetime) -> str:
+    """Format a query bound (naive = UTC) in the form _sortable_timestamp() returns."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+
+def _sortable_timestamp(value: str) -> str:
+    """
+    Event timestamp as a fixed-width, lexicographically sortable string.
+    
+    New events already carry microseconds; legacy ones written via
+    isoformat() drop the fraction when it is zero, so pad those.
+    """
+    if len(value) == 27 and value[19] == ".":
+        return value[:26]
+    value = value.rstrip("Z")
+    return value if "." in value else value + ".000000"
+
+
+def _event_type_tag(event_type: str) -> int:
+    """16-bit tag for an event type (a pre-filter; matches are confirmed on parse)."""
+    return zlib.crc32(event_type.encode()) & 0xFFFF
+
+
+class AuditIndex:
+    """
+    Sidecar offset index for the audit log.
+    
+    One fixed-size record per event: (timestamp_us, byte_offset, type_tag).
+    Timestamps are appended in log order, so time-range queries can bisect
+    to the first matching record and read only the selected lines.
+    """
+    
+    RECORD = struct.Struct("<QQH")
+    
+    def __init__(self, index_path: Path):
+        self.index_path = Path(index_path)
+        self._fh = open(self.index_path, 'ab')
+        self._last_ts: Optional[int] = None
+        self._sorted: Optional[bool] = None  # Unknown until first scan
+    
+    def append(self, timestamp_us: int, offset: int, event_type: str) -> None:
+        """Record the position of a newly written event."""
+        if self._last_ts is not None and timestamp_us < self._last_ts:
+            self._sorted = False  # Clock went backward; bisect is no longer safe
+        self._last_ts = timestamp_us
+        self._fh.write(self.RECORD.pack(timestamp_us, offset, _event_type_tag(event_type)))
+    
+    def flush(self) -> None:
+        if not self._fh.closed:
+            self._fh.flush()
+    
+    def close(self) -> None:
+        if not self._fh.closed:
+            self._fh.close()
+    
+    def matches_log(self, log_path: Path, log_size: int) -> bool:
+        """Cheap consistency check: the last record must point at the log's last line."""
+        self.flush()
+        index_size = self.index_path.stat().st_size
+        if index_size % self.RECORD.size:
+            return False
+        if index_size == 0:
+            return log_size == 0
+        
+        with open(self.index_path, 'rb') as f:
+            f.seek(index_size - self.RECORD.size)
+            _, offset, _ = self.RECORD.unpack(f.read(self.RECORD.size))
+        
+        with open(log_path, 'rb') as f:
+            f.seek(offset)
+            return offset + len(f.readline()) == log_size
+    
+    def rebuild(self, log_path: Path) -> None:
+        """Rebuild the index with a single scan of the log."""
+        self._fh.close()
+        records = []
+        last_ts = None
+        is_sorted = True
+        offset = 0
+        
+        with open(log_path, 'rb') as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                    ts = _timestamp_to_micros(data["timestamp"])
+                    records.append(self.RECORD.pack(ts, offset, _event_type_tag(data.get("event_type", ""))))
+                    if last_ts is not None and ts < last_ts:
+                        is_sorted = False
+                    last_ts = ts
+                except (json.JSONDecodeError, KeyError, ValueError, TypeError):
+                    pass
+                offset += len(line)
+        
+        with open(self.index_path, 'wb') as f:
+            f.writelines(records)
+        
+        self._fh = open(self.index_path, 'ab')
+        self._last_ts = last_ts
+        self._sorted = is_sorted
+    
+    def offsets(
+        self,
+        from_us: Optional[int] = None,
+        to_us: Optional[int] = None,
+        event_types: Optional[list[str]] = None
+    ) -> Optional[list[int]]:
+        """
+        Get log offsets of events that may match the filters.
+        
+        Returns None if the index can't answer (e.g. timestamps not sorted).
+        """
+        self.flush()
+        if self.index_path.stat().st_size == 0:
+            return []
+        
+        with open(self.index_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = _IndexView(mm, self.RECORD)
+            
+            if self._sorted is None:
+                self._sorted = all(view[i] <= view[i + 1] for i in range(len(view) - 1))
+            if not self._sorted and (from_us is not None or to_us is not None):
+                return None
+            
+            start = bisect.bisect_left(view, from_us) if from_us is not None else 0
+            end = bisect.bisect_right(view, to_us) if to_us is not None else len(view)
+            tags = {_event_type_tag(t) for t in event_types} if event_types else None
+            
+            result = []
+            for i in range(start, end):
+                _, offset, tag = self.RECORD.unpack_from(mm, i * self.RECORD.size)
+                if tags is None or tag in tags:
+                    result.append(offset)
+            return result
+
+
+class _IndexView:
+    """Sequence of index timestamps backed by an mmap (for bisect)."""
+    
+    def __init__(self, mm: mmap.mmap, record: struct.Struct):
+        self._mm = mm
+        self._record = record
+        self._len = len(mm) // record.size
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def __getitem__(self, i: int) -> int:
+        return self._record.unpack_from(self._mm, i * self._record.size)[0]
+
+
 class AuditLogger:
     """
     Append-only audit logger.
@@ -93,17 +327,30 @@ class AuditLogger:
     - JSON lines format for easy parsing
     - Configurable retention
     - Redaction support
+    - Optional background writer (checksums stay synchronous, only I/O is deferred)
     """
     
+    # Fields to potentially redact
+    SENSITIVE_FIELDS = ("query", "response", "message")
+    
+    # Write buffer size for the long-lived log handle
+    _WRITE_BUFFER_SIZE = 1 << 16
+    
     def __init__(
         self,
         log_path: Path,
         device_id: str = "unknown",
-        redaction_level: str = "standard"
+        redaction_level: str = "standard",
+        hash_algo: str = DEFAULT_HASH_ALGO,
+        background_writes: bool = False
     ):
+        if hash_algo not in HASH_ALGORITHMS:
+            raise ValueError(f"Unknown hash algorithm: {hash_algo}")
+        
         self.log_path = Path(log_path)
         self.device_id = device_id
         self.redaction_level = redaction_level
+        self.hash_algo = hash_algo
         self._lock = threading.Lock()
         self._last_checksum = "genesis"
         self._event_count = 0
@@ -114,24 +361,184 @@ class AuditLogger:
         # Load last checksum if log exists
         if self.log_path.exists():
             self._load_last_checksum()
+        
+        # Single append handle for the logger's lifetime
+        self._fh = open(self.log_path, 'ab', buffering=self._WRITE_BUFFER_SIZE)
+        self._log_size = self._fh.tell()
+        
+        # Offset index for time-range queries; rebuilt lazily if out of date
+        self._index = AuditIndex(self.log_path.with_suffix(".idx"))
+        self._index_stale = not self._index.matches_log(self.log_path, self._log_size)
+        
+        # Running per-type counters; None until loaded from sidecar or counted
+        self._stats_path = self.log_path.with_suffix(".stats.json")
+        self._type_counts: Optional[dict[str, int]] = None
+        self._load_stats()
+        
+        # Background writer: log() enqueues lines, the thread batches them to disk
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        if background_writes:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name="audit-writer",
+                daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.close)
+    
+    def _writer_loop(self) -> None:
+        """Drain queued lines and write them in batches."""
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = None in batch
+            lines = [line for line in batch if line is not None]
+            if lines:
+                # One buffered flush per drained batch (a single write while
+                # the batch fits in _WRITE_BUFFER_SIZE)
+                self._fh.writelines(lines)
+                self._fh.flush()
+            
+            for _ in batch:
+                self._queue.task_done()
+            
+            if stop:
+                return
+    
+    def _flush_pending(self) -> None:
+        """Make all logged events visible to readers of the log file."""
+        if self._fh.closed:
+            return
+        if self._queue is not None:
+            self._queue.join()
+        self._fh.flush()
+        self._index.flush()
+    
+    def flush(self) -> None:
+        """Write all pending events and fsync the log to disk."""
+        if self._fh.closed:
+            return
+        self._flush_pending()
+        os.fsync(self._fh.fileno())
+    
+    def close(self) -> None:
+        """Flush pending events and close the log handle."""
+        if self._fh.closed:
+            return
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        self.flush()
+        self._fh.close()
+        self._index.close()
+        self._save_stats()
+    
+    def _load_stats(self) -> None:
+        """Load persisted counters if they match the current log size."""
+        try:
+            with open(self._stats_path, 'r') as f:
+                data = json.load(f)
+            if data.get("size_bytes") == self._log_size:
+                self._type_counts = dict(data["by_type"])
+                self._event_count = data["events"]
+        except (json.JSONDecodeError, FileNotFoundError, KeyError, TypeError, ValueError):
+            pass
+    
+    def _save_stats(self) -> None:
+        """Persist counters so the next start doesn't need to rescan."""
+        if self._type_counts is None:
+            return
+        try:
+            with open(self._stats_path, 'w') as f:
+                json.dump({
+                    "size_bytes": self._log_size,
+                    "events": self._event_count,
+                    "by_type": self._type_counts
+                }, f)
+        except OSError:
+            pass
+    
+    def _count_events(self) -> None:
+        """Count events by type with one scan of the log."""
+        event_counts = {}
+        total_events = 0
+        
+        with open(self.log_path, 'rb') as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                    event_type = data.get("event_type", "unknown")
+                    event_counts[event_type] = event_counts.get(event_type, 0) + 1
+                    total_events += 1
+                except json.JSONDecodeError:
+                    pass
+        
+        self._type_counts = event_counts
+        self._event_count = total_events
+    
+    # Backward scan parameters for finding the last log line
+    _TAIL_BLOCK_SIZE = 4096
+    _TAIL_MAX_SCAN = 1 << 20
     
     def _load_last_checksum(self) -> None:
         """Load the last checksum from existing log."""
         try:
-            last_line = None
-            with open(self.log_path, 'r') as f:
-                for line in f:
-                    last_line = line
+            last_line = self._read_last_line()
             if last_line:
                 event = json.loads(last_line)
                 self._last_checksum = event.get("checksum", "genesis")
         except (json.JSONDecodeError, FileNotFoundError):
             pass
     
+    def _read_last_line(self) -> Optional[bytes]:
+        """
+        Read the last non-empty line by scanning backward from end of file.
+        
+        Falls back to a full forward scan if no line break is found
+        within _TAIL_MAX_SCAN bytes.
+        """
+        with open(self.log_path, 'rb') as f:
+            f.seek(0, 2)
+            position = f.tell()
+            buffer = b""
+            
+            while position > 0 and len(buffer) < self._TAIL_MAX_SCAN:
+                read_size = min(self._TAIL_BLOCK_SIZE, position)
+                position -= read_size
+                f.seek(position)
+                buffer = f.read(read_size) + buffer
+                
+                stripped = buffer.rstrip(b"\r\n")
+                newline = stripped.rfind(b"\n")
+                if newline != -1:
+                    return stripped[newline + 1:]
+                if position == 0:
+                    return stripped or None
+            
+            # Very long final line — fall back to a full scan
+            f.seek(0)
+            last_line = None
+            for line in f:
+                if line.strip():
+                    last_line = line
+            return last_line
+    
     def _compute_checksum(self, event: dict, previous: str) -> str:
         """Compute checksum for tamper evidence."""
-        content = json.dumps(event, sort_keys=True) + previous
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        canonical = json.dumps(event, sort_keys=True)
+        return self._checksum_canonical(canonical, previous, event.get("hash_algo", "sha256"))
+    
+    @staticmethod
+    def _checksum_canonical(canonical: str, previous: str, algo: str) -> str:
+        """Compute checksum from an already-serialized canonical event."""
+        return _digest(algo, (canonical + previous).encode())
     
     def _redact(self, details: dict) -> dict:
         """Apply redaction based on level."""
@@ -139,9 +546,7 @@ class AuditLogger:
             return details
         
         redacted = details.copy()
-        
-        # Fields to potentially redact
-        sensitive_fields = ["query", "response", "message"]
+        sensitive_fields = self.SENSITIVE_FIELDS
         
         if self.redaction_level in ["standard", "strict"]:
             # Truncate long text fields
@@ -157,7 +562,7 @@ class AuditLogger:
                     content = redacted[field]
                     redacted[field] = {
                         "redacted": True,
-                        "hash": hashlib.sha256(content.encode()).hexdigest()[:16],
+                        "hash": _hash_text(self.hash_algo, content),
                         "length": len(content)
                     }
         
@@ -182,13 +587,10 @@ class AuditLogger:
         """
         with self._lock:
             # Normalize event type
-            if isinstance(event_type, EventType):
-                event_type_str = event_type.value
-            else:
-                event_type_str = event_type
+            event_type_str = _EVENT_TYPE_VALUES.get(event_type, event_type)
             
             # Create event
-            timestamp = datetime.utcnow().isoformat() + "Z"
+            timestamp, timestamp_us = _utc_timestamp()
             redacted_details = self._redact(details)
             
             event = AuditEvent(
@@ -197,21 +599,37 @@ class AuditLogger:
                 session_id=session_id,
                 device_id=self.device_id,
                 details=redacted_details,
-                previous_checksum=self._last_checksum
+                previous_checksum=self._last_checksum,
+                hash_algo=self.hash_algo
             )
             
-            # Compute checksum
+            # Serialize once: the canonical form is both hashed and written.
+            # Stays on stdlib json: verify_integrity's slow path recomputes
+            # checksums with json.dumps(sort_keys=True), and orjson differs
+            # in separators and non-ASCII escaping.
             event_dict = event.to_dict()
             del event_dict["checksum"]  # Don't include checksum in its own computation
-            event.checksum = self._compute_checksum(event_dict, self._last_checksum)
+            canonical = json.dumps(event_dict, sort_keys=True)
+            event.checksum = self._checksum_canonical(canonical, self._last_checksum, self.hash_algo)
+            line = f'{canonical[:-1]}, "checksum": "{event.checksum}"}}\n'
             
             # Write to log
-            with open(self.log_path, 'a') as f:
-                f.write(event.to_json() + "\n")
+            data = line.encode()
+            if self._queue is not None:
+                self._queue.put(data)
+            else:
+                self._fh.write(data)
+                self._fh.flush()
+            
+            if not self._index_stale:
+                self._index.append(timestamp_us, self._log_size, event_type_str)
+            self._log_size += len(data)
             
             # Update state
             self._last_checksum = event.checksum
             self._event_count += 1
+            if self._type_counts is not None:
+                self._type_counts[event_type_str] = self._type_counts.get(event_type_str, 0) + 1
             
             return event
     
@@ -236,16 +654,62 @@ class AuditLogger:
         Returns:
             List of matching AuditEvents
         """
-        results = []
+        return [event for _, event in self._query(event_types, session_id, from_time, to_time, limit)]
+    
+    def query_json(
+        self,
+        event_types: Optional[list[str]] = None,
+        session_id: Optional[str] = None,
+        from_time: Optional[datetime] = None,
+        to_time: Optional[datetime] = None,
+        limit: int = 1000
+    ) -> list[bytes]:
+        """
+        Like query(), but return each matching event as its JSON log line.
         
+        The stored line already is the event's JSON (checksum included), so
+        callers serving events over HTTP can splice these bytes into a
+        response instead of re-serializing AuditEvents.
+        """
+        return [line.rstrip(b"\r\n") for line, _ in self._query(event_types, session_id, from_time, to_time, limit)]
+    
+    def _query(
+        self,
+        event_types: Optional[list[str]],
+        session_id: Optional[str],
+        from_time: Optional[datetime],
+        to_time: Optional[datetime],
+        limit: int
+    ) -> Iterator[tuple[bytes, AuditEvent]]:
+        """Yield (log line, event) for up to limit matching events."""
         if not self.log_path.exists():
-            return results
+            return
         
-        with open(self.log_path, 'r') as f:
-            for line in f:
-                if len(results) >= limit:
+        self._flush_pending()
+        matched = 0
+        
+        event_types = frozenset(event_types) if event_types else None
+        
+        # Byte needles reject non-matching lines before decode/parse
+        type_needles = tuple(
+            f'"event_type": {json.dumps(t)}'.encode() for t in event_types
+        ) if event_types else None
+        session_needle = f'"session_id": {json.dumps(session_id)}'.encode() if session_id else None
+        
+        # Bounds formatted once; rows are compared as strings, not parsed
+        from_ts = _timestamp_bound(from_time) if from_time else None
+        to_ts = _timestamp_bound(to_time) if to_time else None
+        
+        with open(self.log_path, 'rb') as f:
+            for line in self._candidate_lines(f, event_types, from_time, to_time):
+                if matched >= limit:
                     break
                 
+                if type_needles and not any(n in line for n in type_needles):
+                    continue
+                if session_needle and session_needle not in line:
+                    continue
+                
                 try:
                     data = json.loads(line)
                     
@@ -256,22 +720,119 @@ class AuditLogger:
                     if session_id and data.get("session_id") != session_id:
                         continue
                     
-                    if from_time:
-                        event_time = datetime.fromisoformat(data["timestamp"].rstrip("Z"))
-                        if event_time < from_time:
+                    if from_ts or to_ts:
+                        event_ts = _sortable_timestamp(data["timestamp"])
+                        if from_ts and event_ts < from_ts:
                             continue
-                    
-                    if to_time:
-                        event_time = datetime.fromisoformat(data["timestamp"].rstrip("Z"))
-                        if event_time > to_time:
+                        if to_ts and event_ts > to_ts:
                             continue
                     
-                    results.append(AuditEvent(**data))
+                    event = AuditEvent(**data)
                     
                 except (json.JSONDecodeError, KeyError):
                     continue
+                
+                matched += 1
+                yield line, event
+    
+    @staticmethod
+    def _scan_lines(f):
+        """Yield every line of an open binary log via mmap (no text decoding)."""
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            position = 0
+            while position < size:
+                end = mm.find(b"\n", position)
+                if end == -1:
+                    end = size - 1
+                yield mm[position:end + 1]
+                position = end + 1
+    
+    def _candidate_lines(
+        self,
+        f,
+        event_types: Optional[frozenset[str]],
+        from_time: Optional[datetime],
+        to_time: Optional[datetime]
+    ):
+        """
+        Yield log lines that may match the filters.
+        
+        Uses the offset index to skip straight to the selected events;
+        falls back to a full scan when the index can't be used.
+        """
+        if not (event_types or from_time or to_time):
+            yield from self._scan_lines(f)
+            return
+        
+        with self._lock:
+            if self._index_stale:
+                self._flush_pending()
+                self._index.rebuild(self.log_path)
+                self._index_stale = False
+            offsets = self._index.offsets(
+                from_us=_timestamp_to_micros(from_time) if from_time else None,
+                to_us=_timestamp_to_micros(to_time) if to_time else None,
+                event_types=event_types
+            )
+        
+        if offsets is None:
+            yield from self._scan_lines(f)
+            return
+        
+        for offset in offsets:
+            f.seek(offset)
+            yield f.readline()
+    
+    # Byte markers in lines written by log() (sort_keys canonical + trailing checksum)
+    _CHECKSUM_MARKER = b', "checksum": "'
+    _PREVIOUS_MARKER = b', "previous_checksum": "'
+    _ALGO_MARKER = b', "hash_algo": "'
+    _VERIFY_BUFFER_SIZE = 1 << 20
+    
+    @staticmethod
+    def _extract_value(data: bytes, marker: bytes) -> Optional[bytes]:
+        """Get the string value following the last occurrence of marker."""
+        start = data.rfind(marker)
+        if start == -1:
+            return None
+        start += len(marker)
+        end = data.find(b'"', start)
+        if end == -1:
+            return None
+        return data[start:end]
+    
+    def _fast_verify_line(self, line: bytes) -> Optional[tuple[str, str]]:
+        """
+        Verify a canonical line's checksum directly on its bytes.
         
-        return results
+        Returns (previous_checksum, checksum) if the checksum matches, or None
+        if the line isn't in canonical form or doesn't verify — the caller
+        then falls back to a full parse for the detailed diagnosis.
+        """
+        body = line.rstrip(b"\r\n")
+        marker = body.rfind(self._CHECKSUM_MARKER)
+        if marker == -1 or not body.endswith(b'"}'):
+            return None
+        
+        stored = body[marker + len(self._CHECKSUM_MARKER):-2]
+        canonical = body[:marker] + b"}"
+        previous = self._extract_value(canonical, self._PREVIOUS_MARKER)
+        algo = self._extract_value(canonical, self._ALGO_MARKER)
+        if previous is None or algo is None:
+            return None
+        
+        try:
+            computed = _digest(algo.decode(), canonical + previous)
+        except (ValueError, UnicodeDecodeError):
+            return None
+        
+        if computed.encode() != stored:
+            return None
+        return previous.decode(), stored.decode()
     
     def verify_integrity(self) -> tuple[bool, list[str]]:
         """
@@ -287,9 +848,21 @@ class AuditLogger:
         if not self.log_path.exists():
             return True, []
         
-        with open(self.log_path, 'r') as f:
+        self._flush_pending()
+        
+        with open(self.log_path, 'rb', buffering=self._VERIFY_BUFFER_SIZE) as f:
             for line in f:
                 line_number += 1
+                
+                # Fast path: canonical lines verify without a JSON parse
+                fast = self._fast_verify_line(line)
+                if fast is not None:
+                    line_previous, stored_checksum = fast
+                    if line_previous != previous_checksum:
+                        issues.append(f"Line {line_number}: Broken checksum chain")
+                    previous_checksum = stored_checksum
+                    continue
+                
                 try:
                     data = json.loads(line)
                     
@@ -301,9 +874,13 @@ class AuditLogger:
                     stored_checksum = data.get("checksum", "")
                     data_copy = data.copy()
                     del data_copy["checksum"]
-                    computed = self._compute_checksum(data_copy, data.get("previous_checksum", ""))
+                    try:
+                        computed = self._compute_checksum(data_copy, data.get("previous_checksum", ""))
+                    except ValueError as e:
+                        issues.append(f"Line {line_number}: {e}")
+                        computed = None
                     
-                    if computed != stored_checksum:
+                    if computed is not None and computed != stored_checksum:
                         issues.append(f"Line {line_number}: Checksum mismatch")
                     
                     previous_checksum = stored_checksum
@@ -333,34 +910,134 @@ class AuditLogger:
         
         return len(events)
     
-    def get_stats(self) -> dict:
-        """Get statistics about the audit log."""
+    def get_stats(self, verify: bool = False) -> dict:
+        """
+        Get statistics about the audit log.
+        
+        Counters are kept in memory, so this is O(1) after the first call.
+        
+        Args:
+            verify: Also run the (full-scan) integrity check
+        """
         if not self.log_path.exists():
             return {"events": 0, "size_bytes": 0}
         
-        event_counts = {}
-        total_events = 0
+        with self._lock:
+            if self._type_counts is None:
+                self._flush_pending()
+                self._count_events()
+            
+            stats = {
+                "events": self._event_count,
+                "size_bytes": self._log_size,
+                "by_type": dict(self._type_counts)
+            }
         
-        with open(self.log_path, 'r') as f:
-            for line in f:
-                try:
-                    data = json.loads(line)
-                    event_type = data.get("event_type", "unknown")
-                    event_counts[event_type] = event_counts.get(event_type, 0) + 1
-                    total_events += 1
-                except json.JSONDecodeError:
-                    pass
+        if verify:
+            stats["integrity_verified"] = self.verify_integrity()[0]
+        
+        return stats
+    
+    def log_batch(
+        self,
+        events: list[tuple[EventType | str, dict]],
+        session_id: Optional[str] = None
+    ) -> list[AuditEvent]:
+        """Log several (event_type, details) pairs in order."""
+        return [self.log(event_type, details, session_id) for event_type, details in events]
+
+
+class AuditBuffer:
+    """
+    Buffers a component's audit events and delivers them in batches.
+    
+    Flushes once max_events are queued, or interval seconds after the first
+    queued event. Callbacks with a log_batch attribute receive each batch in
+    one call; plain callbacks are called once per event. By default events
+    are never dropped and a full batch is delivered by the caller — call
+    flush() before shutdown.
+    
+    With max_pending set, full batches are delivered on a background thread
+    instead, and past max_pending queued events the oldest are dropped; the
+    next delivery reports the count as an "audit_events_dropped" event.
+    """
+    
+    def __init__(
+        self,
+        callback,
+        max_events: int = 256,
+        interval: float = 0.2,
+        max_pending: Optional[int] = None
+    ):
+        self.callback = callback
+        self.max_events = max_events
+        self.interval = interval
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._unreported_drops = 0
+        self._events: deque[tuple[str, dict]] = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+    
+    def __call__(self, event_type: str, details: dict) -> None:
+        self.append(event_type, details)
+    
+    def append(self, event_type: str, details: dict) -> None:
+        """Queue an event, flushing if the batch is full."""
+        with self._lock:
+            if self.max_pending is not None and len(self._events) >= self.max_pending:
+                self._events.popleft()
+                self.dropped += 1
+                self._unreported_drops += 1
+            self._events.append((event_type, details))
+            full = len(self._events) >= self.max_events
+            
+            if full and self.max_pending is not None:
+                # Deliver off the caller's thread
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(0, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+                return
+            if not full and self._timer is None and self.interval > 0:
+                self._timer = threading.Timer(self.interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
         
-        return {
-            "events": total_events,
-            "size_bytes": self.log_path.stat().st_size,
-            "by_type": event_counts,
-            "integrity_verified": self.verify_integrity()[0]
-        }
+        if full or self.interval <= 0:
+            self.flush()
+    
+    def flush(self) -> int:
+        """Deliver all queued events. Returns the number delivered."""
+        # Serialize deliveries so batches reach the callback in order
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                events = list(self._events)
+                self._events.clear()
+                if self._unreported_drops:
+                    events.append(("audit_events_dropped", {"count": self._unreported_drops}))
+                    self._unreported_drops = 0
+            
+            if not events:
+                return 0
+            
+            log_batch = getattr(self.callback, "log_batch", None)
+            if log_batch:
+                log_batch(events)
+            else:
+                for event_type, details in events:
+                    self.callback(event_type, details)
+            return len(events)
 
 
 def create_audit_callback(logger: AuditLogger, session_id: Optional[str] = None):
     """Create a callback function for use with other components."""
     def callback(event_type: str, details: dict):
         logger.log(event_type, details, session_id)
+    callback.log_batch = lambda events: logger.log_batch(events, session_id)
     return callback
@@ -0,0 +1,206 @@
+"""
+Response Cache — Exact and semantic lookup for expensive LLM results.
+
+Two tiers:
+- Exact: SHA-256 of the key text, O(1) dict lookup
+- Semantic: cosine similarity of embeddings against stored keys
+
+The embedding function is injected so the cache stays model-agnostic.
+Without one, only the exact tier is used.
+"""
+
+import json
+import math
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Any, Callable
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class SemanticCache:
+    """
+    Size-bounded cache with exact-hash fast path and embedding similarity fallback.
+    
+    Features:
+    - Thread-safe
+    - LRU eviction at max_entries
+    - Optional JSON persistence
+    """
+    
+    def __init__(
+        self,
+        embed_fn: Optional[Callable[[str], list[float]]] = None,
+        threshold: float = 0.95,
+        max_entries: int = 1024,
+        path: Optional[Path] = None
+    ):
+        """
+        Initialize cache.
+        
+        Args:
+            embed_fn: Maps key text to an embedding vector (semantic tier disabled if None)
+            threshold: Minimum cosine similarity for a semantic hit
+            max_entries: Maximum cached entries before LRU eviction
+            path: Optional JSON file to persist entries
+        """
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        
+        # hash -> (normalized embedding or None, value)
+        self._entries: OrderedDict[str, tuple[Optional[list[float]], Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        
+        if self.path and self.path.exists():
+            self.load()
+    
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+    
+    @staticmethod
+    def _normalize(vector: list[float]) -> list[float]:
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm == 0:
+            return list(vector)
+        return [x / norm for x in vector]
+    
+    def _embed(self, text: str) -> Optional[list[float]]:
+        """Compute a normalized embedding, or None if unavailable."""
+        if not self.embed_fn:
+            return None
+        try:
+            vector = self.embed_fn(text)
+        except Exception:
+            return None
+        if not vector:
+            return None
+        return self._normalize(vector)
+    
+    def _nearest(self, embedding: list[float]) -> tuple[Optional[str], float]:
+        """Find the stored entry most similar to embedding."""
+        candidates = [
+            (key, emb) for key, (emb, _) in self._entries.items()
+            if emb is not None and len(emb) == len(embedding)
+        ]
+        if not candidates:
+            return None, 0.0
+        
+        if NUMPY_AVAILABLE:
+            matrix = np.asarray([emb for _, emb in candidates])
+            sims = matrix @ np.asarray(embedding)
+            best = int(sims.argmax())
+            return candidates[best][0], float(sims[best])
+        
+        best_key, best_sim = None, -1.0
+        for key, emb in candidates:
+            sim = sum(a * b for a, b in zip(emb, embedding))
+            if sim > best_sim:
+                best_key, best_sim = key, sim
+        return best_key, best_sim
+    
+    def get(self, text: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+        
+        Args:
+            text: The key text (e.g. system prompt + user prompt)
+        
+        Returns:
+            Cached value, or None on miss
+        """
+        key = self._hash(text)
+        
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key][1]
+            has_semantic = any(emb is not None for emb, _ in self._entries.values())
+        
+        if not self.embed_fn or not has_semantic:
+            with self._lock:
+                self._misses += 1
+            return None
+        
+        # Embedding is computed outside the lock — it may be a network call
+        embedding = self._embed(text)
+        
+        with self._lock:
+            if embedding is not None:
+                match, similarity = self._nearest(embedding)
+                if match is not None and similarity >= self.threshold:
+                    self._entries.move_to_end(match)
+                    self._hits += 1
+                    return self._entries[match][1]
+            self._misses += 1
+            return None
+    
+    def put(self, text: str, value: Any) -> None:
+        """Store a value under the given key text."""
+        key = self._hash(text)
+        embedding = self._embed(text)
+        
+        with self._lock:
+            self._entries[key] = (embedding, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def save(self) -> bool:
+        """Persist entries to the configured path."""
+        if not self.path:
+            return False
+        
+        with self._lock:
+            data = {
+                "threshold": self.threshold,
+                "entries": [
+                    {"key": key, "embedding": emb, "value": value}
+                    for key, (emb, value) in self._entries.items()
+                ]
+            }
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump(data, f)
+        return True
+    
+    def load(self) -> bool:
+        """Load persisted entries from the configured path."""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            
+            with self._lock:
+                self._entries.clear()
+                for entry in data.get("entries", [])[-self.max_entries:]:
+                    self._entries[entry["key"]] = (entry.get("embedding"), entry["value"])
+            return True
+        except (json.JSONDecodeError, FileNotFoundError, KeyError, TypeError):
+            return False
+    
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "semantic": self.embed_fn is not None
+            }
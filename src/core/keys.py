@@ -10,16 +10,66 @@ All key operations are logged for audit.
 """
 
 import json
+import hmac
+import logging
 import hashlib
 import secrets
+import itertools
 import time
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, Callable
+from typing import Optional, Callable, Any
 from datetime import datetime, timedelta
 
+from core.audit import AuditBuffer
 
-@dataclass
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import bcrypt
+    BCRYPT_AVAILABLE = True
+except ImportError:
+    BCRYPT_AVAILABLE = False
+
+# Key hashing goes through hashlib's OpenSSL backend, which uses the CPU's
+# SHA extensions (SHA-NI / ARMv8 crypto) where present. Deployments on the
+# builtin fallback are much slower; check this flag when diagnosing.
+OPENSSL_SHA256 = hashlib.sha256.__name__.startswith("openssl")
+
+# Work factor for bcrypt-stored keys (~250ms per hash on commodity CPUs)
+BCRYPT_ROUNDS = 12
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+logger = logging.getLogger("expert-in-a-box.keys")
+
+
+def _is_valid_hash(value: Any) -> bool:
+    """Check for a SHA-256 hex digest (64 lowercase hex chars) or a bcrypt hash."""
+    if not isinstance(value, str):
+        return False
+    if value.startswith(_BCRYPT_PREFIXES):
+        return len(value) == 60
+    return len(value) == 64 and _HEX_DIGITS.issuperset(value)
+
+
+@lru_cache(maxsize=256)
+def _hash_cached(plaintext: str) -> str:
+    """
+    SHA-256 of a presented key, memoized for repeat validations.
+    
+    Note: recently presented plaintext keys are held in this cache; it is kept
+    small and can be purged with KeyRegistry.clear_hash_cache().
+    """
+    return hashlib.sha256(plaintext.encode()).digest().hex()
+
+
+@dataclass(slots=True)
 class KeyEntry:
     """A registered key with its scopes."""
     id: str
@@ -28,25 +78,33 @@ class KeyEntry:
     description: str = ""
     created_at: Optional[str] = None
     expires_at: Optional[str] = None
+    _expires_dt: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _scope_set: frozenset[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _is_master: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._scope_set = frozenset(self.scopes)
+        self._is_master = "*" in self._scope_set
+        
+        # Parse expiry once; an unparseable value never expires (as before)
+        if self.expires_at:
+            try:
+                self._expires_dt = datetime.fromisoformat(self.expires_at)
+            except ValueError:
+                self._expires_dt = None
     
     def has_scope(self, scope: str) -> bool:
         """Check if this key grants the given scope."""
-        if "*" in self.scopes:
-            return True
-        return scope in self.scopes
+        return self._is_master or scope in self._scope_set
     
-    def is_expired(self) -> bool:
-        """Check if key has expired."""
-        if not self.expires_at:
-            return False
-        try:
-            expires = datetime.fromisoformat(self.expires_at)
-            return datetime.now() > expires
-        except ValueError:
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        """Check if key has expired (optionally against a shared `now`)."""
+        if self._expires_dt is None:
             return False
+        return (now or datetime.now()) > self._expires_dt
 
 
-@dataclass
+@dataclass(slots=True)
 class OverrideSession:
     """An active override session (time-boxed)."""
     key_id: str
@@ -55,11 +113,11 @@ class OverrideSession:
     expires_at: datetime
     action: dict = field(default_factory=dict)
     
-    def is_active(self) -> bool:
-        return datetime.now() < self.expires_at
+    def is_active(self, now: Optional[datetime] = None) -> bool:
+        return (now or datetime.now()) < self.expires_at
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyValidation:
     """Result of key validation."""
     valid: bool
@@ -84,15 +142,46 @@ class KeyRegistry:
     
     def __init__(self, config_path: Optional[Path] = None):
         self._keys: dict[str, KeyEntry] = {}
+        self._by_hash: dict[str, KeyEntry] = {}
+        self._bcrypt_entries: list[KeyEntry] = []
+        # SHA-256 of a verified plaintext -> bcrypt entry it matched
+        self._bcrypt_verified: dict[str, KeyEntry] = {}
         self._active_sessions: dict[str, OverrideSession] = {}
         self._audit_callback: Optional[Callable] = None
+        self._audit_buffer: Optional[AuditBuffer] = None
+        # Entries skipped before an audit callback was set (e.g. the
+        # constructor's load), reported once one is
+        self._unaudited_malformed: list[str] = []
+        
+        # Session IDs are in-process table keys, not credentials (the key is),
+        # so a random per-process prefix plus a counter is enough. Switch back
+        # to secrets.token_urlsafe() if IDs are ever handed to untrusted callers.
+        self._session_nonce = secrets.token_hex(8)
+        self._session_counter = itertools.count()
         
         if config_path:
             self.load(config_path)
     
-    def set_audit_callback(self, callback: Callable) -> None:
-        """Set callback for audit logging."""
-        self._audit_callback = callback
+    def set_audit_callback(self, callback: Callable, batch: bool = False) -> None:
+        """
+        Set callback for audit logging.
+        
+        Args:
+            callback: Called with (event_type, details)
+            batch: Buffer events and deliver them in batches (see AuditBuffer)
+        """
+        self.flush_audit()
+        self._audit_buffer = AuditBuffer(callback) if batch else None
+        self._audit_callback = self._audit_buffer or callback
+        
+        for key_id in self._unaudited_malformed:
+            self._audit("malformed_hash_entry", {"key_id": key_id})
+        self._unaudited_malformed = []
+    
+    def flush_audit(self) -> None:
+        """Deliver any buffered audit events (call on shutdown)."""
+        if self._audit_buffer:
+            self._audit_buffer.flush()
     
     def _audit(self, event_type: str, details: dict) -> None:
         """Log an audit event."""
@@ -102,21 +191,8 @@ class KeyRegistry:
     def load(self, config_path: Path) -> bool:
         """Load keys from JSON file."""
         try:
-            with open(config_path, 'r') as f:
-                data = json.load(f)
-            
-            self._keys = {}
-            for key_data in data.get("keys", []):
-                entry = KeyEntry(
-                    id=key_data["id"],
-                    hash=key_data["hash"],
-                    scopes=key_data.get("scopes", []),
-                    description=key_data.get("description", ""),
-                    created_at=key_data.get("created_at"),
-                    expires_at=key_data.get("expires_at")
-                )
-                self._keys[entry.id] = entry
-            
+            data = _json_loads(Path(config_path).read_bytes())
+            self._load_entries(data.get("keys", []))
             return True
         except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
             return False
@@ -124,8 +200,32 @@ class KeyRegistry:
     def load_dict(self, data: dict) -> bool:
         """Load keys from dictionary."""
         try:
-            self._keys = {}
-            for key_data in data.get("keys", []):
+            self._load_entries(data.get("keys", []))
+            return True
+        except KeyError:
+            return False
+    
+    def _load_entries(self, keys_data: list[dict]) -> None:
+        """
+        Replace registered keys, skipping entries with a malformed hash.
+        
+        Every stored hash is then either a 64-char SHA-256 hex digest or a
+        bcrypt hash, so compare_digest in validate() always sees equal lengths.
+        
+        If an entry lacks "id" or "hash", the KeyError propagates and the
+        registry is left empty (old keys included), never half-indexed.
+        """
+        keys: dict[str, KeyEntry] = {}
+        try:
+            for key_data in keys_data:
+                if not _is_valid_hash(key_data["hash"]):
+                    logger.warning("Skipping key %r: malformed hash", key_data["id"])
+                    if self._audit_callback:
+                        self._audit("malformed_hash_entry", {"key_id": key_data["id"]})
+                    else:
+                        self._unaudited_malformed.append(key_data["id"])
+                    continue
+                
                 entry = KeyEntry(
                     id=key_data["id"],
                     hash=key_data["hash"],
@@ -134,26 +234,66 @@ class KeyRegistry:
                     created_at=key_data.get("created_at"),
                     expires_at=key_data.get("expires_at")
                 )
-                self._keys[entry.id] = entry
-            return True
+                keys[entry.id] = entry
         except KeyError:
-            return False
+            keys = {}
+            raise
+        finally:
+            # The index always matches _keys, even when loading failed
+            self._keys = keys
+            self._rebuild_hash_index()
+    
+    def _rebuild_hash_index(self) -> None:
+        """Rebuild the hash -> entry index after any change to self._keys."""
+        self._by_hash = {}
+        self._bcrypt_entries = []
+        self._bcrypt_verified = {}
+        for entry in self._keys.values():
+            if entry.hash.startswith(_BCRYPT_PREFIXES):
+                self._bcrypt_entries.append(entry)
+            else:
+                self._by_hash[entry.hash] = entry
     
     @staticmethod
     def hash_key(plaintext: str) -> str:
         """
         Hash a plaintext key for storage.
         
-        In production, use bcrypt. For prototype, SHA-256 is acceptable.
+        Unsalted SHA-256: deterministic and fast. Prefer hash_key_secure()
+        for keys written to disk.
+        """
+        return hashlib.sha256(plaintext.encode()).digest().hex()
+    
+    @staticmethod
+    def hash_key_secure(plaintext: str) -> str:
+        """
+        Hash a plaintext key for storage on disk.
+        
+        Uses salted bcrypt when installed so a leaked keys file resists
+        offline cracking; falls back to hash_key() otherwise. Both forms
+        are accepted by validate().
         """
-        # For prototype — in production use bcrypt
-        return hashlib.sha256(plaintext.encode()).hexdigest()
+        if BCRYPT_AVAILABLE:
+            return bcrypt.hashpw(
+                plaintext.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+            ).decode()
+        return KeyRegistry.hash_key(plaintext)
+    
+    @staticmethod
+    def hash_key_bytes(plaintext: bytes) -> str:
+        """Hash a key the caller already holds as bytes (skips the encode)."""
+        return hashlib.sha256(plaintext).digest().hex()
+    
+    @staticmethod
+    def clear_hash_cache() -> None:
+        """Drop memoized key hashes (e.g. on logout or key rotation)."""
+        _hash_cached.cache_clear()
     
     @staticmethod
     def generate_key() -> tuple[str, str]:
         """Generate a new key and its hash. Returns (plaintext, hash)."""
         plaintext = secrets.token_urlsafe(32)
-        hashed = KeyRegistry.hash_key(plaintext)
+        hashed = KeyRegistry.hash_key_secure(plaintext)
         return plaintext, hashed
     
     def validate(self, plaintext_key: str, required_scope: str) -> KeyValidation:
@@ -167,59 +307,87 @@ class KeyRegistry:
         Returns:
             KeyValidation with result
         """
-        key_hash = self.hash_key(plaintext_key)
+        key_hash = _hash_cached(plaintext_key)
+        
+        # Find matching key (dict lookup, then one constant-time confirm)
+        entry = self._by_hash.get(key_hash)
+        if entry is not None and not hmac.compare_digest(entry.hash, key_hash):
+            entry = None
+        if entry is None and self._bcrypt_entries:
+            entry = self._match_bcrypt(plaintext_key, key_hash)
         
-        # Find matching key
-        for key_id, entry in self._keys.items():
-            if entry.hash == key_hash:
-                # Found matching key
-                if entry.is_expired():
-                    self._audit("key_validation_failed", {
+        if entry is not None:
+            key_id = entry.id
+            # Found matching key
+            if entry.is_expired():
+                if self._audit_callback:
+                    self._audit_callback("key_validation_failed", {
                         "key_id": key_id,
                         "reason": "expired",
                         "required_scope": required_scope
                     })
-                    return KeyValidation(
-                        valid=False,
-                        key_id=key_id,
-                        error="Key has expired"
-                    )
-                
-                if not entry.has_scope(required_scope):
-                    self._audit("key_validation_failed", {
+                return KeyValidation(
+                    valid=False,
+                    key_id=key_id,
+                    error="Key has expired"
+                )
+            
+            if not entry.has_scope(required_scope):
+                if self._audit_callback:
+                    self._audit_callback("key_validation_failed", {
                         "key_id": key_id,
                         "reason": "insufficient_scope",
                         "required_scope": required_scope,
                         "available_scopes": entry.scopes
                     })
-                    return KeyValidation(
-                        valid=False,
-                        key_id=key_id,
-                        scopes=entry.scopes,
-                        error=f"Key does not have scope: {required_scope}"
-                    )
-                
-                # Success
-                self._audit("key_validation_success", {
-                    "key_id": key_id,
-                    "scope": required_scope
-                })
                 return KeyValidation(
-                    valid=True,
+                    valid=False,
                     key_id=key_id,
-                    scopes=entry.scopes
+                    scopes=entry.scopes,
+                    error=f"Key does not have scope: {required_scope}"
                 )
+            
+            # Success
+            if self._audit_callback:
+                self._audit_callback("key_validation_success", {
+                    "key_id": key_id,
+                    "scope": required_scope
+                })
+            return KeyValidation(
+                valid=True,
+                key_id=key_id,
+                scopes=entry.scopes
+            )
         
         # No matching key found
-        self._audit("key_validation_failed", {
-            "reason": "no_match",
-            "required_scope": required_scope
-        })
+        if self._audit_callback:
+            self._audit_callback("key_validation_failed", {
+                "reason": "no_match",
+                "required_scope": required_scope
+            })
         return KeyValidation(
             valid=False,
             error="Invalid key"
         )
     
+    def _match_bcrypt(self, plaintext_key: str, key_hash: str) -> Optional[KeyEntry]:
+        """
+        Find the bcrypt-stored entry for a key.
+        
+        checkpw is deliberately slow, so successful matches are remembered
+        by the key's SHA-256 and repeat validations skip it.
+        """
+        entry = self._bcrypt_verified.get(key_hash)
+        if entry is not None or not BCRYPT_AVAILABLE:
+            return entry
+        
+        encoded = plaintext_key.encode()
+        for candidate in self._bcrypt_entries:
+            if bcrypt.checkpw(encoded, candidate.hash.encode()):
+                self._bcrypt_verified[key_hash] = candidate
+                return candidate
+        return None
+    
     def create_override_session(
         self,
         plaintext_key: str,
@@ -256,7 +424,7 @@ class KeyRegistry:
         )
         
         # Store session
-        session_id = secrets.token_urlsafe(16)
+        session_id = f"{self._session_nonce}-{next(self._session_counter):x}"
         self._active_sessions[session_id] = session
         
         self._audit("override_session_created", {
@@ -300,27 +468,29 @@ class KeyRegistry:
     
     def cleanup_expired_sessions(self) -> int:
         """Remove expired sessions. Returns count of removed sessions."""
-        expired = [
-            sid for sid, session in self._active_sessions.items()
-            if not session.is_active()
-        ]
-        
-        for sid in expired:
-            del self._active_sessions[sid]
+        now = datetime.now()
+        before = len(self._active_sessions)
+        self._active_sessions = {
+            sid: session for sid, session in self._active_sessions.items()
+            if now < session.expires_at
+        }
+        removed = before - len(self._active_sessions)
         
-        if expired:
-            self._audit("sessions_cleanup", {"count": len(expired)})
+        if removed:
+            self._audit("sessions_cleanup", {"count": removed})
         
-        return len(expired)
+        self.flush_audit()
+        return removed
     
     def list_keys(self) -> list[dict]:
         """List all registered keys (without hashes)."""
+        now = datetime.now()
         return [
             {
                 "id": entry.id,
                 "scopes": entry.scopes,
                 "description": entry.description,
-                "expired": entry.is_expired()
+                "expired": entry.is_expired(now)
             }
             for entry in self._keys.values()
         ]
@@ -331,7 +501,7 @@ class KeyRegistry:
             "keys": [
                 {
                     "id": "example-master",
-                    "hash": "<generate with KeyRegistry.hash_key('your-secret')>",
+                    "hash": "<generate with KeyRegistry.hash_key_secure('your-secret')>",
                     "scopes": ["*"],
                     "description": "Master override key"
                 },
@@ -10,13 +10,114 @@ Packs contain:
 Packs are discovered from the packs/ directory and loaded based on policy.
 """
 
+import os
 import json
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional, Any
 
+from core.audit import AuditBuffer
 
-@dataclass
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+
+
+_FORMATTER = string.Formatter()
+
+# Pre-parsed prompt template: (literal text, field name or None) pairs
+TemplateSegments = tuple[tuple[str, Optional[str]], ...]
+
+
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> Optional[TemplateSegments]:
+    """
+    Pre-parse a str.format template into literal/field segments.
+    
+    Memoized by template text, so packs sharing a prompt (the defaults, or
+    copies of them) share one parsed tuple. Returns None for templates
+    using conversions, format specs or compound field names (or malformed
+    ones); those are rendered with str.format.
+    """
+    try:
+        parsed = list(_FORMATTER.parse(template))
+    except ValueError:
+        return None
+    
+    segments = []
+    for literal, field_name, format_spec, conversion in parsed:
+        if field_name is not None and (
+            format_spec or conversion or not field_name.isidentifier()
+        ):
+            return None
+        segments.append((literal, field_name))
+    return tuple(segments)
+
+
+# Knowledge files picked up from packs/<id>/knowledge/
+KNOWLEDGE_SUFFIXES = ('.md', '.txt', '.json')
+
+# Characters of each document included in the knowledge context
+KNOWLEDGE_DOC_CHARS = 2000
+
+# Upper bound on threads used to read knowledge files concurrently
+KNOWLEDGE_READ_WORKERS = 8
+
+
+def _read_many(fn, paths: list[Path]) -> list:
+    """Apply fn to each path, overlapping the file reads on a thread pool."""
+    if len(paths) <= 2:
+        return [fn(path) for path in paths]
+    # File reads release the GIL, so the threads genuinely overlap IO waits
+    with ThreadPoolExecutor(max_workers=min(KNOWLEDGE_READ_WORKERS, len(paths))) as pool:
+        return list(pool.map(fn, paths))
+
+
+def _read_knowledge_doc(doc_path: Path, max_chars: Optional[int] = None) -> Optional[dict]:
+    """
+    Read a single knowledge document.
+    
+    Args:
+        doc_path: Path to a .md, .txt or .json document
+        max_chars: Read at most this many characters of text documents
+        
+    Returns:
+        Document dict, or None if it could not be read
+    """
+    try:
+        if doc_path.suffix == '.json':
+            # JSON docs have structure
+            return _json_loads(doc_path.read_bytes())
+        with open(doc_path, 'r') as f:
+            content = f.read(max_chars) if max_chars else f.read()
+    except Exception:
+        return None
+    
+    # Text/markdown docs
+    return {
+        "title": doc_path.stem.replace('_', ' ').title(),
+        "content": content,
+        "source": doc_path.name
+    }
+
+
+def _render_template(template: str, segments: Optional[TemplateSegments], values: dict) -> str:
+    """Render a template from its pre-parsed segments (same output as str.format)."""
+    if segments is None:
+        return template.format(**values)
+    return "".join(
+        literal if name is None else literal + str(values[name])
+        for literal, name in segments
+    )
+
+
+@dataclass(slots=True)
 class PackManifest:
     """Pack metadata and configuration."""
     id: str
@@ -57,7 +158,7 @@ class PackManifest:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Pack:
     """A loaded capability pack."""
     manifest: PackManifest
@@ -65,33 +166,72 @@ class Pack:
     system_prompt: str = ""
     worker_prompt: str = ""
     auditor_prompt: str = ""
-    knowledge_docs: list[dict] = field(default_factory=list)
+    knowledge_index: list[Path] = field(default_factory=list)
+    # doc path -> rendered "### title\ncontent" section (None if unreadable)
+    _doc_cache: dict[Path, Optional[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # max_docs -> joined knowledge context
+    _context_cache: dict[int, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _worker_segments: Optional[TemplateSegments] = field(default=None, init=False, repr=False, compare=False)
+    _auditor_segments: Optional[TemplateSegments] = field(default=None, init=False, repr=False, compare=False)
+    # (role, mode, reading_level) -> rendered prompt
+    _prompt_cache: dict[tuple[str, str, str], str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.invalidate_prompts()
+    
+    def invalidate_prompts(self) -> None:
+        """Re-parse prompt templates and drop rendered prompts (call after editing them)."""
+        self._worker_segments = _compile_template(self.worker_prompt)
+        self._auditor_segments = _compile_template(self.auditor_prompt)
+        self._prompt_cache.clear()
+    
+    def _template_values(self, mode: str, reading_level: str) -> dict:
+        return {
+            "module": self.name,
+            "mode": mode,
+            "reading_level": reading_level,
+            "safety_profile": self.manifest.safety_profile
+        }
     
     @property
     def id(self) -> str:
         return self.manifest.id
     
+    @property
+    def knowledge_docs(self) -> list[dict]:
+        """All knowledge documents, read in full (not cached)."""
+        docs = _read_many(_read_knowledge_doc, self.knowledge_index)
+        return [doc for doc in docs if doc is not None]
+    
     @property
     def name(self) -> str:
         return self.manifest.name
     
     def get_worker_system(self, mode: str, reading_level: str) -> str:
         """Get Worker system prompt, customized for context."""
-        return self.worker_prompt.format(
-            module=self.name,
-            mode=mode,
-            reading_level=reading_level,
-            safety_profile=self.manifest.safety_profile
-        )
+        key = ("worker", mode, reading_level)
+        prompt = self._prompt_cache.get(key)
+        if prompt is None:
+            prompt = _render_template(
+                self.worker_prompt,
+                self._worker_segments,
+                self._template_values(mode, reading_level)
+            )
+            self._prompt_cache[key] = prompt
+        return prompt
     
     def get_auditor_system(self, mode: str, reading_level: str) -> str:
         """Get Auditor system prompt, customized for context."""
-        return self.auditor_prompt.format(
-            module=self.name,
-            mode=mode,
-            reading_level=reading_level,
-            safety_profile=self.manifest.safety_profile
-        )
+        key = ("auditor", mode, reading_level)
+        prompt = self._prompt_cache.get(key)
+        if prompt is None:
+            prompt = _render_template(
+                self.auditor_prompt,
+                self._auditor_segments,
+                self._template_values(mode, reading_level)
+            )
+            self._prompt_cache[key] = prompt
+        return prompt
     
     def get_knowledge_context(self, query: str, max_docs: int = 5) -> str:
         """
@@ -99,24 +239,55 @@ class Pack:
         
         TODO: Implement actual RAG/vector search.
         For now, returns all docs (truncated).
-        """
-        if not self.knowledge_docs:
-            return "No specific knowledge loaded for this module."
         
+        The result doesn't depend on the query yet, so it is cached per
+        max_docs; a reload builds a new Pack with empty caches. Real
+        retrieval must add the query to the _context_cache key.
+        """
         # Simple implementation: return first N docs
         # Future: vector similarity search
-        context_parts = []
-        for doc in self.knowledge_docs[:max_docs]:
-            context_parts.append(f"### {doc.get('title', 'Document')}\n{doc.get('content', '')[:2000]}")
+        context = self._context_cache.get(max_docs)
+        if context is not None:
+            return context
         
-        return "\n\n".join(context_parts)
+        # Read the documents likely to be needed concurrently
+        missing = [p for p in self.knowledge_index[:max_docs] if p not in self._doc_cache]
+        for doc_path, section in zip(missing, _read_many(self._render_doc, missing)):
+            self._doc_cache[doc_path] = section
+        
+        sections = []
+        for doc_path in self.knowledge_index:
+            if len(sections) >= max_docs:
+                break
+            
+            if doc_path not in self._doc_cache:
+                self._doc_cache[doc_path] = self._render_doc(doc_path)
+            section = self._doc_cache[doc_path]
+            if section is not None:
+                sections.append(section)
+        
+        if sections:
+            context = "\n\n".join(sections)
+        else:
+            context = "No specific knowledge loaded for this module."
+        
+        self._context_cache[max_docs] = context
+        return context
+    
+    @staticmethod
+    def _render_doc(doc_path: Path) -> Optional[str]:
+        """Read a document (only as much as is shown) and render its context section."""
+        doc = _read_knowledge_doc(doc_path, KNOWLEDGE_DOC_CHARS)
+        if doc is None:
+            return None
+        return f"### {doc.get('title', 'Document')}\n{doc.get('content', '')[:KNOWLEDGE_DOC_CHARS]}"
     
     def to_dict(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
             "manifest": self.manifest.to_dict(),
-            "knowledge_doc_count": len(self.knowledge_docs)
+            "knowledge_doc_count": len(self.knowledge_index)
         }
 
 
@@ -164,12 +335,40 @@ Output JSON with: verdict, flags, reasoning, suggested_revision, risk_level
         self.packs_dir = Path(packs_dir)
         self.policy = policy
         self._packs: dict[str, Pack] = {}
+        # mode -> loaded packs supporting it, in load order
+        self._by_mode: dict[str, list[Pack]] = {}
         self._available: dict[str, PackManifest] = {}
+        # manifest path -> (st_mtime_ns, st_size, parsed manifest)
+        self._manifest_cache: dict[str, tuple[int, int, PackManifest]] = {}
         self._audit_callback = None
+        self._audit_buffer: Optional[AuditBuffer] = None
+        self._version = 0
+        self._discovered = False
+        # Serializes discovery, load and unload (queries load packs lazily,
+        # possibly from several request threads at once)
+        self._lock = threading.Lock()
     
-    def set_audit_callback(self, callback) -> None:
-        """Set callback for audit logging."""
-        self._audit_callback = callback
+    @property
+    def version(self) -> int:
+        """Incremented whenever a pack is loaded or unloaded, or discovery changes the available set."""
+        return self._version
+    
+    def set_audit_callback(self, callback, batch: bool = False) -> None:
+        """
+        Set callback for audit logging.
+        
+        Args:
+            callback: Called with (event_type, details)
+            batch: Buffer events and deliver them in batches (see AuditBuffer)
+        """
+        self.flush_audit()
+        self._audit_buffer = AuditBuffer(callback) if batch else None
+        self._audit_callback = self._audit_buffer or callback
+    
+    def flush_audit(self) -> None:
+        """Deliver any buffered audit events (call on shutdown)."""
+        if self._audit_buffer:
+            self._audit_buffer.flush()
     
     def _audit(self, event_type: str, details: dict) -> None:
         """Log an audit event."""
@@ -182,31 +381,61 @@ Output JSON with: verdict, flags, reasoning, suggested_revision, risk_level
         
         Returns dict of pack_id -> manifest
         """
+        previous = self._available.keys()
         self._available = {}
         
         if not self.packs_dir.exists():
+            self._discovered = True
+            if previous:
+                self._version += 1
             return self._available
         
-        for pack_path in self.packs_dir.iterdir():
-            if not pack_path.is_dir():
-                continue
-            
-            manifest_path = pack_path / "manifest.json"
-            if not manifest_path.exists():
-                continue
-            
-            try:
-                with open(manifest_path, 'r') as f:
-                    data = json.load(f)
-                manifest = PackManifest.from_dict(data)
-                self._available[manifest.id] = manifest
-            except (json.JSONDecodeError, KeyError) as e:
-                # Log but continue
-                self._audit("pack_discovery_error", {
-                    "path": str(pack_path),
-                    "error": str(e)
-                })
+        with os.scandir(self.packs_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                
+                manifest_path = os.path.join(entry.path, "manifest.json")
+                try:
+                    st = os.stat(manifest_path)
+                except OSError:
+                    continue
+                
+                # Reuse the parsed manifest if the file is unchanged
+                cached = self._manifest_cache.get(manifest_path)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    self._available[cached[2].id] = cached[2]
+                    continue
+                
+                try:
+                    with open(manifest_path, 'rb') as f:
+                        data = _json_loads(f.read())
+                    manifest = PackManifest.from_dict(data)
+                    self._manifest_cache[manifest_path] = (st.st_mtime_ns, st.st_size, manifest)
+                    self._available[manifest.id] = manifest
+                except (json.JSONDecodeError, KeyError) as e:
+                    # Log but continue
+                    self._audit("pack_discovery_error", {
+                        "path": entry.path,
+                        "error": str(e)
+                    })
         
+        self._discovered = True
+        if self._available.keys() != previous:
+            self._version += 1
+        return self._available
+    
+    def ensure_discovered(self) -> dict[str, PackManifest]:
+        """
+        Run discover() on first use only; later calls reuse its result.
+        
+        load() still rescans when asked for an unknown pack, so packs added
+        after the first scan are picked up.
+        """
+        if not self._discovered:
+            with self._lock:
+                if not self._discovered:
+                    self.discover()
         return self._available
     
     def load(self, pack_id: str) -> Optional[Pack]:
@@ -220,9 +449,19 @@ Output JSON with: verdict, flags, reasoning, suggested_revision, risk_level
             Loaded Pack or None if not found/loadable
         """
         # Check if already loaded
-        if pack_id in self._packs:
-            return self._packs[pack_id]
+        pack = self._packs.get(pack_id)
+        if pack is not None:
+            return pack
         
+        with self._lock:
+            # Another thread may have loaded it while we waited
+            pack = self._packs.get(pack_id)
+            if pack is not None:
+                return pack
+            return self._load_locked(pack_id)
+    
+    def _load_locked(self, pack_id: str) -> Optional[Pack]:
+        """Build and register a pack (caller holds self._lock)."""
         # Check if available
         if pack_id not in self._available:
             self.discover()
@@ -238,8 +477,8 @@ Output JSON with: verdict, flags, reasoning, suggested_revision, risk_level
         worker_prompt = self._load_file(pack_path / "worker_prompt.md", self.DEFAULT_WORKER_PROMPT)
         auditor_prompt = self._load_file(pack_path / "auditor_prompt.md", self.DEFAULT_AUDITOR_PROMPT)
         
-        # Load knowledge documents
-        knowledge_docs = self._load_knowledge(pack_path / "knowledge")
+        # Index knowledge documents (contents are read on demand)
+        knowledge_index = self._load_knowledge(pack_path / "knowledge")
         
         pack = Pack(
             manifest=manifest,
@@ -247,16 +486,19 @@ Output JSON with: verdict, flags, reasoning, suggested_revision, risk_level
             system_prompt=system_prompt,
             worker_prompt=worker_prompt,
             auditor_prompt=auditor_prompt,
-            knowledge_docs=knowledge_docs
+            knowledge_index=knowledge_index
         )
         
         self._packs[pack_id] = pack
+        for mode in dict.fromkeys(manifest.modes):
+            self._by_mode.setdefault(mode, []).append(pack)
+        self._version += 1
         
         self._audit("pack_loaded", {
             "pack_id": pack_id,
             "name": manifest.name,
             "version": manifest.version,
-            "knowledge_docs": len(knowledge_docs)
+            "knowledge_docs": len(knowledge_index)
         })
         
         return pack
@@ -269,44 +511,28 @@ Output JSON with: verdict, flags, reasoning, suggested_revision, risk_level
         except FileNotFoundError:
             return default
     
-    def _load_knowledge(self, knowledge_dir: Path) -> list[dict]:
-        """Load knowledge documents from a directory."""
-        docs = []
-        
+    def _load_knowledge(self, knowledge_dir: Path) -> list[Path]:
+        """List knowledge documents in a directory without reading them."""
         if not knowledge_dir.exists():
-            return docs
+            return []
         
-        for doc_path in knowledge_dir.iterdir():
-            if doc_path.suffix not in ['.md', '.txt', '.json']:
-                continue
-            
-            try:
-                with open(doc_path, 'r') as f:
-                    content = f.read()
-                
-                if doc_path.suffix == '.json':
-                    # JSON docs have structure
-                    doc_data = json.loads(content)
-                    docs.append(doc_data)
-                else:
-                    # Text/markdown docs
-                    docs.append({
-                        "title": doc_path.stem.replace('_', ' ').title(),
-                        "content": content,
-                        "source": doc_path.name
-                    })
-            except Exception:
-                continue
-        
-        return docs
+        return [
+            doc_path for doc_path in knowledge_dir.iterdir()
+            if doc_path.suffix in KNOWLEDGE_SUFFIXES
+        ]
     
     def unload(self, pack_id: str) -> bool:
         """Unload a pack from memory."""
-        if pack_id in self._packs:
-            del self._packs[pack_id]
-            self._audit("pack_unloaded", {"pack_id": pack_id})
-            return True
-        return False
+        with self._lock:
+            pack = self._packs.pop(pack_id, None)
+            if pack is None:
+                return False
+            for mode in dict.fromkeys(pack.manifest.modes):
+                if mode in self._by_mode:
+                    self._by_mode[mode] = [p for p in self._by_mode[mode] if p is not pack]
+            self._version += 1
+        self._audit("pack_unloaded", {"pack_id": pack_id})
+        return True
     
     def get_loaded(self) -> dict[str, Pack]:
         """Get all loaded packs."""
@@ -314,9 +540,7 @@ Output JSON with: verdict, flags, reasoning, suggested_revision, risk_level
     
     def get_available(self) -> dict[str, PackManifest]:
         """Get all available packs (discovered but not necessarily loaded)."""
-        if not self._available:
-            self.discover()
-        return self._available.copy()
+        return self.ensure_discovered().copy()
     
     def get_pack(self, pack_id: str) -> Optional[Pack]:
         """Get a loaded pack by ID."""
@@ -324,10 +548,7 @@ Output JSON with: verdict, flags, reasoning, suggested_revision, risk_level
     
     def get_pack_for_mode(self, mode: str) -> list[Pack]:
         """Get all loaded packs that support a given mode."""
-        return [
-            pack for pack in self._packs.values()
-            if mode in pack.manifest.modes
-        ]
+        return list(self._by_mode.get(mode, ()))
     
     def create_pack_template(self, pack_id: str, name: str, description: str) -> Path:
         """
@@ -372,8 +593,7 @@ Output JSON with: verdict, flags, reasoning, suggested_revision, risk_level
     
     def export_pack_list(self) -> list[dict]:
         """Export list of all packs with status."""
-        if not self._available:
-            self.discover()
+        self.ensure_discovered()
         
         result = []
         for pack_id, manifest in self._available.items():
@@ -387,3 +607,9 @@ Output JSON with: verdict, flags, reasoning, suggested_revision, risk_level
             })
         
         return result
+
+
+# Warm _compile_template's cache with the default prompts at import, so
+# packs without custom prompts never parse them on first load
+_compile_template(PackLoader.DEFAULT_WORKER_PROMPT)
+_compile_template(PackLoader.DEFAULT_AUDITOR_PROMPT)
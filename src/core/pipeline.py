@@ -12,12 +12,41 @@ The models can be:
 - Same model, different temperatures
 """
 
+import re
 import json
-from dataclasses import dataclass, field
-from typing import Optional, Protocol, Any
+import math
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import Optional, Protocol, Any, Callable
 from enum import Enum
 from datetime import datetime
 
+from core.cache import SemanticCache
+from core.audit import AuditBuffer
+from adapters.llm_adapter import JSONParseError, extract_json_field
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import re2 as _pattern_engine  # Linear-time automaton matching
+    RE2_AVAILABLE = True
+except ImportError:
+    _pattern_engine = re
+    RE2_AVAILABLE = False
+
 
 class Verdict(Enum):
     """Auditor verdicts."""
@@ -38,14 +67,66 @@ class Flag(Enum):
     HARMFUL = "harmful"              # Potentially harmful advice
 
 
-@dataclass
+def _compile_union(patterns: tuple[str, ...]) -> Any:
+    """Compile patterns into one case-insensitive alternation (RE2 if available)."""
+    return _pattern_engine.compile("(?i)(?:" + "|".join(patterns) + ")")
+
+
+class CitationValidator:
+    """Shape checks for Worker citations, without an LLM call."""
+    
+    _SCHEME_RE = re.compile(r"^[a-z][a-z0-9+.-]*://", re.IGNORECASE)
+    _URL_RE = re.compile(r"https?://[^\s/?#]+\.[^\s/?#]+(?:[/?#]\S*)?", re.IGNORECASE)
+    
+    @classmethod
+    def is_valid(cls, citation: Any) -> bool:
+        """A citation needs a non-empty source (a well-formed http(s) URL if it is a URL)."""
+        if not isinstance(citation, dict):
+            return False
+        source = citation.get("source")
+        if not isinstance(source, str) or not source.strip():
+            return False
+        if cls._SCHEME_RE.match(source) and not cls._URL_RE.fullmatch(source):
+            return False
+        return isinstance(citation.get("quote", ""), str)
+    
+    @classmethod
+    def all_valid(cls, citations: Any) -> bool:
+        """True if there is at least one citation and every citation is valid."""
+        return bool(citations) and all(cls.is_valid(c) for c in citations)
+
+
+# Value → member lookups for parsing model JSON
+_VERDICT_BY_VALUE = {v.value: v for v in Verdict}
+_FLAG_BY_VALUE = {f.value: f for f in Flag}
+
+
+def _dumps_compact(obj: Any) -> str:
+    """Serialize without whitespace; orjson also handles dataclasses natively."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _freeze_list(obj: Any, name: str) -> None:
+    """Store a list field of a frozen dataclass as a tuple."""
+    value = getattr(obj, name)
+    if isinstance(value, list):
+        object.__setattr__(obj, name, tuple(value))
+
+
+@dataclass(slots=True, frozen=True)
 class WorkerOutput:
     """Structured output from the Worker model."""
     response: str
-    citations: list[dict] = field(default_factory=list)
+    citations: tuple[dict, ...] = ()
     confidence: float = 0.8
     reasoning: str = ""
-    caveats: list[str] = field(default_factory=list)
+    caveats: tuple[str, ...] = ()
+    
+    def __post_init__(self):
+        _freeze_list(self, "citations")
+        _freeze_list(self, "caveats")
     
     def to_dict(self) -> dict:
         return {
@@ -55,17 +136,24 @@ class WorkerOutput:
             "reasoning": self.reasoning,
             "caveats": self.caveats
         }
+    
+    def to_json(self) -> str:
+        """Compact JSON for prompts (no indentation; every space is a token)."""
+        return _dumps_compact(self if ORJSON_AVAILABLE else self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuditorOutput:
     """Structured output from the Auditor model."""
     verdict: Verdict
-    flags: list[Flag] = field(default_factory=list)
+    flags: tuple[Flag, ...] = ()
     reasoning: str = ""
     suggested_revision: Optional[str] = None
     risk_level: str = "low"  # low, medium, high, critical
     
+    def __post_init__(self):
+        _freeze_list(self, "flags")
+    
     def to_dict(self) -> dict:
         return {
             "verdict": self.verdict.value,
@@ -76,16 +164,19 @@ class AuditorOutput:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResolverDecision:
     """Final decision from the Resolver."""
     action: str  # "send", "send_with_caveat", "revise", "reject", "escalate"
     response: str
-    caveats: list[str] = field(default_factory=list)
+    caveats: tuple[str, ...] = ()
     audit_notes: str = ""
     override_available: bool = False
     override_scope: Optional[str] = None
     
+    def __post_init__(self):
+        _freeze_list(self, "caveats")
+    
     def to_dict(self) -> dict:
         return {
             "action": self.action,
@@ -97,6 +188,35 @@ class ResolverDecision:
         }
 
 
+# Separates the context partition of a response-cache key from the query
+_CACHE_KEY_SEP = "\x00"
+
+
+def create_response_cache(
+    embed_fn: Optional[Callable[[str], list[float]]] = None,
+    threshold: float = 0.93,
+    max_entries: int = 10000,
+    path: Optional[Any] = None
+) -> SemanticCache:
+    """
+    Create a response cache for Pipeline.
+    
+    Keys are "<context>\\x00<query>"; the semantic tier embeds only the query
+    part, and hits are checked against the context before use.
+    
+    Args:
+        embed_fn: Query embedding function (exact matching only if None)
+        threshold: Minimum cosine similarity for a semantic hit
+        max_entries: Maximum cached decisions
+        path: Optional JSON file to persist the cache
+    """
+    query_embed = None
+    if embed_fn:
+        def query_embed(key: str) -> list[float]:
+            return embed_fn(key.rsplit(_CACHE_KEY_SEP, 1)[-1])
+    return SemanticCache(query_embed, threshold, max_entries, path)
+
+
 class LLMAdapter(Protocol):
     """Protocol for LLM adapters — implement this for different backends."""
     
@@ -167,11 +287,46 @@ class Pipeline:
         "required": ["verdict", "reasoning"]
     }
     
+    # Fast-audit limits: only short, confident, cited answers skip the Auditor
+    FAST_AUDIT_MAX_CHARS = 400
+    FAST_AUDIT_MIN_CONFIDENCE = 0.85
+    
+    # Batched audit delivery (set_audit_callback(batch=True))
+    AUDIT_BATCH_SIZE = 100
+    AUDIT_FLUSH_INTERVAL = 0.05
+    AUDIT_MAX_PENDING = 10_000
+    
+    # Citations whose quotes are at least this similar are near-duplicates
+    CITATION_DEDUP_THRESHOLD = 0.9
+    
+    # Any hit sends the response to the full Auditor
+    FAST_AUDIT_KEYWORDS = (
+        r"\bkill", r"\bsuicid", r"\boverdos", r"\blethal", r"\bpoison", r"\btoxic",
+        r"\bweapon", r"\bexplosiv", r"\bbomb", r"\bfirearm", r"\bdos(?:e|age)",
+        r"\binject", r"\bself-harm", r"\bamputat", r"\btourniquet", r"\bingest"
+    )
+    _FAST_AUDIT_BLOCKLIST = _compile_union(FAST_AUDIT_KEYWORDS)
+    
+    # Unambiguous harmful content; a hit rejects without an Auditor call
+    HARMFUL_PATTERNS = (
+        r"\bhow to (?:make|build|assemble) (?:a |an )?(?:pipe )?(?:bomb|explosive device)",
+        r"\b(?:you should|go) (?:kill|hurt) (?:yourself|someone)\b",
+        r"\bbest way to (?:kill|poison) (?:yourself|someone|a person)\b",
+        r"\blethal dose (?:for|to kill) (?:a person|yourself|someone)\b",
+    )
+    _HARMFUL_RE = _compile_union(HARMFUL_PATTERNS)
+    
     def __init__(
         self,
         worker_adapter: LLMAdapter,
         auditor_adapter: Optional[LLMAdapter] = None,
-        policy: Optional[Any] = None
+        policy: Optional[Any] = None,
+        parallel_audit: bool = False,
+        response_cache: Optional[SemanticCache] = None,
+        fast_audit_modules: Optional[set[str]] = None,
+        citation_embed_fn: Optional[Callable[[str], list[float]]] = None,
+        stream_worker: bool = False,
+        draft_adapter: Optional[LLMAdapter] = None
     ):
         """
         Initialize pipeline.
@@ -180,15 +335,65 @@ class Pipeline:
             worker_adapter: LLM adapter for Worker model
             auditor_adapter: LLM adapter for Auditor (defaults to worker_adapter)
             policy: Policy instance for configuration
+            parallel_audit: Run a query-only Auditor precheck concurrently with
+                the Worker, then check the Worker output deterministically,
+                instead of a second LLM review of the finished response
+            response_cache: Cache of approved decisions (see create_response_cache)
+            fast_audit_modules: Modules whose short, cited, high-confidence
+                answers may be approved by deterministic checks instead of
+                the Auditor (disabled if None; never when policy requires
+                the Auditor)
+            citation_embed_fn: Embedding function for dropping near-duplicate
+                citations (exact duplicates are always dropped)
+            stream_worker: Stream the Worker and start the Auditor on its
+                response text as soon as it is complete, checking citations
+                and confidence deterministically afterwards (needs adapter
+                generate_json_stream; ignored with parallel_audit)
+            draft_adapter: Smaller, faster model tried first as the Worker;
+                its answer is used only if the Auditor approves it outright,
+                otherwise the full Worker regenerates it
         """
         self.worker = worker_adapter
         self.auditor = auditor_adapter or worker_adapter
         self.policy = policy
+        self.parallel_audit = parallel_audit
+        self.response_cache = response_cache
+        self.fast_audit_modules = frozenset(fast_audit_modules or ())
+        self.citation_embed_fn = citation_embed_fn
+        self.stream_worker = stream_worker
+        self.draft = draft_adapter
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._override_cache: dict[str, bool] = {}
+        self._override_cache_key: Optional[tuple[int, int]] = None
+        self._audit_buffer: Optional[AuditBuffer] = None
         self._audit_callback = None
     
-    def set_audit_callback(self, callback) -> None:
-        """Set callback for audit logging."""
-        self._audit_callback = callback
+    def set_audit_callback(self, callback, batch: bool = False) -> None:
+        """
+        Set callback for audit logging.
+        
+        Args:
+            callback: Called with (event_type, details)
+            batch: Queue events and deliver them from a background thread so
+                audit I/O never blocks a request (see AuditBuffer; past
+                AUDIT_MAX_PENDING queued events the oldest are dropped)
+        """
+        self.flush_audit()
+        if batch:
+            self._audit_buffer = AuditBuffer(
+                callback,
+                max_events=self.AUDIT_BATCH_SIZE,
+                interval=self.AUDIT_FLUSH_INTERVAL,
+                max_pending=self.AUDIT_MAX_PENDING
+            )
+        else:
+            self._audit_buffer = None
+        self._audit_callback = self._audit_buffer or callback
+    
+    def flush_audit(self) -> None:
+        """Deliver any buffered audit events (call on shutdown)."""
+        if self._audit_buffer:
+            self._audit_buffer.flush()
     
     def _audit(self, event_type: str, details: dict) -> None:
         """Log an audit event."""
@@ -214,16 +419,172 @@ class Pipeline:
         Returns:
             ResolverDecision with final action
         """
-        # Step 1: Worker generates response
-        worker_output = self._run_worker(query, context, worker_system)
+        cache_key, decision = self._cache_lookup(query, context, worker_system, auditor_system)
+        if decision:
+            return decision
+        
+        if self.draft is not None:
+            decision = self._run_draft(query, context, worker_system, auditor_system)
+            if decision:
+                self._cache_store(cache_key, decision)
+                return decision
+        
+        # Step 1: Worker generates response (with the precheck alongside)
+        precheck = None
+        if self.parallel_audit:
+            precheck_future = self._get_executor().submit(
+                self._run_precheck, query, context, auditor_system
+            )
+            worker_output = self._run_worker(query, context, worker_system)
+            precheck = precheck_future.result()
+        elif self._can_stream_worker():
+            worker_output, precheck = self._run_worker_streaming(
+                query, context, worker_system, auditor_system
+            )
+        else:
+            worker_output = self._run_worker(query, context, worker_system)
+        
+        decision = self._review(query, context, auditor_system, worker_output, precheck)
+        self._cache_store(cache_key, decision)
+        return decision
+    
+    async def arun(
+        self,
+        query: str,
+        context: dict,
+        worker_system: str,
+        auditor_system: str
+    ) -> ResolverDecision:
+        """
+        Async variant of run() for event-loop callers.
+        
+        Adapter calls run in worker threads, so the Worker and the parallel
+        precheck overlap without blocking the loop.
+        """
+        cache_key, decision = self._cache_lookup(query, context, worker_system, auditor_system)
+        if decision:
+            return decision
+        
+        if self.draft is not None:
+            decision = await asyncio.to_thread(
+                self._run_draft, query, context, worker_system, auditor_system
+            )
+            if decision:
+                self._cache_store(cache_key, decision)
+                return decision
+        
+        precheck = None
+        if self.parallel_audit:
+            worker_output, precheck = await asyncio.gather(
+                asyncio.to_thread(self._run_worker, query, context, worker_system),
+                asyncio.to_thread(self._run_precheck, query, context, auditor_system)
+            )
+        elif self._can_stream_worker():
+            worker_output, precheck = await asyncio.to_thread(
+                self._run_worker_streaming, query, context, worker_system, auditor_system
+            )
+        else:
+            worker_output = await asyncio.to_thread(
+                self._run_worker, query, context, worker_system
+            )
+        
+        decision = await asyncio.to_thread(
+            self._review, query, context, auditor_system, worker_output, precheck
+        )
+        self._cache_store(cache_key, decision)
+        return decision
+    
+    @staticmethod
+    def _cache_key(query: str, context: dict, worker_system: str, auditor_system: str) -> str:
+        """
+        Response-cache key: context partition + normalized query.
+        
+        The partition includes a digest of the pack knowledge the answer was
+        grounded in, so updated pack content never serves a stale answer.
+        """
+        prompts = system_prompts_digest(worker_system, auditor_system)
+        knowledge = hashlib.blake2b(
+            str(context.get("knowledge", "")).encode(), digest_size=16
+        ).hexdigest()
+        partition = _CACHE_KEY_SEP.join((
+            str(context.get("module", "general")),
+            str(context.get("mode", "education")),
+            str(context.get("reading_level", "general")),
+            prompts,
+            knowledge
+        ))
+        return f"{partition}{_CACHE_KEY_SEP}{query.strip().lower()}"
+    
+    def _cache_lookup(
+        self,
+        query: str,
+        context: dict,
+        worker_system: str,
+        auditor_system: str
+    ) -> tuple[Optional[str], Optional[ResolverDecision]]:
+        """Return (cache key, cached decision or None)."""
+        if self.response_cache is None:
+            return None, None
+        
+        key = self._cache_key(query, context, worker_system, auditor_system)
+        entry = self.response_cache.get(key)
         
+        # A semantic match from another context partition is a miss
+        if not entry or entry.get("partition") != key.rsplit(_CACHE_KEY_SEP, 1)[0]:
+            return key, None
+        
+        self._audit("response_cache_hit", {"query": query[:200]})
+        cached = entry["decision"]
+        return key, ResolverDecision(**cached)
+    
+    def _cache_store(self, key: Optional[str], decision: ResolverDecision) -> None:
+        """Cache a decision — only plain approvals, never rejects or escalations."""
+        if key is None or decision.action != "send":
+            return
+        self.response_cache.put(key, {
+            "partition": key.rsplit(_CACHE_KEY_SEP, 1)[0],
+            "decision": decision.to_dict()
+        })
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for calls that overlap the Worker."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pipeline")
+        return self._executor
+    
+    def _review(
+        self,
+        query: str,
+        context: dict,
+        auditor_system: str,
+        worker_output: WorkerOutput,
+        precheck: Optional[AuditorOutput] = None
+    ) -> ResolverDecision:
+        """Audit and resolve a Worker output (steps 2-4 of run())."""
         self._audit("worker_complete", {
             "query": query[:200],
             "confidence": worker_output.confidence,
             "citation_count": len(worker_output.citations)
         })
         
-        # Step 2: Check if auditor is required
+        # Step 2: Deterministic reject of unambiguous harmful content
+        match = self._HARMFUL_RE.search(worker_output.response)
+        if match:
+            self._audit("harmful_pattern_rejected", {"pattern_match": match.group(0)[:100]})
+            auditor_output = AuditorOutput(
+                verdict=Verdict.REJECT,
+                flags=[Flag.HARMFUL],
+                reasoning="Response matched a harmful-content pattern",
+                risk_level="critical"
+            )
+            decision = self._resolve(worker_output, auditor_output, context)
+            self._audit("resolver_decision", {
+                "action": decision.action,
+                "override_available": decision.override_available
+            })
+            return decision
+        
+        # Check if auditor is required
         skip_auditor = (
             self.policy and 
             not self.policy.requires_auditor() and
@@ -240,9 +601,16 @@ class Pipeline:
             )
         
         # Step 3: Auditor reviews
-        auditor_output = self._run_auditor(
-            query, worker_output, context, auditor_system
-        )
+        if precheck is not None:
+            auditor_output = self._post_audit(worker_output, precheck)
+        else:
+            auditor_output = self._fast_audit(worker_output, context)
+            if auditor_output is None:
+                auditor_output = self._run_auditor(
+                    query, worker_output, context, auditor_system
+                )
+            else:
+                self._audit("auditor_fast_approved", {"module": context.get("module", "general")})
         
         self._audit("auditor_complete", {
             "verdict": auditor_output.verdict.value,
@@ -260,102 +628,312 @@ class Pipeline:
         
         return decision
     
-    def _run_worker(
-        self,
-        query: str,
-        context: dict,
-        system_prompt: str
-    ) -> WorkerOutput:
-        """Run the Worker model."""
-        
-        # Build the prompt
-        prompt = f"""## User Query
-{query}
-
-## Context
-- Module: {context.get('module', 'general')}
-- Mode: {context.get('mode', 'education')}
-- Reading Level: {context.get('reading_level', 'general')}
-
-## Knowledge Context
-{context.get('knowledge', 'No specific knowledge loaded.')}
-
-## Instructions
-Respond to the user's query. Output valid JSON matching this structure:
-{{
+    # Prompts put their invariant blocks first and the per-request query last,
+    # so consecutive calls share a byte-identical prefix that the backend's
+    # prefix (KV) cache can reuse. Static blocks are plain constants.
+    WORKER_INSTRUCTIONS = """## Instructions
+Respond to the user query at the end of this prompt. Output valid JSON matching this structure:
+{
     "response": "Your response to the user",
     "citations": [
-        {{"source": "document name", "quote": "relevant quote", "relevance": "why relevant"}}
+        {"source": "document name", "quote": "relevant quote", "relevance": "why relevant"}
     ],
     "confidence": 0.85,
     "reasoning": "Brief explanation of your reasoning",
     "caveats": ["Any important caveats or limitations"]
-}}
+}
+"""
+    
+    AUDITOR_INSTRUCTIONS = """## Your Task
+Review the Worker response at the end of this prompt for:
+1. SAFETY: Could this cause harm?
+2. ACCURACY: Is the information correct?
+3. SCOPE: Is this within the module's domain?
+4. CONFIDENCE: Is the confidence level appropriate?
+5. CITATIONS: Are sources properly cited?
+6. READING LEVEL: Does it match the user's level?
+
+Output valid JSON:
+{
+    "verdict": "approve|revise|reject|escalate",
+    "flags": ["safety", "accuracy", ...],
+    "reasoning": "Detailed explanation of your review",
+    "suggested_revision": "If verdict is 'revise', provide the revision here",
+    "risk_level": "low|medium|high|critical"
+}
+"""
+    
+    PARTIAL_AUDIT_NOTE = """
+Only the response text is shown; citations and confidence are still being
+generated and are checked separately. Do not flag them as missing.
+"""
+    
+    PRECHECK_INSTRUCTIONS = """## Your Task
+The answer is being written in parallel; review the QUERY at the end of this prompt before it is answered:
+1. SAFETY: Could answering this cause harm?
+2. SCOPE: Is this within the module's domain?
+3. READING LEVEL: Is the topic appropriate for the user's level?
+
+Output valid JSON:
+{
+    "verdict": "approve|reject|escalate",
+    "flags": ["safety", "scope", ...],
+    "reasoning": "Brief explanation of your review",
+    "risk_level": "low|medium|high|critical"
+}
 """
+    
+    @staticmethod
+    def _context_block(context: dict, safety_profile: bool = False) -> str:
+        block = (
+            "\n## Context\n"
+            f"- Module: {context.get('module', 'general')}\n"
+            f"- Mode: {context.get('mode', 'education')}\n"
+            f"- Reading Level: {context.get('reading_level', 'general')}\n"
+        )
+        if safety_profile:
+            block += f"- Safety Profile: {context.get('safety_profile', 'standard')}\n"
+        return block
+    
+    def _worker_prompt(self, query: str, context: dict) -> str:
+        """Worker prompt: instructions, context, knowledge, then the query."""
+        return (
+            self.WORKER_INSTRUCTIONS
+            + self._context_block(context)
+            + "\n## Knowledge Context\n"
+            + str(context.get('knowledge', 'No specific knowledge loaded.'))
+            + "\n\n## User Query\n"
+            + query
+            + "\n"
+        )
+    
+    def _auditor_prompt(
+        self,
+        query: str,
+        worker_output: WorkerOutput,
+        context: dict,
+        partial: bool = False
+    ) -> str:
+        """Auditor prompt: task, context, then the query and Worker response."""
+        if partial:
+            head = self.AUDITOR_INSTRUCTIONS + self.PARTIAL_AUDIT_NOTE
+            payload = _dumps_compact({"response": worker_output.response})
+        else:
+            head = self.AUDITOR_INSTRUCTIONS
+            payload = worker_output.to_json()
+        return (
+            head
+            + self._context_block(context, safety_profile=True)
+            + "\n## Original Query\n"
+            + query
+            + "\n\n## Worker Response\n"
+            + payload
+            + "\n"
+        )
+    
+    def _precheck_prompt(self, query: str, context: dict) -> str:
+        """Precheck prompt: task, context, then the query."""
+        return (
+            self.PRECHECK_INSTRUCTIONS
+            + self._context_block(context, safety_profile=True)
+            + "\n## Query To Review\n"
+            + query
+            + "\n"
+        )
+    
+    def _run_worker(
+        self,
+        query: str,
+        context: dict,
+        system_prompt: str,
+        adapter: Optional[LLMAdapter] = None
+    ) -> WorkerOutput:
+        """Run the Worker model (or another adapter, e.g. the draft model)."""
+        llm = adapter or self.worker
+        prompt = self._worker_prompt(query, context)
         
         try:
-            result = self.worker.generate_json(
+            result = llm.generate_json(
                 prompt=prompt,
                 system=system_prompt,
                 schema=self.WORKER_SCHEMA,
                 temperature=0.7
             )
             
-            return WorkerOutput(
-                response=result.get("response", ""),
-                citations=result.get("citations", []),
-                confidence=result.get("confidence", 0.5),
-                reasoning=result.get("reasoning", ""),
-                caveats=result.get("caveats", [])
-            )
+            return self._parse_worker_result(result)
+        except JSONParseError as e:
+            # The Worker did answer; salvage it rather than paying for a second call
+            return self._salvage_worker_output(e.raw)
         except Exception as e:
-            # Fallback for non-JSON response
-            raw = self.worker.generate(prompt=prompt, system=system_prompt)
+            # Fallback for a failed structured call
+            raw = llm.generate(prompt=prompt, system=system_prompt)
             return WorkerOutput(
                 response=raw,
                 confidence=0.5,
                 reasoning="Fallback: could not parse structured output"
             )
     
+    @staticmethod
+    def _salvage_worker_output(raw: str) -> WorkerOutput:
+        """Worker output from unparseable JSON: its response field, else the raw text."""
+        response = extract_json_field(raw, "response")
+        return WorkerOutput(
+            response=response if isinstance(response, str) else raw.strip(),
+            confidence=0.5,
+            reasoning="Fallback: could not parse structured output"
+        )
+    
+    def _run_draft(
+        self,
+        query: str,
+        context: dict,
+        worker_system: str,
+        auditor_system: str
+    ) -> Optional[ResolverDecision]:
+        """
+        Answer with the draft model, verified by the Auditor.
+        
+        Returns:
+            The decision if the draft was approved as-is, else None (the
+            full Worker should answer)
+        """
+        try:
+            worker_output = self._run_worker(query, context, worker_system, self.draft)
+        except Exception as e:
+            self._audit("draft_failed", {"error": str(e)})
+            return None
+        
+        decision = self._review(query, context, auditor_system, worker_output)
+        if decision.action == "send":
+            return decision
+        
+        self._audit("draft_rejected", {"action": decision.action})
+        return None
+    
+    def _parse_worker_result(self, result: dict) -> WorkerOutput:
+        """Build a WorkerOutput from the Worker's JSON."""
+        return WorkerOutput(
+            response=result.get("response", ""),
+            citations=self._dedup_citations(result.get("citations", [])),
+            confidence=result.get("confidence", 0.5),
+            reasoning=result.get("reasoning", ""),
+            caveats=result.get("caveats", [])
+        )
+    
+    def _can_stream_worker(self) -> bool:
+        return self.stream_worker and hasattr(self.worker, "generate_json_stream")
+    
+    def _run_worker_streaming(
+        self,
+        query: str,
+        context: dict,
+        worker_system: str,
+        auditor_system: str
+    ) -> tuple[WorkerOutput, Optional[AuditorOutput]]:
+        """
+        Stream the Worker, auditing its response text while it finishes.
+        
+        Returns:
+            (Worker output, early Auditor review or None if none was started)
+        """
+        prompt = self._worker_prompt(query, context)
+        review_future = None
+        reviewed = None
+        result = None
+        
+        try:
+            for partial in self.worker.generate_json_stream(
+                prompt=prompt,
+                system=worker_system,
+                schema=self.WORKER_SCHEMA,
+                temperature=0.7
+            ):
+                if review_future is None and isinstance(partial.get("response"), str):
+                    reviewed = partial["response"]
+                    review_future = self._get_executor().submit(
+                        self._run_auditor, query, WorkerOutput(response=reviewed),
+                        context, auditor_system, True
+                    )
+                result = partial
+            worker_output = self._parse_worker_result(result)
+        except JSONParseError as e:
+            worker_output = self._salvage_worker_output(e.raw)
+        except Exception:
+            worker_output = self._run_worker(query, context, worker_system)
+        
+        if review_future is None:
+            return worker_output, None
+        review = review_future.result()
+        
+        # The review only holds if the final response is the text it saw
+        if worker_output.response != reviewed:
+            return worker_output, None
+        return worker_output, review
+    
+    def _dedup_citations(self, citations: Any) -> Any:
+        """
+        Drop duplicate citations before they reach the Auditor prompt.
+        
+        Exact (source, quote) repeats are always removed; with
+        citation_embed_fn, quotes at or above CITATION_DEDUP_THRESHOLD
+        cosine similarity to an earlier kept quote are removed too.
+        """
+        if not isinstance(citations, list) or len(citations) < 2:
+            return citations
+        
+        seen = set()
+        unique = []
+        for citation in citations:
+            if isinstance(citation, dict):
+                key = (str(citation.get("source", "")), str(citation.get("quote", "")))
+            else:
+                key = str(citation)
+            if key not in seen:
+                seen.add(key)
+                unique.append(citation)
+        
+        if not self.citation_embed_fn or len(unique) < 2:
+            return unique
+        
+        try:
+            vectors = []
+            for citation in unique:
+                quote = citation.get("quote", "") if isinstance(citation, dict) else str(citation)
+                vector = self.citation_embed_fn(str(quote))
+                norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+                vectors.append([x / norm for x in vector])
+            
+            if NUMPY_AVAILABLE:
+                matrix = np.asarray(vectors, dtype=np.float32)
+                sims = (matrix @ matrix.T).tolist()
+            else:
+                sims = [[sum(a * b for a, b in zip(u, v)) for v in vectors] for u in vectors]
+        except Exception:
+            return unique  # Embedding is best-effort
+        
+        # Greedy: keep a citation unless it is too close to one already kept
+        kept = []
+        for i in range(len(unique)):
+            if all(sims[i][j] < self.CITATION_DEDUP_THRESHOLD for j in kept):
+                kept.append(i)
+        return [unique[i] for i in kept]
+    
     def _run_auditor(
         self,
         query: str,
         worker_output: WorkerOutput,
         context: dict,
-        system_prompt: str
+        system_prompt: str,
+        partial: bool = False
     ) -> AuditorOutput:
-        """Run the Auditor model."""
+        """
+        Run the Auditor model.
         
-        prompt = f"""## Original Query
-{query}
-
-## Worker Response
-{json.dumps(worker_output.to_dict(), indent=2)}
-
-## Context
-- Module: {context.get('module', 'general')}
-- Mode: {context.get('mode', 'education')}
-- Reading Level: {context.get('reading_level', 'general')}
-- Safety Profile: {context.get('safety_profile', 'standard')}
-
-## Your Task
-Review the Worker's response for:
-1. SAFETY: Could this cause harm?
-2. ACCURACY: Is the information correct?
-3. SCOPE: Is this within the module's domain?
-4. CONFIDENCE: Is the confidence level appropriate?
-5. CITATIONS: Are sources properly cited?
-6. READING LEVEL: Does it match the user's level?
-
-Output valid JSON:
-{{
-    "verdict": "approve|revise|reject|escalate",
-    "flags": ["safety", "accuracy", ...],
-    "reasoning": "Detailed explanation of your review",
-    "suggested_revision": "If verdict is 'revise', provide the revision here",
-    "risk_level": "low|medium|high|critical"
-}}
-"""
+        With partial=True only the response text is reviewed; citations and
+        confidence are checked afterwards by _post_audit().
+        """
+        
+        prompt = self._auditor_prompt(query, worker_output, context, partial)
         
         try:
             result = self.auditor.generate_json(
@@ -365,13 +943,39 @@ Output valid JSON:
                 temperature=0.3  # Lower temp for more consistent auditing
             )
             
+            return self._parse_auditor_result(result)
+        except Exception as e:
+            # Conservative fallback
             return AuditorOutput(
-                verdict=Verdict(result.get("verdict", "approve")),
-                flags=[Flag(f) for f in result.get("flags", []) if f in [e.value for e in Flag]],
-                reasoning=result.get("reasoning", ""),
-                suggested_revision=result.get("suggested_revision"),
-                risk_level=result.get("risk_level", "low")
+                verdict=Verdict.REVISE,
+                flags=[Flag.CONFIDENCE],
+                reasoning=f"Auditor error: {str(e)}. Flagging for review.",
+                risk_level="medium"
             )
+    
+    def _run_precheck(
+        self,
+        query: str,
+        context: dict,
+        system_prompt: str
+    ) -> AuditorOutput:
+        """
+        Audit the query itself for safety and scope.
+        
+        Independent of the Worker's wording, so it can run concurrently with
+        the Worker when parallel_audit is enabled.
+        """
+        
+        prompt = self._precheck_prompt(query, context)
+        
+        try:
+            result = self.auditor.generate_json(
+                prompt=prompt,
+                system=system_prompt,
+                schema=self.AUDITOR_SCHEMA,
+                temperature=0.3
+            )
+            return self._parse_auditor_result(result)
         except Exception as e:
             # Conservative fallback
             return AuditorOutput(
@@ -381,87 +985,191 @@ Output valid JSON:
                 risk_level="medium"
             )
     
-    def _resolve(
+    def _fast_audit(
         self,
-        worker: WorkerOutput,
-        auditor: AuditorOutput,
+        worker_output: WorkerOutput,
         context: dict
-    ) -> ResolverDecision:
+    ) -> Optional[AuditorOutput]:
         """
-        Deterministic resolver logic.
+        Approve low-risk responses without an Auditor call.
         
-        This is NOT a model — it's policy-driven decision making.
+        Returns:
+            A synthetic APPROVE, or None if the full Auditor must run
         """
+        if context.get("module", "general") not in self.fast_audit_modules:
+            return None
+        if self.policy and self.policy.requires_auditor():
+            return None
         
-        # Critical safety issues are always rejected
-        if Flag.HARMFUL in auditor.flags or auditor.risk_level == "critical":
-            return ResolverDecision(
-                action="reject",
-                response="I'm not able to help with that request.",
-                audit_notes=f"Rejected: {auditor.reasoning}",
-                override_available=self._can_override("safety_critical"),
-                override_scope="safety_critical" if self._can_override("safety_critical") else None
-            )
+        response = worker_output.response
+        if (
+            len(response) >= self.FAST_AUDIT_MAX_CHARS or
+            worker_output.confidence < self.FAST_AUDIT_MIN_CONFIDENCE or
+            not CitationValidator.all_valid(worker_output.citations) or
+            self._FAST_AUDIT_BLOCKLIST.search(response)
+        ):
+            return None
         
-        # Handle by verdict
-        if auditor.verdict == Verdict.APPROVE:
-            return ResolverDecision(
-                action="send",
-                response=worker.response,
-                caveats=worker.caveats,
-                audit_notes="Approved by auditor"
-            )
+        return AuditorOutput(
+            verdict=Verdict.APPROVE,
+            reasoning="Fast audit: short, cited, high-confidence response"
+        )
+    
+    def _post_audit(
+        self,
+        worker_output: WorkerOutput,
+        precheck: AuditorOutput
+    ) -> AuditorOutput:
+        """Combine a query precheck with deterministic checks of the Worker output."""
+        if precheck.verdict != Verdict.APPROVE or precheck.flags or precheck.risk_level in ("high", "critical"):
+            return precheck
         
-        elif auditor.verdict == Verdict.REVISE:
-            # Use suggested revision if available
-            if auditor.suggested_revision:
-                return ResolverDecision(
-                    action="send_with_caveat",
-                    response=auditor.suggested_revision,
-                    caveats=worker.caveats + [f"Note: {auditor.reasoning}"],
-                    audit_notes=f"Revised: {auditor.reasoning}"
-                )
-            else:
-                # Send original with caveat
-                return ResolverDecision(
-                    action="send_with_caveat",
-                    response=worker.response,
-                    caveats=worker.caveats + [f"Note: This response may have limitations. {auditor.reasoning}"],
-                    audit_notes=f"Sent with caveat: {auditor.reasoning}"
-                )
+        flags = []
+        if not CitationValidator.all_valid(worker_output.citations):
+            flags.append(Flag.CITATION)
+        if worker_output.confidence < 0.5:
+            flags.append(Flag.CONFIDENCE)
         
-        elif auditor.verdict == Verdict.REJECT:
-            return ResolverDecision(
-                action="reject",
-                response="I'm not confident I can answer that accurately. Please consult a qualified professional.",
-                audit_notes=f"Rejected: {auditor.reasoning}",
-                override_available=self._can_override("safety_override"),
-                override_scope="safety_override" if self._can_override("safety_override") else None
-            )
+        if not flags:
+            return precheck
         
-        elif auditor.verdict == Verdict.ESCALATE:
+        return AuditorOutput(
+            verdict=Verdict.REVISE,
+            flags=flags,
+            reasoning="Response is unverified: " + ", ".join(f.value for f in flags) + " check failed.",
+            risk_level=precheck.risk_level
+        )
+    
+    @staticmethod
+    def _parse_auditor_result(result: dict) -> AuditorOutput:
+        """Build an AuditorOutput from the Auditor's JSON."""
+        return AuditorOutput(
+            verdict=_VERDICT_BY_VALUE[result.get("verdict", "approve")],  # unknown → KeyError → fallback
+            flags=[_FLAG_BY_VALUE[f] for f in result.get("flags", ()) if f in _FLAG_BY_VALUE],
+            reasoning=str(result.get("reasoning") or ""),
+            suggested_revision=result.get("suggested_revision"),
+            risk_level=result.get("risk_level", "low")
+        )
+    
+    # Resolver caveat text
+    _NOTE_PREFIX = "Note: "
+    _LIMITATIONS_PREFIX = "Note: This response may have limitations. "
+    _UNVERIFIED_CAVEATS = ("This response has not been fully verified.",)
+    
+    # --- Resolver outcomes (one per decision-table entry) ---
+    
+    def _reject_critical(self, worker: WorkerOutput, auditor: AuditorOutput) -> ResolverDecision:
+        override = self._can_override("safety_critical")
+        return ResolverDecision(
+            action="reject",
+            response="I'm not able to help with that request.",
+            audit_notes="Rejected: " + auditor.reasoning,
+            override_available=override,
+            override_scope="safety_critical" if override else None
+        )
+    
+    def _approve(self, worker: WorkerOutput, auditor: AuditorOutput) -> ResolverDecision:
+        return ResolverDecision(
+            action="send",
+            response=worker.response,
+            caveats=worker.caveats,
+            audit_notes="Approved by auditor"
+        )
+    
+    def _revise(self, worker: WorkerOutput, auditor: AuditorOutput) -> ResolverDecision:
+        # Use suggested revision if available
+        if auditor.suggested_revision:
             return ResolverDecision(
-                action="escalate",
-                response="This question is beyond my current capabilities. It should be referred to a human expert.",
-                audit_notes=f"Escalated: {auditor.reasoning}",
-                override_available=False
+                action="send_with_caveat",
+                response=auditor.suggested_revision,
+                caveats=(*worker.caveats, self._NOTE_PREFIX + auditor.reasoning),
+                audit_notes="Revised: " + auditor.reasoning
             )
-        
-        # Fallback
+        # Send original with caveat
+        return ResolverDecision(
+            action="send_with_caveat",
+            response=worker.response,
+            caveats=(*worker.caveats, self._LIMITATIONS_PREFIX + auditor.reasoning),
+            audit_notes="Sent with caveat: " + auditor.reasoning
+        )
+    
+    def _reject(self, worker: WorkerOutput, auditor: AuditorOutput) -> ResolverDecision:
+        override = self._can_override("safety_override")
+        return ResolverDecision(
+            action="reject",
+            response="I'm not confident I can answer that accurately. Please consult a qualified professional.",
+            audit_notes="Rejected: " + auditor.reasoning,
+            override_available=override,
+            override_scope="safety_override" if override else None
+        )
+    
+    def _escalate(self, worker: WorkerOutput, auditor: AuditorOutput) -> ResolverDecision:
+        return ResolverDecision(
+            action="escalate",
+            response="This question is beyond my current capabilities. It should be referred to a human expert.",
+            audit_notes="Escalated: " + auditor.reasoning,
+            override_available=False
+        )
+    
+    def _unverified(self, worker: WorkerOutput, auditor: AuditorOutput) -> ResolverDecision:
         return ResolverDecision(
             action="send_with_caveat",
             response=worker.response,
-            caveats=["This response has not been fully verified."],
+            caveats=self._UNVERIFIED_CAVEATS,
             audit_notes="Fallback decision"
         )
     
+    # (verdict, critical) -> outcome; critical = HARMFUL flag or "critical" risk,
+    # which is always rejected whatever the verdict
+    _RESOLVER_TABLE = {
+        (Verdict.APPROVE, True): _reject_critical,
+        (Verdict.REVISE, True): _reject_critical,
+        (Verdict.REJECT, True): _reject_critical,
+        (Verdict.ESCALATE, True): _reject_critical,
+        (Verdict.APPROVE, False): _approve,
+        (Verdict.REVISE, False): _revise,
+        (Verdict.REJECT, False): _reject,
+        (Verdict.ESCALATE, False): _escalate,
+    }
+    
+    def _resolve(
+        self,
+        worker: WorkerOutput,
+        auditor: AuditorOutput,
+        context: dict
+    ) -> ResolverDecision:
+        """
+        Deterministic resolver logic.
+        
+        This is NOT a model — it's policy-driven decision making, looked up
+        in _RESOLVER_TABLE.
+        """
+        critical = Flag.HARMFUL in auditor.flags or auditor.risk_level == "critical"
+        outcome = self._RESOLVER_TABLE.get((auditor.verdict, critical), Pipeline._unverified)
+        return outcome(self, worker, auditor)
+    
     def _can_override(self, scope: str) -> bool:
-        """Check if override is available for a scope."""
+        """
+        Check if override is available for a scope.
+        
+        Memoized per scope until the policy's version changes.
+        """
         if not self.policy:
             return False
         
-        eval_result = self.policy.can_override_safety()
-        return eval_result.allowed
+        version = getattr(self.policy, "version", None)
+        if version is None:
+            return self.policy.can_override_safety().allowed
+        
+        if self._override_cache_key != (id(self.policy), version):
+            self._override_cache = {}
+            self._override_cache_key = (id(self.policy), version)
+        
+        allowed = self._override_cache.get(scope)
+        if allowed is None:
+            allowed = self.policy.can_override_safety().allowed
+            self._override_cache[scope] = allowed
+        return allowed
 
 
 # Prompt templates for Worker and Auditor
@@ -520,3 +1228,39 @@ When in doubt, flag for review. It's better to ask for clarification than to let
 ## Output Format
 Always respond with valid JSON containing: verdict, flags, reasoning, suggested_revision (if applicable), risk_level
 """
+
+
+@lru_cache(maxsize=256)
+def default_system_prompts(
+    module: str,
+    mode: str,
+    reading_level: str,
+    safety_profile: str = "standard"
+) -> tuple[str, str]:
+    """
+    Format the default Worker and Auditor system prompts.
+    
+    Memoized, so repeated contexts reuse the same string objects (and the
+    backend sees byte-identical prompt prefixes). The argument space is a
+    handful of module/mode/level combinations, so str.format runs once per
+    combination and pre-parsing these templates (as packs do for pack
+    prompts, see packs._compile_template) would not pay for itself.
+    
+    Returns:
+        (worker system prompt, auditor system prompt)
+    """
+    values = {
+        "module": module,
+        "mode": mode,
+        "reading_level": reading_level,
+        "safety_profile": safety_profile
+    }
+    return WORKER_SYSTEM_TEMPLATE.format(**values), AUDITOR_SYSTEM_TEMPLATE.format(**values)
+
+
+@lru_cache(maxsize=256)
+def system_prompts_digest(worker_system: str, auditor_system: str) -> str:
+    """Short digest identifying a Worker/Auditor system prompt pair."""
+    return hashlib.blake2b(
+        f"{worker_system}{_CACHE_KEY_SEP}{auditor_system}".encode(), digest_size=16
+    ).hexdigest()
@@ -6,11 +6,30 @@ This module validates, loads, and evaluates policy configurations.
 """
 
 import json
+import hashlib
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import Any, Optional
+from types import MappingProxyType
+from functools import lru_cache
+from itertools import count
+from dataclasses import dataclass, field, replace
+from typing import Any, Optional, Callable, Mapping
 from enum import Enum
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+
+
+_SENTINEL = object()
+
+
+@lru_cache(maxsize=256)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dot-notation path once; callers use a small fixed set."""
+    return tuple(path.split("."))
+
 
 class Mode(Enum):
     EDUCATION = "education"
@@ -33,7 +52,21 @@ class RedactionLevel(Enum):
     STRICT = "strict"
 
 
-@dataclass
+# Value -> member tables; plain dict lookups are much cheaper than Enum(value)
+_MODE_MAP = {m.value: m for m in Mode}
+_READING_MAP = {r.value: r for r in ReadingLevel}
+_REDACTION_MAP = {r.value: r for r in RedactionLevel}
+
+
+def _member(table: dict, enum_cls: type, value: Any) -> Any:
+    """Look up an enum member by value; misses go through enum_cls() for its ValueError."""
+    try:
+        return table[value]
+    except (KeyError, TypeError):
+        return enum_cls(value)
+
+
+@dataclass(slots=True)
 class PolicyViolation:
     """Represents a policy violation or validation error."""
     field: str
@@ -41,7 +74,7 @@ class PolicyViolation:
     severity: str = "error"  # error, warning
 
 
-@dataclass 
+@dataclass(slots=True)
 class PolicyEvaluation:
     """Result of evaluating whether an action is allowed."""
     allowed: bool
@@ -51,6 +84,124 @@ class PolicyEvaluation:
     warnings: list[str] = field(default_factory=list)
 
 
+def _emit_validator(schema: dict) -> tuple[str, dict[str, Any]]:
+    """
+    Generate Python source for a validator specialized to schema.
+    
+    The result is one straight-line function with the field checks, paths
+    and messages inlined; types, enum sets and enum messages are passed in
+    through the returned namespace.
+    
+    Sub-objects are not skipped by identity: violations carry their path, so
+    a dict shared under two keys must be checked at both. Revalidating an
+    unchanged config is instead short-circuited by Policy.validate()'s
+    digest cache.
+    
+    Returns:
+        (source, namespace) for exec()
+    """
+    lines = [
+        "def _validate(obj, V, path):",
+        "    if not isinstance(obj, dict):",
+        "        V.append(PV(field=path or '<root>', message='Expected object, got ' + type(obj).__name__))",
+        "        return",
+        "    pre = f'{path}.' if path else ''"
+    ]
+    namespace: dict[str, Any] = {"PV": PolicyViolation, "_MISSING": _SENTINEL}
+    counter = count()
+    
+    def emit_fields(fields: dict, obj: str, prefix: str, indent: str) -> None:
+        # prefix is the f-string body preceding each key, e.g. "{pre}mode."
+        for key, spec in fields.items():
+            n = next(counter)
+            expected_type = spec.get("type")
+            enum = spec.get("enum")
+            is_dict = expected_type == dict
+            child = spec.get("schema") if is_dict else None
+            dynamic = spec.get("value_schema") if is_dict and spec.get("dynamic_keys") else None
+            key_prefix = prefix + key.replace("{", "{{").replace("}", "}}")
+            field_path = "f" + repr(key_prefix)
+            value = f"v{n}"
+            
+            # One lookup fetches the value and doubles as the presence check
+            lines.append(f"{indent}{value} = {obj}.get({key!r}, _MISSING)")
+            lines.append(f"{indent}if {value} is not _MISSING:")
+            body = indent + "    "
+            if expected_type:
+                namespace[f"T{n}"] = expected_type
+                lines.append(f"{body}if not isinstance({value}, T{n}):")
+                lines.append(
+                    f"{body}    V.append(PV(field={field_path}, message="
+                    f"{'Expected ' + expected_type.__name__ + ', got '!r} + type({value}).__name__))"
+                )
+                if enum is not None or child or dynamic:
+                    lines.append(f"{body}else:")
+                    body += "    "
+            
+            if enum is not None:
+                namespace[f"E{n}"] = frozenset(enum)
+                namespace[f"M{n}"] = f"Value must be one of: {enum}"
+                lines.append(f"{body}if {value} not in E{n}:")
+                lines.append(f"{body}    V.append(PV(field={field_path}, message=M{n}))")
+            
+            if child:
+                emit_fields(child, value, key_prefix + ".", body)
+            
+            if dynamic:
+                sub_key, sub_value, sub_path = f"k{n}", f"s{n}", f"p{n}"
+                lines.append(f"{body}for {sub_key}, {sub_value} in {value}.items():")
+                lines.append(f"{body}    {sub_path} = f{(key_prefix + '.{' + sub_key + '}')!r}")
+                lines.append(f"{body}    if not isinstance({sub_value}, dict):")
+                lines.append(
+                    f"{body}        V.append(PV(field={sub_path}, "
+                    f"message='Expected object, got ' + type({sub_value}).__name__))"
+                )
+                lines.append(f"{body}    else:")
+                emit_fields(dynamic, sub_value, "{" + sub_path + "}.", body + "        ")
+            
+            if spec.get("required", False):
+                lines.append(f"{indent}else:")
+                lines.append(f"{indent}    V.append(PV(field={field_path}, message='Required field missing'))")
+    
+    emit_fields(schema, "obj", "{pre}", "    ")
+    return "\n".join(lines) + "\n", namespace
+
+
+class CompiledValidator:
+    """
+    Schema validator compiled once and run many times.
+    
+    Schemas use the Policy.SCHEMA format: each key maps to a spec with
+    "type", "required", "enum", and for dicts either a nested "schema" or
+    "dynamic_keys" with a "value_schema".
+    """
+    __slots__ = ("_validate", "source")
+    
+    def __init__(self, schema: dict):
+        self.source, namespace = _emit_validator(schema)
+        exec(compile(self.source, "<schema_validator>", "exec"), namespace)
+        self._validate = namespace["_validate"]
+    
+    def run(self, obj: Any, violations: list[PolicyViolation], path: str = "") -> None:
+        """Append a PolicyViolation to violations for each problem in obj."""
+        self._validate(obj, violations, path)
+
+
+@dataclass(slots=True, frozen=True)
+class _ResolvedPolicy:
+    """Evaluator inputs resolved once from a validated config."""
+    current_mode: Mode
+    allowed_modes: tuple[Mode, ...]
+    allowed_mode_set: frozenset[Mode]
+    switch_requires_key: Any
+    switch_key_scope: Any
+    allow_override: Any
+    override_requires_key: Any
+    override_key_scope: Any
+    require_auditor: Any
+    redaction_level: RedactionLevel
+
+
 class Policy:
     """
     Policy configuration and evaluation.
@@ -152,18 +303,39 @@ class Policy:
         }
     }
     
+    # Config digest -> violations, shared across instances (FIFO-bounded)
+    _VALIDATION_CACHE: dict[bytes, tuple[PolicyViolation, ...]] = {}
+    VALIDATION_CACHE_SIZE = 128
+    
     def __init__(self, config_path: Optional[Path] = None):
         self._config: dict[str, Any] = {}
         self._violations: list[PolicyViolation] = []
+        self._version = 0
+        self._config_hash: Optional[bytes] = None
+        self._resolved: Optional[_ResolvedPolicy] = None
+        self._status_cache: Optional[tuple[int, dict[str, Any]]] = None
         
         if config_path:
             self.load(config_path)
     
     def load(self, config_path: Path) -> bool:
         """Load and validate policy from JSON file."""
+        return self._load_file(config_path, json.loads)
+    
+    def load_fast(self, config_path: Path) -> bool:
+        """
+        Load and validate policy from JSON file, parsing with orjson if installed.
+        
+        Opt-in because orjson is stricter than json: it rejects NaN/Infinity
+        literals and integers beyond 64 bits.
+        """
+        return self._load_file(config_path, _json_loads)
+    
+    def _load_file(self, config_path: Path, loads: Callable[[bytes], Any]) -> bool:
         try:
-            with open(config_path, 'r') as f:
-                self._config = json.load(f)
+            with open(config_path, 'rb') as f:
+                self._config = loads(f.read())
+            self._config_hash = self._hash_config(self._config)
             return self.validate()
         except json.JSONDecodeError as e:
             self._violations.append(PolicyViolation(
@@ -181,60 +353,64 @@ class Policy:
     def load_dict(self, config: dict[str, Any]) -> bool:
         """Load and validate policy from dictionary."""
         self._config = config
+        self._config_hash = None
         return self.validate()
     
+    @staticmethod
+    def _hash_config(config: Any) -> bytes:
+        """Digest of the canonical JSON form of a JSON-parsed config."""
+        canonical = json.dumps(config, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+    
     def validate(self) -> bool:
         """Validate the loaded configuration against schema."""
-        self._violations = []
-        self._validate_object(self._config, self.SCHEMA, "")
-        return len([v for v in self._violations if v.severity == "error"]) == 0
+        self._version += 1
+        
+        # Only a config fresh from JSON has a digest: canonical JSON cannot tell
+        # e.g. a tuple from a list, and in-place edits would make it stale
+        digest, self._config_hash = self._config_hash, None
+        cached = self._VALIDATION_CACHE.get(digest) if digest else None
+        
+        if cached is not None:
+            self._violations = list(cached)
+        else:
+            self._violations = []
+            self._VALIDATOR.run(self._config, self._violations)
+            if digest:
+                cache = self._VALIDATION_CACHE
+                if len(cache) >= self.VALIDATION_CACHE_SIZE:
+                    del cache[next(iter(cache))]
+                cache[digest] = tuple(self._violations)
+        
+        valid = len([v for v in self._violations if v.severity == "error"]) == 0
+        self._resolved = self._freeze() if valid else None
+        return valid
     
-    def _validate_object(self, obj: Any, schema: dict, path: str) -> None:
-        """Recursively validate an object against its schema."""
-        if not isinstance(obj, dict):
-            self._violations.append(PolicyViolation(
-                field=path or "<root>",
-                message=f"Expected object, got {type(obj).__name__}"
-            ))
-            return
+    def _freeze(self) -> Optional[_ResolvedPolicy]:
+        """
+        Resolve evaluator inputs into typed values.
         
-        for key, spec in schema.items():
-            field_path = f"{path}.{key}" if path else key
-            
-            if key not in obj:
-                if spec.get("required", False):
-                    self._violations.append(PolicyViolation(
-                        field=field_path,
-                        message="Required field missing"
-                    ))
-                continue
-            
-            value = obj[key]
-            expected_type = spec.get("type")
-            
-            # Type check
-            if expected_type and not isinstance(value, expected_type):
-                self._violations.append(PolicyViolation(
-                    field=field_path,
-                    message=f"Expected {expected_type.__name__}, got {type(value).__name__}"
-                ))
-                continue
-            
-            # Enum check
-            if "enum" in spec and value not in spec["enum"]:
-                self._violations.append(PolicyViolation(
-                    field=field_path,
-                    message=f"Value must be one of: {spec['enum']}"
-                ))
-            
-            # Nested schema
-            if expected_type == dict and "schema" in spec:
-                self._validate_object(value, spec["schema"], field_path)
-            
-            # Dynamic keys (like modules)
-            if expected_type == dict and spec.get("dynamic_keys") and "value_schema" in spec:
-                for sub_key, sub_value in value.items():
-                    self._validate_object(sub_value, spec["value_schema"], f"{field_path}.{sub_key}")
+        Returns None if a value cannot be converted (e.g. an unknown entry in
+        mode.allowed), in which case accessors fall back to reading _config.
+        """
+        try:
+            allowed = tuple(_member(_MODE_MAP, Mode, m) for m in self.get("mode.allowed", ["education"]))
+            return _ResolvedPolicy(
+                current_mode=_member(_MODE_MAP, Mode, self.get("mode.current", "education")),
+                allowed_modes=allowed,
+                allowed_mode_set=frozenset(allowed),
+                switch_requires_key=self.get("mode.switch_requires_key", True),
+                switch_key_scope=self.get("mode.switch_key_scope", "mode_control"),
+                allow_override=self.get("safety.allow_override_on_conflict", False),
+                override_requires_key=self.get("safety.override_requires_key", True),
+                override_key_scope=self.get("safety.override_key_scope", "safety_override"),
+                require_auditor=self.get("safety.require_auditor", True),
+                redaction_level=_member(
+                    _REDACTION_MAP, RedactionLevel, self.get("safety.redaction_level", "standard")
+                ),
+            )
+        except (ValueError, TypeError, AttributeError):
+            return None
     
     @property
     def violations(self) -> list[PolicyViolation]:
@@ -248,28 +424,46 @@ class Policy:
     
     # --- Accessors ---
     
+    @property
+    def version(self) -> int:
+        """Incremented whenever the configuration is (re)loaded or changed."""
+        return self._version
+    
     @property
     def device_id(self) -> str:
         return self._config.get("device_id", "unknown")
     
     @property
     def current_mode(self) -> Mode:
+        if self._resolved is not None:
+            return self._resolved.current_mode
         mode_str = self._config.get("mode", {}).get("current", "education")
-        return Mode(mode_str)
+        return _member(_MODE_MAP, Mode, mode_str)
     
     @property
     def allowed_modes(self) -> list[Mode]:
+        if self._resolved is not None:
+            return list(self._resolved.allowed_modes)
         modes = self._config.get("mode", {}).get("allowed", ["education"])
-        return [Mode(m) for m in modes]
+        return [_member(_MODE_MAP, Mode, m) for m in modes]
+    
+    def set_mode(self, mode: Mode) -> None:
+        """
+        Set the current mode in memory (not persisted).
+        
+        Callers are expected to have checked can_switch_mode() first.
+        """
+        self._config.setdefault("mode", {})["current"] = mode.value
+        self._version += 1
+        if self._resolved is not None:
+            self._resolved = replace(self._resolved, current_mode=mode)
     
     def get(self, path: str, default: Any = None) -> Any:
         """Get a config value by dot-notation path."""
-        parts = path.split(".")
         value = self._config
-        for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
+        for part in _split_path(path):
+            value = value.get(part, _SENTINEL) if isinstance(value, dict) else _SENTINEL
+            if value is _SENTINEL:
                 return default
         return value
     
@@ -277,14 +471,20 @@ class Policy:
     
     def can_switch_mode(self, target_mode: Mode) -> PolicyEvaluation:
         """Evaluate whether mode switch is allowed."""
-        if target_mode not in self.allowed_modes:
+        resolved = self._resolved
+        allowed = resolved.allowed_mode_set if resolved is not None else self.allowed_modes
+        if target_mode not in allowed:
             return PolicyEvaluation(
                 allowed=False,
                 reason=f"Mode '{target_mode.value}' not in allowed modes"
             )
         
-        requires_key = self.get("mode.switch_requires_key", True)
-        key_scope = self.get("mode.switch_key_scope", "mode_control")
+        if resolved is not None:
+            requires_key = resolved.switch_requires_key
+            key_scope = resolved.switch_key_scope
+        else:
+            requires_key = self.get("mode.switch_requires_key", True)
+            key_scope = self.get("mode.switch_key_scope", "mode_control")
         
         return PolicyEvaluation(
             allowed=True,
@@ -319,14 +519,23 @@ class Policy:
     
     def can_override_safety(self) -> PolicyEvaluation:
         """Evaluate whether safety override is available."""
-        if not self.get("safety.allow_override_on_conflict", False):
+        resolved = self._resolved
+        if resolved is not None:
+            allow = resolved.allow_override
+        else:
+            allow = self.get("safety.allow_override_on_conflict", False)
+        if not allow:
             return PolicyEvaluation(
                 allowed=False,
                 reason="Safety overrides are disabled"
             )
         
-        requires_key = self.get("safety.override_requires_key", True)
-        key_scope = self.get("safety.override_key_scope", "safety_override")
+        if resolved is not None:
+            requires_key = resolved.override_requires_key
+            key_scope = resolved.override_key_scope
+        else:
+            requires_key = self.get("safety.override_requires_key", True)
+            key_scope = self.get("safety.override_key_scope", "safety_override")
         
         return PolicyEvaluation(
             allowed=True,
@@ -336,31 +545,51 @@ class Policy:
     
     def requires_auditor(self) -> bool:
         """Check if auditor model is required."""
+        if self._resolved is not None:
+            return self._resolved.require_auditor
         return self.get("safety.require_auditor", True)
     
     def get_reading_level(self, profile_level: Optional[str] = None) -> ReadingLevel:
         """Get effective reading level, considering profile override."""
         if profile_level and self.get("output.allow_profile_override", True):
             try:
-                return ReadingLevel(profile_level)
+                return _member(_READING_MAP, ReadingLevel, profile_level)
             except ValueError:
                 pass
         
         default = self.get("output.default_reading_level", "general")
-        return ReadingLevel(default)
+        return _member(_READING_MAP, ReadingLevel, default)
     
     def get_redaction_level(self) -> RedactionLevel:
         """Get current redaction level."""
+        if self._resolved is not None:
+            return self._resolved.redaction_level
         level = self.get("safety.redaction_level", "standard")
-        return RedactionLevel(level)
+        return _member(_REDACTION_MAP, RedactionLevel, level)
     
-    def to_dict(self) -> dict[str, Any]:
-        """Export current configuration."""
-        return self._config.copy()
+    def to_dict(self, copy: bool = True) -> Mapping[str, Any]:
+        """
+        Export current configuration.
+        
+        Args:
+            copy: Return a shallow copy; False returns a read-only view instead
+            
+        Returns:
+            Configuration mapping
+        """
+        return self._config.copy() if copy else MappingProxyType(self._config)
     
     def export_status(self) -> dict[str, Any]:
-        """Export a status summary for UI/API."""
-        return {
+        """
+        Export a status summary for UI/API.
+        
+        The summary is cached until the config is reloaded or the mode changes;
+        treat it as read-only.
+        """
+        if self._status_cache is not None and self._status_cache[0] == self._version:
+            return self._status_cache[1]
+        
+        status = {
             "device_id": self.device_id,
             "mode": self.current_mode.value,
             "allowed_modes": [m.value for m in self.allowed_modes],
@@ -385,3 +614,9 @@ class Policy:
             },
             "rao_enabled": self.get("rao.enabled", False)
         }
+        self._status_cache = (self._version, status)
+        return status
+
+
+# Compiled once at import; validate() runs it directly
+Policy._VALIDATOR = CompiledValidator(Policy.SCHEMA)
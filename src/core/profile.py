@@ -15,14 +15,34 @@ Profiles can be loaded via:
 The content semantics are admin/user-defined — we just provide the transport and validation.
 """
 
+import re
 import json
 import base64
 import hashlib
-from dataclasses import dataclass, field, asdict
+from copy import deepcopy
+from dataclasses import dataclass, field
 from typing import Optional, Any
 from datetime import datetime
 from enum import Enum
 
+from core.policy import CompiledValidator
+from core.audit import AuditBuffer
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+
+_BASE64_RE = re.compile(r'[A-Za-z0-9+/]+={0,2}')
+
 
 class ProfileFormat(Enum):
     """Output format preferences."""
@@ -34,7 +54,7 @@ class ProfileFormat(Enum):
     DETAILED = "detailed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileEnvelope:
     """
     Minimal profile for output adaptation.
@@ -62,15 +82,69 @@ class ProfileEnvelope:
     expires_at: Optional[str] = None
     signature: Optional[str] = None  # For signed profiles
     
-    def to_dict(self) -> dict:
-        return asdict(self)
+    # Parsed expires_at, and the string it was parsed from
+    _expires_dt: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _expires_src: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Serialized forms, dropped whenever a public field is reassigned.
+    # In-place edits to permissions/custom are not tracked.
+    _cached_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _cached_qr: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._parse_expiry()
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            object.__setattr__(self, "_cached_json", None)
+            object.__setattr__(self, "_cached_qr", None)
+    
+    def _parse_expiry(self) -> None:
+        self._expires_src = self.expires_at
+        self._expires_dt = None
+        if self.expires_at:
+            try:
+                self._expires_dt = datetime.fromisoformat(self.expires_at)
+            except ValueError:
+                pass
+    
+    def to_dict(self, copy: bool = False) -> dict:
+        """
+        Export fields as a dict.
+        
+        Args:
+            copy: Deep-copy permissions/custom instead of sharing them
+            
+        Returns:
+            Field dictionary
+        """
+        data = {
+            "profile_id": self.profile_id,
+            "name": self.name,
+            "reading_level": self.reading_level,
+            "format_preference": self.format_preference,
+            "language": self.language,
+            "permissions": self.permissions,
+            "custom": self.custom,
+            "created_at": self.created_at,
+            "expires_at": self.expires_at,
+            "signature": self.signature
+        }
+        return deepcopy(data) if copy else data
     
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        if self._cached_json is None:
+            self._cached_json = _json_dumps(self.to_dict())
+        return self._cached_json
     
     @classmethod
     def from_dict(cls, data: dict) -> "ProfileEnvelope":
         """Create from dictionary."""
+        expires_at = data.get("expires_at")
+        if isinstance(expires_at, datetime):
+            expires_at = expires_at.isoformat()
+        
         return cls(
             profile_id=data.get("profile_id"),
             name=data.get("name"),
@@ -80,24 +154,20 @@ class ProfileEnvelope:
             permissions=data.get("permissions", []),
             custom=data.get("custom", {}),
             created_at=data.get("created_at"),
-            expires_at=data.get("expires_at"),
+            expires_at=expires_at,
             signature=data.get("signature")
         )
     
     @classmethod
     def from_json(cls, json_str: str) -> "ProfileEnvelope":
         """Create from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_json_loads(json_str))
     
     def is_expired(self) -> bool:
         """Check if profile has expired."""
-        if not self.expires_at:
-            return False
-        try:
-            expires = datetime.fromisoformat(self.expires_at)
-            return datetime.now() > expires
-        except ValueError:
-            return False
+        if self.expires_at is not self._expires_src:
+            self._parse_expiry()
+        return self._expires_dt is not None and datetime.now() > self._expires_dt
     
     def has_permission(self, permission: str) -> bool:
         """Check if profile has a general permission."""
@@ -106,7 +176,7 @@ class ProfileEnvelope:
         return permission in self.permissions
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileValidation:
     """Result of profile validation."""
     valid: bool
@@ -123,19 +193,66 @@ class ProfileManager:
     """
     
     # Valid reading levels
-    READING_LEVELS = ["child", "teen", "general", "technical", "expert"]
+    READING_LEVELS: frozenset[str] = frozenset(["child", "teen", "general", "technical", "expert"])
     
     # Valid format preferences
-    FORMAT_PREFERENCES = [f.value for f in ProfileFormat]
+    FORMAT_PREFERENCES: frozenset[str] = frozenset(f.value for f in ProfileFormat)
+    
+    # Shaping fields checked on load: (warning label, fallback value)
+    SCHEMA = {
+        "reading_level": {"type": str, "enum": sorted(READING_LEVELS)},
+        "format_preference": {"type": str, "enum": sorted(FORMAT_PREFERENCES)}
+    }
+    _FIELD_DEFAULTS = {
+        "reading_level": ("reading level", "general"),
+        "format_preference": ("format", "conversational")
+    }
+    _VALIDATOR = CompiledValidator(SCHEMA)
+    
+    # Batched audit delivery (see set_audit_callback)
+    AUDIT_MAX_PENDING = 1024
     
     def __init__(self, policy: Optional[Any] = None):
         self.policy = policy
         self._current_profile: Optional[ProfileEnvelope] = None
         self._audit_callback = None
+        self._audit_buffer: Optional[AuditBuffer] = None
+        # ((policy id, policy version), (reading level, format)) for the default defaults
+        self._effective_cache: Optional[tuple[Any, tuple[str, str]]] = None
+        self._version = 0
     
-    def set_audit_callback(self, callback) -> None:
-        """Set callback for audit logging."""
-        self._audit_callback = callback
+    @property
+    def version(self) -> int:
+        """Incremented whenever the active profile or policy is replaced."""
+        return self._version
+    
+    def set_policy(self, policy: Optional[Any]) -> None:
+        """Replace the policy used for effective reading level/format."""
+        self.policy = policy
+        self._effective_cache = None
+        self._version += 1
+    
+    def set_audit_callback(self, callback, batch: bool = False) -> None:
+        """
+        Set callback for audit logging.
+        
+        Args:
+            callback: Called with (event_type, details)
+            batch: Queue events and deliver them from a background thread so
+                audit I/O never blocks a profile load (see AuditBuffer; past
+                AUDIT_MAX_PENDING queued events the oldest are dropped)
+        """
+        self.flush_audit()
+        if batch:
+            self._audit_buffer = AuditBuffer(callback, max_pending=self.AUDIT_MAX_PENDING)
+        else:
+            self._audit_buffer = None
+        self._audit_callback = self._audit_buffer or callback
+    
+    def flush_audit(self) -> None:
+        """Deliver any buffered audit events (call on shutdown)."""
+        if self._audit_buffer:
+            self._audit_buffer.flush()
     
     def _audit(self, event_type: str, details: dict) -> None:
         """Log an audit event."""
@@ -159,17 +276,18 @@ class ProfileManager:
         """
         warnings = []
         
-        # Check reading level
-        reading_level = data.get("reading_level", "general")
-        if reading_level not in self.READING_LEVELS:
-            warnings.append(f"Unknown reading level '{reading_level}', defaulting to 'general'")
-            data["reading_level"] = "general"
-        
-        # Check format preference
-        format_pref = data.get("format_preference", "conversational")
-        if format_pref not in self.FORMAT_PREFERENCES:
-            warnings.append(f"Unknown format '{format_pref}', defaulting to 'conversational'")
-            data["format_preference"] = "conversational"
+        # Check reading level and format preference; unknown values fall back
+        violations = []
+        self._VALIDATOR.run(data, violations)
+        for violation in violations:
+            if violation.field not in self._FIELD_DEFAULTS:
+                return ProfileValidation(
+                    valid=False,
+                    error=f"Failed to parse profile: {violation.message}"
+                )
+            label, default = self._FIELD_DEFAULTS[violation.field]
+            warnings.append(f"Unknown {label} '{data[violation.field]}', defaulting to '{default}'")
+            data[violation.field] = default
         
         # Create profile
         try:
@@ -222,6 +340,8 @@ class ProfileManager:
             return validation
         
         self._current_profile = validation.profile
+        self._effective_cache = None
+        self._version += 1
         
         self._audit("profile_loaded", {
             "profile_id": validation.profile.profile_id,
@@ -234,7 +354,7 @@ class ProfileManager:
     def load_from_json(self, json_str: str) -> ProfileValidation:
         """Load profile from JSON string."""
         try:
-            data = json.loads(json_str)
+            data = _json_loads(json_str)
             return self.load(data)
         except json.JSONDecodeError as e:
             return ProfileValidation(
@@ -251,20 +371,27 @@ class ProfileManager:
         - Base64-encoded JSON
         - Compact format (future)
         """
-        # Try direct JSON first
-        try:
-            data = json.loads(qr_data)
-            return self.load(data)
-        except json.JSONDecodeError:
-            pass
+        # Sniff the payload so base64 (the common case) skips a failed JSON parse;
+        # anything unrecognised tries both in turn
+        stripped = qr_data.strip()
+        is_json = stripped[:1] in ("{", "[")
+        is_base64 = not is_json and _BASE64_RE.fullmatch(stripped) is not None
         
-        # Try base64-encoded JSON
-        try:
-            decoded = base64.b64decode(qr_data).decode('utf-8')
-            data = json.loads(decoded)
-            return self.load(data)
-        except Exception:
-            pass
+        # Direct JSON
+        if not is_base64:
+            try:
+                data = _json_loads(stripped)
+                return self.load(data)
+            except json.JSONDecodeError:
+                pass
+        
+        # Base64-encoded JSON
+        if not is_json:
+            try:
+                data = _json_loads(base64.b64decode(stripped))
+                return self.load(data)
+            except Exception:
+                pass
         
         return ProfileValidation(
             valid=False,
@@ -278,9 +405,36 @@ class ProfileManager:
                 "profile_id": self._current_profile.profile_id
             })
         self._current_profile = None
+        self._effective_cache = None
+        self._version += 1
+    
+    def _effective(self) -> tuple[str, str]:
+        """
+        Effective (reading level, format), recomputed only when the profile
+        is loaded/cleared or the policy (or its version) changes.
+        
+        Fields of an already-loaded profile are treated as fixed.
+        """
+        key = (id(self.policy), getattr(self.policy, "version", None))
+        cache = self._effective_cache
+        if cache is None or cache[0] != key:
+            cache = (key, (self._compute_reading_level("general"), self._compute_format("conversational")))
+            self._effective_cache = cache
+        return cache[1]
     
     def get_effective_reading_level(self, default: str = "general") -> str:
         """Get effective reading level (profile or default)."""
+        if default != "general":
+            return self._compute_reading_level(default)
+        return self._effective()[0]
+    
+    def get_effective_format(self, default: str = "conversational") -> str:
+        """Get effective format preference (profile or default)."""
+        if default != "conversational":
+            return self._compute_format(default)
+        return self._effective()[1]
+    
+    def _compute_reading_level(self, default: str) -> str:
         if self._current_profile:
             if self.policy:
                 if self.policy.get("output.allow_profile_override", True):
@@ -293,8 +447,7 @@ class ProfileManager:
         
         return default
     
-    def get_effective_format(self, default: str = "conversational") -> str:
-        """Get effective format preference (profile or default)."""
+    def _compute_format(self, default: str) -> str:
         if self._current_profile:
             if self.policy:
                 if self.policy.get("output.allow_profile_override", True):
@@ -328,6 +481,9 @@ class ProfileManager:
     
     def generate_qr_data(self, profile: ProfileEnvelope) -> str:
         """Generate QR-compatible data from a profile."""
+        if profile._cached_qr is not None:
+            return profile._cached_qr
+        
         # Use compact JSON
         data = {
             "rl": profile.reading_level,
@@ -344,7 +500,8 @@ class ProfileManager:
         if profile.custom:
             data["cust"] = profile.custom
         
-        return json.dumps(data, separators=(',', ':'))
+        profile._cached_qr = _json_dumps(data)
+        return profile._cached_qr
 
 
 # Stub for future QR decoder integration
@@ -23,11 +23,26 @@ This is a STUB — implementation deferred to Phase 4.
 
 import json
 import hashlib
-from typing import Optional, Any, Protocol
+from types import MappingProxyType
+from typing import Optional, Any, Protocol, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 
 class RAOTransportType(Enum):
     """RAO transport mechanisms."""
@@ -48,7 +63,18 @@ class RAOBundleType(Enum):
     FULL_CONFIG = "full_config"
 
 
-@dataclass
+# Value -> member lookup; cheaper than calling the Enum on every parse
+_BTYPE_BY_VALUE = {t.value: t for t in RAOBundleType}
+
+
+def _bundle_type(value: Any) -> RAOBundleType:
+    try:
+        return _BTYPE_BY_VALUE[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"{value!r} is not a valid RAOBundleType") from None
+
+
+@dataclass(slots=True, frozen=True)
 class RAOBundle:
     """
     A signed control bundle for remote access override.
@@ -69,6 +95,18 @@ class RAOBundle:
     requires_ack: bool = False
     rollback_on_failure: bool = True
     
+    # Parsed expires_at and cached signed_bytes() (orjson skips underscore-
+    # prefixed fields in to_bytes)
+    _expires_dt: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _signed_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.expires_at:
+            try:
+                object.__setattr__(self, "_expires_dt", datetime.fromisoformat(self.expires_at))
+            except ValueError:
+                pass
+    
     def to_dict(self) -> dict:
         return {
             "bundle_id": self.bundle_id,
@@ -83,11 +121,79 @@ class RAOBundle:
             "rollback_on_failure": self.rollback_on_failure
         }
     
+    def signed_bytes(self) -> bytes:
+        """
+        Canonical bytes covered by the signature, computed once per bundle.
+        
+        Every field except signature, as sorted-key compact UTF-8 JSON. This
+        is stdlib-only so the signed form never depends on optional packages.
+        The payload must not be mutated after the first call.
+        """
+        if self._signed_bytes is None:
+            signed = self.to_dict()
+            del signed["signature"]
+            object.__setattr__(self, "_signed_bytes", json.dumps(
+                signed, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+            ).encode())
+        return self._signed_bytes
+    
+    def to_bytes(self) -> bytes:
+        """Serialize to compact UTF-8 JSON for transports."""
+        if ORJSON_AVAILABLE:
+            # orjson serializes the dataclass (and enum values) natively
+            return orjson.dumps(self)
+        return json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False).encode()
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RAOBundle":
+        """Parse output of to_bytes()."""
+        return cls.from_dict(_json_loads(data))
+    
+    def to_msgpack(self) -> bytes:
+        """
+        Encode as a positional msgpack array — the wire format for
+        size-constrained transports (SMS, broadcast). JSON (to_dict) remains
+        the format for audit logs.
+        """
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError("msgspec not installed. Run: pip install msgspec")
+        return _MSGPACK_ENCODER.encode(RAOBundleMsg(
+            self.bundle_id,
+            self.bundle_type.value,
+            self.sequence_number,
+            self.timestamp,
+            self.payload,
+            self.signature,
+            self.issuer,
+            self.expires_at,
+            self.requires_ack,
+            self.rollback_on_failure
+        ))
+    
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "RAOBundle":
+        """Decode output of to_msgpack()."""
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError("msgspec not installed. Run: pip install msgspec")
+        msg = _MSGPACK_DECODER.decode(data)
+        return cls(
+            bundle_id=msg.bundle_id,
+            bundle_type=_bundle_type(msg.bundle_type),
+            sequence_number=msg.sequence_number,
+            timestamp=msg.timestamp,
+            payload=msg.payload,
+            signature=msg.signature,
+            issuer=msg.issuer,
+            expires_at=msg.expires_at,
+            requires_ack=msg.requires_ack,
+            rollback_on_failure=msg.rollback_on_failure
+        )
+    
     @classmethod
     def from_dict(cls, data: dict) -> "RAOBundle":
         return cls(
             bundle_id=data["bundle_id"],
-            bundle_type=RAOBundleType(data["bundle_type"]),
+            bundle_type=_bundle_type(data["bundle_type"]),
             sequence_number=data["sequence_number"],
             timestamp=data["timestamp"],
             payload=data["payload"],
@@ -98,17 +204,58 @@ class RAOBundle:
             rollback_on_failure=data.get("rollback_on_failure", True)
         )
     
-    def is_expired(self) -> bool:
-        if not self.expires_at:
-            return False
-        try:
-            expires = datetime.fromisoformat(self.expires_at)
-            return datetime.now() > expires
-        except ValueError:
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        """Check expiry; pass now to share one clock read across many bundles."""
+        if self._expires_dt is None:
             return False
+        return (now or datetime.now()) > self._expires_dt
+
+
+if MSGSPEC_AVAILABLE:
+    class RAOBundleMsg(msgspec.Struct, array_like=True):
+        """RAOBundle wire form; array_like encodes fields by position, not name."""
+        bundle_id: str
+        bundle_type: str
+        sequence_number: int
+        timestamp: str
+        payload: dict
+        signature: str
+        issuer: str
+        expires_at: Optional[str] = None
+        requires_ack: bool = False
+        rollback_on_failure: bool = True
+    
+    # Reused across calls; building these is most of msgspec's per-call cost
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder(RAOBundleMsg)
+
+
+# --- Wire framing ---
+
+FRAME_HEADER_SIZE = 4
+
+
+def frame(payload: bytes) -> bytes:
+    """Prefix a payload with its 4-byte big-endian length."""
+    return len(payload).to_bytes(FRAME_HEADER_SIZE, "big") + payload
 
 
-@dataclass
+def unframe(buffer: bytes) -> tuple[Optional[bytes], bytes]:
+    """
+    Split the first complete frame off a receive buffer.
+    
+    Returns:
+        (payload, remaining buffer); payload is None until a full frame has arrived
+    """
+    if len(buffer) < FRAME_HEADER_SIZE:
+        return None, buffer
+    end = FRAME_HEADER_SIZE + int.from_bytes(buffer[:FRAME_HEADER_SIZE], "big")
+    if len(buffer) < end:
+        return None, buffer
+    return buffer[FRAME_HEADER_SIZE:end], buffer[end:]
+
+
+@dataclass(slots=True, frozen=True)
 class RAOResult:
     """Result of applying an RAO bundle."""
     success: bool
@@ -142,6 +289,9 @@ class RAOManager:
     This is a STUB implementation. Full implementation in Phase 4.
     """
     
+    # Digests of applied bundles remembered for replay detection (FIFO-bounded)
+    REPLAY_CACHE_SIZE = 1 << 16
+    
     def __init__(
         self,
         policy: Any = None,
@@ -152,8 +302,10 @@ class RAOManager:
         self.keys = keys
         self.packs = packs
         
-        self._transports: dict[RAOTransportType, RAOTransport] = {}
+        # transport type value -> (type, transport); string keys hash cheaply
+        self._transports: dict[str, tuple[RAOTransportType, RAOTransport]] = {}
         self._last_sequence: dict[str, int] = {}  # issuer -> last sequence
+        self._seen: dict[bytes, None] = {}  # applied bundle digests, oldest first
         self._pending_bundles: list[RAOBundle] = []
         self._audit_callback = None
         
@@ -171,7 +323,7 @@ class RAOManager:
     
     def register_transport(self, transport_type: RAOTransportType, transport: RAOTransport) -> None:
         """Register a transport adapter."""
-        self._transports[transport_type] = transport
+        self._transports[transport_type.value] = (transport_type, transport)
     
     def register_issuer_key(self, issuer: str, public_key: bytes) -> None:
         """Register a public key for an issuer."""
@@ -189,7 +341,8 @@ class RAOManager:
             return []
         
         bundles = []
-        for transport_type, transport in self._transports.items():
+        audit = self._audit_callback  # build audit details only if someone listens
+        for transport_name, (_, transport) in self._transports.items():
             if not transport.is_available():
                 continue
             
@@ -197,27 +350,42 @@ class RAOManager:
                 bundle = transport.poll()
                 if bundle:
                     bundles.append(bundle)
-                    self._audit("rao_bundle_received", {
-                        "bundle_id": bundle.bundle_id,
-                        "transport": transport_type.value,
-                        "type": bundle.bundle_type.value
-                    })
+                    if audit:
+                        audit("rao_bundle_received", {
+                            "bundle_id": bundle.bundle_id,
+                            "transport": transport_name,
+                            "type": bundle.bundle_type.value
+                        })
             except Exception as e:
-                self._audit("rao_poll_error", {
-                    "transport": transport_type.value,
-                    "error": str(e)
-                })
+                if audit:
+                    audit("rao_poll_error", {
+                        "transport": transport_name,
+                        "error": str(e)
+                    })
         
         return bundles
     
-    def verify_bundle(self, bundle: RAOBundle) -> tuple[bool, Optional[str]]:
+    def verify_bundle(
+        self,
+        bundle: RAOBundle,
+        now: Optional[datetime] = None
+    ) -> tuple[bool, Optional[str]]:
         """
         Verify a bundle's signature and sequence.
         
+        Args:
+            bundle: Bundle to verify
+            now: Current time for the expiry check (defaults to datetime.now())
+        
         Returns (valid, error_message)
         """
+        # Same bundle rebroadcast over another transport: reject before any
+        # further (eventually cryptographic) checks
+        if self._bundle_digest(bundle) in self._seen:
+            return False, f"Bundle {bundle.bundle_id} already applied (replay)"
+        
         # Check if expired
-        if bundle.is_expired():
+        if bundle.is_expired(now):
             return False, "Bundle has expired"
         
         # Check sequence number (anti-replay)
@@ -230,13 +398,25 @@ class RAOManager:
             return False, f"Unknown issuer: {bundle.issuer}"
         
         # Verify signature
-        # TODO: Implement Ed25519 verification
+        # TODO: Implement Ed25519 verification over bundle.signed_bytes()
         # For stub, we just check signature is present
         if not bundle.signature:
             return False, "Missing signature"
         
         return True, None
     
+    def verify_bundles(self, bundles: list[RAOBundle]) -> list[tuple[bool, Optional[str]]]:
+        """
+        Verify a burst of bundles (e.g. catch-up after connectivity returns).
+        
+        Reads the clock once for the whole batch. Verification has no side
+        effects, so results match calling verify_bundle() on each in turn.
+        
+        Returns a (valid, error_message) tuple per bundle, in input order
+        """
+        now = datetime.now()
+        return [self.verify_bundle(bundle, now) for bundle in bundles]
+    
     def apply_bundle(self, bundle: RAOBundle) -> RAOResult:
         """
         Apply a verified RAO bundle.
@@ -257,12 +437,15 @@ class RAOManager:
                 error=error
             )
         
-        # Update sequence number
+        # Update sequence number and remember the bundle
         self._last_sequence[bundle.issuer] = bundle.sequence_number
+        if len(self._seen) >= self.REPLAY_CACHE_SIZE:
+            del self._seen[next(iter(self._seen))]
+        self._seen[self._bundle_digest(bundle)] = None
         
         # Apply based on type
         # TODO: Implement actual application logic
-        self._audit("rao_bundle_received", {
+        self._audit("rao_bundle_applied", {
             "bundle_id": bundle.bundle_id,
             "type": bundle.bundle_type.value,
             "status": "stub_not_implemented"
@@ -275,53 +458,96 @@ class RAOManager:
             error="RAO application not yet implemented (stub)"
         )
     
-    def create_bundle_template(self, bundle_type: RAOBundleType) -> dict:
-        """Create a template for a bundle type."""
-        templates = {
-            RAOBundleType.POLICY_UPDATE: {
-                "bundle_id": "<generate-uuid>",
-                "bundle_type": "policy_update",
-                "sequence_number": "<next-sequence>",
-                "timestamp": "<iso-timestamp>",
-                "payload": {
-                    "changes": [
-                        {"path": "mode.current", "value": "emergency"},
-                        {"path": "modules.medical.enabled", "value": True}
-                    ]
-                },
-                "signature": "<ed25519-signature>",
-                "issuer": "<organization-id>"
-            },
-            RAOBundleType.MODULE_CONTROL: {
-                "bundle_id": "<generate-uuid>",
-                "bundle_type": "module_control",
-                "sequence_number": "<next-sequence>",
-                "timestamp": "<iso-timestamp>",
-                "payload": {
-                    "action": "enable|disable|load|unload",
-                    "modules": ["medical", "disaster"]
-                },
-                "signature": "<ed25519-signature>",
-                "issuer": "<organization-id>"
-            },
-            RAOBundleType.EMERGENCY_MODE: {
-                "bundle_id": "<generate-uuid>",
-                "bundle_type": "emergency_mode",
-                "sequence_number": "<next-sequence>",
-                "timestamp": "<iso-timestamp>",
-                "payload": {
-                    "activate": True,
-                    "reason": "Earthquake detected in region",
-                    "modules_to_enable": ["disaster", "medical"],
-                    "duration_hours": 72
-                },
-                "signature": "<ed25519-signature>",
-                "issuer": "<organization-id>",
-                "requires_ack": True
-            }
-        }
+    @staticmethod
+    def _bundle_digest(bundle: RAOBundle) -> bytes:
+        """Replay-detection key for (issuer, sequence, bundle id)."""
+        # Short keys: blake2b beats SHA-256 and needs no extra dependency.
+        # Audit chaining goes through core.audit, which prefers blake3.
+        key = f"{bundle.issuer}|{bundle.sequence_number}|{bundle.bundle_id}"
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
+    
+    def create_bundle_template(self, bundle_type: RAOBundleType, copy: bool = True) -> Mapping[str, Any]:
+        """
+        Create a template for a bundle type.
         
-        return templates.get(bundle_type, {"error": "Unknown bundle type"})
+        Args:
+            bundle_type: Bundle type to template
+            copy: Return a fresh mutable dict; False returns the shared
+                read-only template (nested dicts are MappingProxyType, lists tuples)
+        
+        Returns:
+            Template mapping
+        """
+        template = _BUNDLE_TEMPLATES.get(bundle_type, _UNKNOWN_TEMPLATE)
+        return _thaw(template) if copy else template
+
+
+# --- Bundle templates ---
+
+_TEMPLATE_SOURCE = {
+    RAOBundleType.POLICY_UPDATE: {
+        "bundle_id": "<generate-uuid>",
+        "bundle_type": "policy_update",
+        "sequence_number": "<next-sequence>",
+        "timestamp": "<iso-timestamp>",
+        "payload": {
+            "changes": [
+                {"path": "mode.current", "value": "emergency"},
+                {"path": "modules.medical.enabled", "value": True}
+            ]
+        },
+        "signature": "<ed25519-signature>",
+        "issuer": "<organization-id>"
+    },
+    RAOBundleType.MODULE_CONTROL: {
+        "bundle_id": "<generate-uuid>",
+        "bundle_type": "module_control",
+        "sequence_number": "<next-sequence>",
+        "timestamp": "<iso-timestamp>",
+        "payload": {
+            "action": "enable|disable|load|unload",
+            "modules": ["medical", "disaster"]
+        },
+        "signature": "<ed25519-signature>",
+        "issuer": "<organization-id>"
+    },
+    RAOBundleType.EMERGENCY_MODE: {
+        "bundle_id": "<generate-uuid>",
+        "bundle_type": "emergency_mode",
+        "sequence_number": "<next-sequence>",
+        "timestamp": "<iso-timestamp>",
+        "payload": {
+            "activate": True,
+            "reason": "Earthquake detected in region",
+            "modules_to_enable": ["disaster", "medical"],
+            "duration_hours": 72
+        },
+        "signature": "<ed25519-signature>",
+        "issuer": "<organization-id>",
+        "requires_ack": True
+    }
+}
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# Built once; create_bundle_template() hands out copies or the frozen views
+_BUNDLE_TEMPLATES = {t: _freeze(template) for t, template in _TEMPLATE_SOURCE.items()}
+_UNKNOWN_TEMPLATE = _freeze({"error": "Unknown bundle type"})
 
 
 # --- Transport Stubs ---
@@ -331,7 +557,8 @@ class InternetTransport:
     Stub for internet-based RAO transport.
     
     Would implement:
-    - HTTPS polling of control server
+    - HTTPS polling of control server over one reused keep-alive session
+      (as OllamaAdapter does), reading into a preallocated buffer
     - WebSocket for push notifications
     - Certificate pinning
     """
@@ -359,8 +586,10 @@ class SMSTransport:
     
     Would implement:
     - Receive SMS via modem/API
-    - Parse compressed bundle format
+    - Reassemble framed msgpack bundles (unframe, RAOBundle.from_msgpack)
     - Send ack via SMS
+    - Readiness-driven reads of the modem fd (one persistent epoll/io_uring
+      multishot registration) instead of timed poll() calls
     """
     
     def __init__(self, config: dict):
@@ -386,7 +615,8 @@ class BroadcastTransport:
     Would implement:
     - Receive-only (no ack)
     - Listen on emergency broadcast frequencies
-    - Parse broadcast format
+    - Reassemble framed msgpack bundles (unframe, RAOBundle.from_msgpack)
+    - Readiness-driven reads of the receiver fd, as for SMSTransport
     """
     
     def __init__(self, config: dict):
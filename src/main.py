@@ -9,10 +9,15 @@ This is the orchestrator that ties everything together:
 """
 
 import os
+import re
 import sys
 import json
+import queue
 import secrets
 import logging
+import threading
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -25,8 +30,8 @@ from core.keys import KeyRegistry
 from core.audit import AuditLogger, EventType, create_audit_callback
 from core.profile import ProfileManager
 from core.packs import PackLoader
-from core.pipeline import Pipeline, WORKER_SYSTEM_TEMPLATE, AUDITOR_SYSTEM_TEMPLATE
-from adapters.llm_adapter import OllamaAdapter, LLMConfig, create_adapter
+from core.pipeline import Pipeline, create_response_cache, default_system_prompts
+from adapters.llm_adapter import OllamaAdapter, LLMConfig, RouterLLMAdapter, create_adapter
 
 # Configure logging
 logging.basicConfig(
@@ -43,6 +48,22 @@ class ExpertInABox:
     Orchestrates all components and provides the main interface.
     """
     
+    EMERGENCY_KEYWORDS = ("emergency", "help", "urgent", "injury", "hurt", "bleeding", "disaster", "earthquake", "flood")
+    MEDICAL_KEYWORDS = ("sick", "pain", "symptom", "medicine", "doctor", "health", "fever", "cough")
+    
+    # One alternation per class: a single C-level scan instead of a Python
+    # loop of substring tests (plain substrings, same as `kw in message`)
+    _EMERGENCY_RE = re.compile("|".join(map(re.escape, EMERGENCY_KEYWORDS)))
+    _MEDICAL_RE = re.compile("|".join(map(re.escape, MEDICAL_KEYWORDS)))
+    
+    MODULE_SELECT_CACHE_SIZE = 512
+    RESPONSE_CACHE_SIZE = 1024
+    
+    # query()'s QUERY/RESPONSE events are logged from a background thread;
+    # a full queue blocks the caller up to AUDIT_QUEUE_TIMEOUT, then drops
+    AUDIT_QUEUE_SIZE = 10_000
+    AUDIT_QUEUE_TIMEOUT = 0.05
+    
     def __init__(self, config_dir: Path = None, data_dir: Path = None):
         """
         Initialize Expert-in-a-Box.
@@ -56,10 +77,10 @@ class ExpertInABox:
         self.data_dir = data_dir or self.base_dir / "data"
         self.packs_dir = self.base_dir / "packs"
         
-        # Ensure directories exist
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.packs_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure directories exist (one stat each on warm starts)
+        for directory in (self.config_dir, self.data_dir, self.packs_dir):
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
         
         # Components (initialized in setup())
         self.policy: Optional[Policy] = None
@@ -73,6 +94,29 @@ class ExpertInABox:
         self.worker_llm = None
         self.auditor_llm = None
         
+        # Modules the policy marks loaded; packs.load() runs on first use
+        self._lazy_modules: frozenset[str] = frozenset()
+        # (packs.version, routable module ids) for _routable_modules()
+        self._routable_cache: Optional[tuple[int, dict[str, None]]] = None
+        # (message, packs.version) -> module id, LRU order
+        self._module_select_cache: dict[tuple[str, int], str] = {}
+        self._module_select_lock = threading.Lock()
+        # ((policy version, profile version), mode/reading_level/format)
+        self._base_context_cache: Optional[tuple[tuple[int, int], dict]] = None
+        # ((policy version, packs version), get_status() "modules" section)
+        self._module_status_cache: Optional[tuple[tuple[int, int], dict]] = None
+        
+        # Policy audit.* category flags (read in setup())
+        self._log_queries = True
+        self._log_responses = True
+        self._log_mode_changes = True
+        
+        # Deferred query audit events (see _log_deferred)
+        self._audit_queue: Optional[queue.Queue] = None
+        self._audit_thread: Optional[threading.Thread] = None
+        self._audit_dropped = 0
+        self._audit_dropped_lock = threading.Lock()
+        
         # Session tracking
         self._current_session_id = None
         self._initialized = False
@@ -107,79 +151,143 @@ class ExpertInABox:
         self.keys = KeyRegistry(keys_path)
         logger.info(f"Keys loaded: {len(self.keys.list_keys())} keys registered")
         
+        # LLM adapters (step 6) need neither audit nor packs, so probe the
+        # backend in the background while the local components come up
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="setup")
+        llm_ready = executor.submit(self._setup_llm)
+        
         # 3. Initialize audit logger
         log_path = self.data_dir / "audit.jsonl"
         self.audit = AuditLogger(
             log_path=log_path,
             device_id=self.policy.device_id,
-            redaction_level=self.policy.get_redaction_level().value
+            redaction_level=self.policy.get_redaction_level().value,
+            background_writes=True  # query() never waits on disk; close() drains
         )
         
+        self._audit_queue = queue.Queue(maxsize=self.AUDIT_QUEUE_SIZE)
+        self._audit_thread = threading.Thread(
+            target=self._audit_loop,
+            name="query-audit",
+            daemon=True
+        )
+        self._audit_thread.start()
+        
         # Wire up audit callbacks
         audit_callback = create_audit_callback(self.audit, self._current_session_id)
-        self.keys.set_audit_callback(audit_callback)
+        self.keys.set_audit_callback(audit_callback, batch=True)
         
         logger.info(f"Audit logger initialized: {log_path}")
         
+        # Audit categories the policy turns off are skipped before any
+        # event dict is built
+        self._log_queries = bool(self.policy.get("audit.log_queries", True))
+        self._log_responses = bool(self.policy.get("audit.log_responses", True))
+        self._log_mode_changes = bool(self.policy.get("audit.log_mode_changes", True))
+        
         # 4. Initialize profile manager
         self.profile = ProfileManager(self.policy)
-        self.profile.set_audit_callback(audit_callback)
+        self.profile.set_audit_callback(audit_callback, batch=True)
         
         # 5. Initialize pack loader
         self.packs = PackLoader(self.packs_dir, self.policy)
-        self.packs.set_audit_callback(audit_callback)
-        self.packs.discover()
+        self.packs.set_audit_callback(audit_callback, batch=True)
+        
+        # The packs directory is scanned on first use (EXPERT_EAGER_PACKS=1
+        # scans now, e.g. so CI surfaces manifest errors at startup)
+        if os.environ.get("EXPERT_EAGER_PACKS", "0") == "1":
+            available_packs = self.packs.ensure_discovered()
+            logger.info(f"Packs discovered: {list(available_packs.keys())}")
+        
+        # Packs flagged loaded are routable now but only read on first query
+        self._lazy_modules = frozenset(
+            pack_id
+            for pack_id, config in self.policy.get("modules", {}).items()
+            if config.get("loaded", False)
+        )
+        logger.info(f"Packs enabled (lazy): {sorted(self._lazy_modules)}")
+        
+        # 6. Wait for the LLM adapters started above
+        llm_ready.result()
+        executor.shutdown()
+        
+        # 7. Initialize pipeline (EXPERT_PARALLEL_AUDIT=1 runs the Auditor's
+        # query precheck concurrently with the Worker instead of a second
+        # LLM review of the finished answer, saving one round trip)
+        response_cache = None
+        if os.environ.get("EXPERT_RESPONSE_CACHE", "1") == "1":
+            # Exact-match, in memory: a repeated question in the same
+            # module/mode/reading level reuses the approved answer
+            response_cache = create_response_cache(max_entries=self.RESPONSE_CACHE_SIZE)
+        self.pipeline = Pipeline(
+            worker_adapter=self.worker_llm,
+            auditor_adapter=self.auditor_llm,
+            policy=self.policy,
+            parallel_audit=os.environ.get("EXPERT_PARALLEL_AUDIT", "0") == "1",
+            response_cache=response_cache
+        )
+        # Worker/auditor events share the query-audit queue with QUERY and
+        # RESPONSE so the log keeps each request's events in order
+        self.pipeline.set_audit_callback(
+            lambda event_type, details: self._log_deferred(event_type, details, None)
+        )
         
-        available_packs = self.packs.get_available()
-        logger.info(f"Packs discovered: {list(available_packs.keys())}")
+        # Log startup
+        self.audit.log(EventType.STARTUP, {
+            "device_id": self.policy.device_id,
+            "mode": self.policy.current_mode.value,
+            "packs_loaded": sorted(self.packs.get_loaded()),
+            "packs_enabled": sorted(self._lazy_modules)
+        })
         
-        # Load enabled packs
-        for pack_id, config in self.policy.get("modules", {}).items():
-            if config.get("loaded", False):
-                pack = self.packs.load(pack_id)
-                if pack:
-                    logger.info(f"Pack loaded: {pack_id}")
+        self._initialized = True
+        logger.info("Expert-in-a-Box setup complete!")
+        return True
+    
+    def _setup_llm(self) -> None:
+        """
+        Create the Worker/Auditor adapters, falling back to mock mode.
         
-        # 6. Initialize LLM adapters
+        Runs on a setup thread: the availability probe is a network round
+        trip, so it overlaps audit, profile and pack initialization.
+        """
+        # OLLAMA_URL may list several hosts
+        ollama_urls = [
+            url.strip()
+            for url in os.environ.get("OLLAMA_URL", "http://localhost:11434").split(",")
+            if url.strip()
+        ]
         llm_config = LLMConfig(
             model=os.environ.get("EXPERT_MODEL", "llama3.2"),
-            base_url=os.environ.get("OLLAMA_URL", "http://localhost:11434"),
+            base_url=ollama_urls[0],
             timeout=120
         )
+        # The Auditor emits a short verdict, so it can run a smaller or more
+        # heavily quantized model tag (e.g. "llama3.2:3b-instruct-q4_K_M")
+        auditor_config = replace(
+            llm_config,
+            model=os.environ.get("EXPERT_AUDITOR_MODEL", llm_config.model),
+            default_max_tokens=int(os.environ.get("EXPERT_AUDITOR_MAX_TOKENS", "512"))
+        )
         
         try:
-            self.worker_llm = create_adapter("ollama", llm_config)
-            self.auditor_llm = create_adapter("ollama", llm_config)
+            # Worker and Auditor share one keep-alive session per host
+            sessions = {}
+            self.worker_llm = self._create_ollama(llm_config, ollama_urls, sessions)
+            self.auditor_llm = self._create_ollama(auditor_config, ollama_urls, sessions)
             
             if self.worker_llm.is_available():
                 logger.info(f"LLM adapter ready: {llm_config.model}")
             else:
                 logger.warning(f"LLM not available: {llm_config.model} — using mock mode")
+                self.worker_llm.close()
+                self.auditor_llm.close()
                 self.worker_llm = create_adapter("mock", llm_config)
-                self.auditor_llm = create_adapter("mock", llm_config)
+                self.auditor_llm = create_adapter("mock", auditor_config)
         except Exception as e:
             logger.warning(f"LLM setup failed: {e} — using mock mode")
             self.worker_llm = create_adapter("mock", llm_config)
-            self.auditor_llm = create_adapter("mock", llm_config)
-        
-        # 7. Initialize pipeline
-        self.pipeline = Pipeline(
-            worker_adapter=self.worker_llm,
-            auditor_adapter=self.auditor_llm,
-            policy=self.policy
-        )
-        self.pipeline.set_audit_callback(audit_callback)
-        
-        # Log startup
-        self.audit.log(EventType.STARTUP, {
-            "device_id": self.policy.device_id,
-            "mode": self.policy.current_mode.value,
-            "packs_loaded": list(self.packs.get_loaded().keys())
-        })
-        
-        self._initialized = True
-        logger.info("Expert-in-a-Box setup complete!")
-        return True
+            self.auditor_llm = create_adapter("mock", auditor_config)
     
     def _create_default_policy(self, path: Path) -> None:
         """Create a default policy file."""
@@ -250,7 +358,7 @@ class ExpertInABox:
         """Create a default keys file with a generated master key."""
         # Generate a master key
         master_key = secrets.token_urlsafe(32)
-        master_hash = KeyRegistry.hash_key(master_key)
+        master_hash = KeyRegistry.hash_key_secure(master_key)
         
         default_keys = {
             "keys": [
@@ -301,20 +409,18 @@ class ExpertInABox:
             session_id = self.new_session()
         
         # Log query
-        self.audit.log(EventType.QUERY, {
-            "message": message,
-            "module": module
-        }, session_id)
+        if self._log_queries:
+            self._log_deferred(EventType.QUERY, {
+                "message": message,
+                "module": module
+            }, session_id)
         
         # Determine module
         if not module:
             module = self._select_module(message)
         
-        # Get pack
-        pack = self.packs.get_pack(module)
-        if not pack:
-            # Try to load it
-            pack = self.packs.load(module)
+        # Get pack (loaded and memoized by PackLoader on first use)
+        pack = self.packs.get_pack(module) or self.packs.load(module)
         
         if not pack:
             # Fall back to first loaded pack
@@ -324,12 +430,9 @@ class ExpertInABox:
                 module = pack.id
         
         # Build context
-        profile_ctx = self.profile.get_context()
         context = {
             "module": module or "general",
-            "mode": self.policy.current_mode.value,
-            "reading_level": profile_ctx.get("reading_level", "general"),
-            "format": profile_ctx.get("format", "conversational"),
+            **self._base_context(),
             "safety_profile": pack.manifest.safety_profile if pack else "standard",
             "knowledge": pack.get_knowledge_context(message) if pack else ""
         }
@@ -339,8 +442,9 @@ class ExpertInABox:
             worker_system = pack.get_worker_system(context["mode"], context["reading_level"])
             auditor_system = pack.get_auditor_system(context["mode"], context["reading_level"])
         else:
-            worker_system = WORKER_SYSTEM_TEMPLATE.format(**context)
-            auditor_system = AUDITOR_SYSTEM_TEMPLATE.format(**context)
+            worker_system, auditor_system = default_system_prompts(
+                context["module"], context["mode"], context["reading_level"], context["safety_profile"]
+            )
         
         # Run pipeline
         decision = self.pipeline.run(
@@ -351,11 +455,12 @@ class ExpertInABox:
         )
         
         # Log response
-        self.audit.log(EventType.RESPONSE, {
-            "action": decision.action,
-            "response_length": len(decision.response),
-            "caveats": decision.caveats
-        }, session_id)
+        if self._log_responses:
+            self._log_deferred(EventType.RESPONSE, {
+                "action": decision.action,
+                "response_length": len(decision.response),
+                "caveats": decision.caveats
+            }, session_id)
         
         return {
             "response": decision.response,
@@ -368,25 +473,82 @@ class ExpertInABox:
             "override_scope": decision.override_scope
         }
     
+    def _log_deferred(self, event_type: EventType | str, details: dict, session_id: Optional[str]) -> None:
+        """
+        Queue an audit event for the background logger thread.
+        
+        Events keep their order. If the queue stays full for
+        AUDIT_QUEUE_TIMEOUT the event is dropped and counted
+        (get_status()["audit_dropped"]).
+        """
+        try:
+            self._audit_queue.put((event_type, details, session_id), timeout=self.AUDIT_QUEUE_TIMEOUT)
+        except queue.Full:
+            with self._audit_dropped_lock:
+                self._audit_dropped += 1
+    
+    def _audit_loop(self) -> None:
+        """Deliver queued query audit events until a None sentinel arrives."""
+        while True:
+            item = self._audit_queue.get()
+            try:
+                if item is None:
+                    return
+                self.audit.log(*item)
+            except Exception as e:
+                logger.warning(f"Audit event dropped: {e}")
+            finally:
+                self._audit_queue.task_done()
+    
+    def _base_context(self) -> dict:
+        """Mode and profile fields of the query context, cached until either changes."""
+        key = (self.policy.version, self.profile.version)
+        cached = self._base_context_cache
+        if cached is None or cached[0] != key:
+            profile_ctx = self.profile.get_context()
+            cached = (key, {
+                "mode": self.policy.current_mode.value,
+                "reading_level": profile_ctx.get("reading_level", "general"),
+                "format": profile_ctx.get("format", "conversational")
+            })
+            self._base_context_cache = cached
+        return cached[1]
+    
     def _select_module(self, message: str) -> str:
         """Select appropriate module based on message content."""
+        # Keyed on the raw message (str hashes are memoized on the object,
+        # so no separate digest) and the pack loader version, so a
+        # load/unload invalidates; lower() only runs on a miss
+        key = (message, self.packs.version)
+        cache = self._module_select_cache
+        
+        # Locked: web requests run on a thread pool, and two concurrent
+        # evictions would otherwise race for the same oldest key
+        with self._module_select_lock:
+            module = cache.pop(key, None)
+        if module is None:
+            module = self._match_module(message.lower())
+        with self._module_select_lock:
+            if key not in cache and len(cache) >= self.MODULE_SELECT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = module
+        return module
+    
+    def _match_module(self, message_lower: str) -> str:
+        """Keyword routing over the routable modules (uncached)."""
         # Simple keyword matching for now
         # Future: Use classifier model
-        message_lower = message.lower()
-        
-        loaded = self.packs.get_loaded()
+        loaded = self._routable_modules()
         
         # Check for emergency keywords
-        emergency_keywords = ["emergency", "help", "urgent", "injury", "hurt", "bleeding", "disaster", "earthquake", "flood"]
-        if any(kw in message_lower for kw in emergency_keywords):
+        if self._EMERGENCY_RE.search(message_lower):
             if "disaster" in loaded:
                 return "disaster"
             if "medical" in loaded:
                 return "medical"
         
         # Check for medical keywords
-        medical_keywords = ["sick", "pain", "symptom", "medicine", "doctor", "health", "fever", "cough"]
-        if any(kw in message_lower for kw in medical_keywords):
+        if self._MEDICAL_RE.search(message_lower):
             if "medical" in loaded:
                 return "medical"
         
@@ -395,10 +557,26 @@ class ExpertInABox:
             return "education"
         
         if loaded:
-            return list(loaded.keys())[0]
+            return next(iter(loaded))
         
         return "general"
     
+    def _routable_modules(self) -> dict[str, None]:
+        """
+        Loaded packs plus lazily-enabled ones that exist, in load order.
+        
+        Rebuilt only when packs.version changes; the returned dict is
+        shared between calls, treat it as read-only.
+        """
+        available = self.packs.ensure_discovered()
+        cached = self._routable_cache
+        if cached is None or cached[0] != self.packs.version:
+            routable = dict.fromkeys(self.packs.get_loaded())
+            routable.update(dict.fromkeys(m for m in sorted(self._lazy_modules) if m in available))
+            cached = (self.packs.version, routable)
+            self._routable_cache = cached
+        return cached[1]
+    
     def switch_mode(self, target_mode: str, key: Optional[str] = None) -> dict:
         """
         Switch operating mode.
@@ -436,14 +614,15 @@ class ExpertInABox:
         # Update policy (in memory)
         # Note: Doesn't persist — would need to write back to file
         old_mode = self.policy.current_mode.value
-        self.policy._config["mode"]["current"] = target_mode
+        self.policy.set_mode(target)
         
         # Log mode change
-        self.audit.log(EventType.MODE_CHANGE, {
-            "from": old_mode,
-            "to": target_mode,
-            "key_used": eval_result.requires_key
-        })
+        if self._log_mode_changes:
+            self.audit.log(EventType.MODE_CHANGE, {
+                "from": old_mode,
+                "to": target_mode,
+                "key_used": eval_result.requires_key
+            })
         
         return {
             "success": True,
@@ -461,24 +640,76 @@ class ExpertInABox:
             "device_id": self.policy.device_id,
             "mode": self.policy.current_mode.value,
             "allowed_modes": [m.value for m in self.policy.allowed_modes],
-            "modules": {
+            "modules": self._module_status(),
+            "profile_active": self.profile.current_profile is not None,
+            "llm_available": self.worker_llm.is_available() if self.worker_llm else False,
+            "audit_stats": self.audit.get_stats(),
+            "audit_dropped": self._audit_dropped,
+            "response_cache": (
+                self.pipeline.response_cache.get_stats()
+                if self.pipeline.response_cache is not None else None
+            )
+        }
+    
+    def _module_status(self) -> dict:
+        """
+        Per-module enabled/loaded flags, rebuilt only when the policy or the
+        pack set changes (get_status() is polled by the web UI).
+        
+        The returned dict is shared between calls; treat it as read-only.
+        """
+        key = (self.policy.version, self.packs.version)
+        cached = self._module_status_cache
+        if cached is None or cached[0] != key:
+            loaded = self.packs.get_loaded()
+            cached = (key, {
                 name: {
                     "enabled": config.get("enabled", False),
-                    "loaded": name in self.packs.get_loaded()
+                    "loaded": name in loaded
                 }
                 for name, config in self.policy.get("modules", {}).items()
-            },
-            "profile_active": self.profile.current_profile is not None,
-            "llm_available": self.worker_llm.is_available() if self.worker_llm else False,
-            "audit_stats": self.audit.get_stats()
-        }
+            })
+            self._module_status_cache = cached
+        return cached[1]
+    
+    @staticmethod
+    def _create_ollama(config: LLMConfig, base_urls: list[str], sessions: dict):
+        """
+        One Ollama adapter, or a router over one adapter per host.
+        
+        sessions maps base URL -> pooled HTTP session; adapters reuse an
+        existing entry and register the one they create.
+        """
+        def create(url: str) -> OllamaAdapter:
+            adapter = OllamaAdapter(replace(config, base_url=url), session=sessions.get(url))
+            sessions.setdefault(url, adapter.session)
+            return adapter
+        
+        if len(base_urls) == 1:
+            return create(base_urls[0])
+        return RouterLLMAdapter([create(url) for url in base_urls])
     
     def shutdown(self) -> None:
         """Clean shutdown."""
+        if self._audit_thread is not None and self._audit_thread.is_alive():
+            self._audit_queue.put(None)
+            self._audit_thread.join()
+        if self.keys:
+            self.keys.flush_audit()
+        if self.packs:
+            self.packs.flush_audit()
+        if self.profile:
+            self.profile.flush_audit()
+        if self.pipeline:
+            self.pipeline.flush_audit()
+        for llm in (self.worker_llm, self.auditor_llm):
+            if llm:
+                llm.close()
         if self.audit:
             self.audit.log(EventType.SHUTDOWN, {
                 "device_id": self.policy.device_id if self.policy else "unknown"
             })
+            self.audit.close()
         logger.info("Expert-in-a-Box shutdown complete")
 
 
@@ -501,15 +732,21 @@ def main():
         data_dir=args.data
     )
     
-    if not app.setup():
-        logger.error("Setup failed!")
-        sys.exit(1)
-    
     if args.web:
-        # Start web UI
+        # Start web UI; setup runs behind it, so the page is up immediately
         from ui.web import start_server
-        start_server(app, port=args.port)
+        try:
+            ok = start_server(app, port=args.port, warm_up=app.setup)
+        finally:
+            # Drains the audit queue and component buffers, as the CLI does
+            app.shutdown()
+        if not ok:
+            sys.exit(1)
     else:
+        if not app.setup():
+            logger.error("Setup failed!")
+            sys.exit(1)
+        
         # Interactive CLI
         print("\nExpert-in-a-Box V2 — Interactive Mode")
         print(f"Mode: {app.policy.current_mode.value}")
@@ -533,12 +770,12 @@ def main():
                 
                 result = app.query(user_input, session_id=session_id)
                 
-                print(f"\nAssistant: {result['response']}")
-                
+                # One write per turn (same output as the separate prints)
+                reply = f"\nAssistant: {result['response']}\n"
                 if result.get('caveats'):
-                    print(f"\n⚠️  {'; '.join(result['caveats'])}")
-                
-                print()
+                    reply += f"\n⚠️  {'; '.join(result['caveats'])}\n"
+                sys.stdout.write(reply + "\n")
+                sys.stdout.flush()
                 
             except KeyboardInterrupt:
                 break
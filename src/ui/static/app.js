@@ -0,0 +1,255 @@
+// State
+let sessionId = null;
+let readingLevel = 'general';
+let isLoading = false;
+let loadingMessage = null;
+
+// Chat nodes added since the last frame, appended together
+let pendingMessages = null;
+
+// Textarea resize already queued for the next frame
+let resizeScheduled = false;
+
+// Status polls (one per second) while the server is starting up
+const STARTUP_RETRIES = 60;
+
+// Elements
+const chatArea = document.getElementById('chat-area');
+const messageInput = document.getElementById('message-input');
+const sendButton = document.getElementById('send-button');
+const modeBadge = document.getElementById('mode-badge');
+const llmStatus = document.getElementById('llm-status');
+const llmStatusText = document.getElementById('llm-status-text');
+const activeModule = document.getElementById('active-module');
+const readingLevelOptions = document.getElementById('reading-levels');
+let activeLevelButton = readingLevelOptions.querySelector('.active');
+
+// Initialize
+async function init() {
+    const status = await fetchStatus();
+    if (status) {
+        // Badge and LLM dot are not urgent; leave the main thread to input
+        whenIdle(() => updateStatus(status));
+    }
+}
+
+// Run fn once the browser is idle (at most ~100 ms later)
+function whenIdle(fn) {
+    if (window.requestIdleCallback) {
+        requestIdleCallback(fn, { timeout: 100 });
+    } else {
+        setTimeout(fn, 0);
+    }
+}
+
+// Fetch status
+async function fetchStatus(retries = STARTUP_RETRIES) {
+    try {
+        const response = await fetch('/api/status');
+        if (response.status === 503 && retries > 0) {
+            // Server still starting up; ask again shortly
+            await new Promise(resolve => setTimeout(resolve, 1000));
+            return fetchStatus(retries - 1);
+        }
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        return await response.json();
+    } catch (e) {
+        console.error('Failed to fetch status:', e);
+        return null;
+    }
+}
+
+// Update UI with status
+function updateStatus(status) {
+    updateMode(status.mode);
+
+    // LLM status
+    if (status.llm_available) {
+        llmStatus.classList.remove('offline');
+        llmStatusText.textContent = 'LLM Connected';
+    } else {
+        llmStatus.classList.add('offline');
+        llmStatusText.textContent = 'LLM Offline (Mock Mode)';
+    }
+}
+
+// Mode badge (also refreshed from each query response)
+function updateMode(mode) {
+    modeBadge.textContent = mode.charAt(0).toUpperCase() + mode.slice(1);
+    modeBadge.className = 'mode-badge ' + mode;
+}
+
+// Add message to chat
+function addMessage(role, content, module = null, caveats = null) {
+    // Built node by node: no HTML parsing, and text is never markup
+    const messageDiv = element('div', `message ${role}`);
+
+    const header = messageDiv.appendChild(element('div', 'message-header'));
+    header.appendChild(element('span', `message-role ${role}`, role === 'user' ? 'You' : 'Assistant'));
+    if (module) {
+        header.appendChild(element('span', 'message-module', module));
+    }
+
+    messageDiv.appendChild(element('div', 'message-content', content));
+
+    if (caveats && caveats.length > 0) {
+        messageDiv.appendChild(element('div', 'message-caveats', `⚠️ ${caveats.join(' • ')}`));
+    }
+
+    appendToChat(messageDiv);
+}
+
+// Create an element with a class and optional text
+function element(tag, className, text = null) {
+    const node = document.createElement(tag);
+    node.className = className;
+    if (text !== null) {
+        node.textContent = text;
+    }
+    return node;
+}
+
+// Queue a node for the chat area; one append + scroll per animation frame
+function appendToChat(node) {
+    if (!pendingMessages) {
+        pendingMessages = document.createDocumentFragment();
+        requestAnimationFrame(flushMessages);
+    }
+    pendingMessages.appendChild(node);
+}
+
+function flushMessages() {
+    chatArea.appendChild(pendingMessages);
+    pendingMessages = null;
+    // Read layout only after all of this frame's writes
+    chatArea.scrollTop = chatArea.scrollHeight;
+}
+
+// Add loading indicator
+function addLoading() {
+    const loadingDiv = document.createElement('div');
+    loadingDiv.className = 'message assistant';
+    loadingDiv.innerHTML = `
+        <div class="message-header">
+            <span class="message-role assistant">Assistant</span>
+        </div>
+        <div class="message-content">
+            <div class="loading">
+                <div class="loading-dots">
+                    <div class="loading-dot"></div>
+                    <div class="loading-dot"></div>
+                    <div class="loading-dot"></div>
+                </div>
+                <span>Thinking...</span>
+            </div>
+        </div>
+    `;
+    loadingMessage = loadingDiv;
+    appendToChat(loadingDiv);
+}
+
+// Remove loading indicator
+function removeLoading() {
+    // By reference: the node may still be queued (frames pause in background tabs)
+    if (loadingMessage) {
+        loadingMessage.remove();
+        loadingMessage = null;
+    }
+}
+
+// Send message
+async function sendMessage() {
+    const message = messageInput.value.trim();
+    if (!message || isLoading) return;
+
+    isLoading = true;
+    sendButton.disabled = true;
+
+    // Add user message
+    addMessage('user', message);
+    messageInput.value = '';
+    messageInput.style.height = 'auto';
+
+    // Show loading
+    addLoading();
+
+    try {
+        const response = await fetch('/api/query', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                message: message,
+                session_id: sessionId,
+                reading_level: readingLevel
+            })
+        });
+
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        const data = await response.json();
+
+        // Update session
+        if (data.session_id) {
+            sessionId = data.session_id;
+        }
+
+        // Remove loading and add response
+        removeLoading();
+        addMessage('assistant', data.response, data.module, data.caveats);
+
+        // Update module display; the response carries the mode too, so
+        // status is only fetched once, on load
+        if (data.module) {
+            activeModule.textContent = data.module;
+        }
+        if (data.mode) {
+            updateMode(data.mode);
+        }
+
+    } catch (e) {
+        removeLoading();
+        addMessage('assistant', 'Sorry, there was an error processing your request. Please try again.');
+        console.error('Query failed:', e);
+    }
+
+    isLoading = false;
+    sendButton.disabled = false;
+    messageInput.focus();
+}
+
+// Event listeners
+sendButton.addEventListener('click', sendMessage);
+
+messageInput.addEventListener('keydown', (e) => {
+    if (e.key === 'Enter' && !e.shiftKey) {
+        e.preventDefault();
+        sendMessage();
+    }
+});
+
+// Auto-resize textarea, at most once per frame however fast the typing
+messageInput.addEventListener('input', () => {
+    if (resizeScheduled) return;
+    resizeScheduled = true;
+    requestAnimationFrame(() => {
+        resizeScheduled = false;
+        messageInput.style.height = 'auto';
+        messageInput.style.height = Math.min(messageInput.scrollHeight, 200) + 'px';
+    });
+});
+
+// Reading level selection (one delegated listener for all buttons)
+readingLevelOptions.addEventListener('click', (e) => {
+    const button = e.target.closest('[data-level]');
+    if (!button || button === activeLevelButton) return;
+    activeLevelButton.classList.remove('active');
+    button.classList.add('active');
+    activeLevelButton = button;
+    readingLevel = button.dataset.level;
+});
+
+// Initialize
+init();
@@ -5,20 +5,69 @@ Simple Flask-based UI that runs locally.
 No cloud dependencies.
 """
 
+import os
+import gzip
 import json
+import time
+import hashlib
+import _thread
 import logging
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Any, Callable
 
 try:
-    from flask import Flask, render_template_string, request, jsonify, send_from_directory
+    from flask import Flask, Response, request, send_from_directory
     FLASK_AVAILABLE = True
 except ImportError:
     FLASK_AVAILABLE = False
 
+def _json_default(obj: Any) -> Any:
+    """Serialize objects exposing to_dict() (e.g. AuditEvent)."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+try:
+    import orjson
+    
+    def _json_bytes(obj: Any) -> bytes:
+        # Dataclasses are serialized natively, without a to_dict() copy
+        return orjson.dumps(obj, default=_json_default)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), default=_json_default).encode()
+    
+    _json_loads = json.loads
+
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 logger = logging.getLogger("expert-in-a-box.ui")
 
-# HTML template (embedded to avoid external dependencies)
+# Seconds a serialized /api/status body is reused across polls
+STATUS_CACHE_TTL = 0.5
+
+# Upper bound on events returned by one /api/audit request
+AUDIT_QUERY_MAX_LIMIT = 1000
+
+# Stylesheet and script for the page, served from /static
+STATIC_DIR = Path(__file__).parent / "static"
+
+# HTML shell (embedded; styles and script live in STATIC_DIR)
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
 <html lang="en">
@@ -26,312 +75,7 @@ HTML_TEMPLATE = '''
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Expert-in-a-Box</title>
-    <style>
-        :root {
-            --bg-primary: #0f1419;
-            --bg-secondary: #1a1f2e;
-            --bg-tertiary: #252b3b;
-            --text-primary: #e7e9ea;
-            --text-secondary: #8b98a5;
-            --accent: #1d9bf0;
-            --accent-hover: #1a8cd8;
-            --warning: #f4a621;
-            --danger: #f4212e;
-            --success: #00ba7c;
-            --border: #2f3542;
-        }
-        
-        * {
-            box-sizing: border-box;
-            margin: 0;
-            padding: 0;
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-            background: var(--bg-primary);
-            color: var(--text-primary);
-            min-height: 100vh;
-            display: flex;
-            flex-direction: column;
-        }
-        
-        /* Header */
-        .header {
-            background: var(--bg-secondary);
-            border-bottom: 1px solid var(--border);
-            padding: 1rem 1.5rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .header h1 {
-            font-size: 1.25rem;
-            font-weight: 600;
-        }
-        
-        .mode-badge {
-            background: var(--accent);
-            color: white;
-            padding: 0.25rem 0.75rem;
-            border-radius: 9999px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            text-transform: uppercase;
-        }
-        
-        .mode-badge.emergency {
-            background: var(--danger);
-        }
-        
-        .mode-badge.hybrid {
-            background: var(--warning);
-            color: var(--bg-primary);
-        }
-        
-        /* Main container */
-        .container {
-            flex: 1;
-            display: flex;
-            flex-direction: column;
-            max-width: 900px;
-            margin: 0 auto;
-            width: 100%;
-            padding: 1rem;
-        }
-        
-        /* Chat area */
-        .chat-area {
-            flex: 1;
-            overflow-y: auto;
-            padding: 1rem 0;
-        }
-        
-        .message {
-            margin-bottom: 1.5rem;
-            animation: fadeIn 0.3s ease;
-        }
-        
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        .message-header {
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            margin-bottom: 0.5rem;
-        }
-        
-        .message-role {
-            font-weight: 600;
-            font-size: 0.875rem;
-        }
-        
-        .message-role.user {
-            color: var(--accent);
-        }
-        
-        .message-role.assistant {
-            color: var(--success);
-        }
-        
-        .message-module {
-            font-size: 0.75rem;
-            color: var(--text-secondary);
-            background: var(--bg-tertiary);
-            padding: 0.125rem 0.5rem;
-            border-radius: 4px;
-        }
-        
-        .message-content {
-            background: var(--bg-secondary);
-            border-radius: 12px;
-            padding: 1rem;
-            line-height: 1.6;
-        }
-        
-        .message.user .message-content {
-            background: var(--bg-tertiary);
-        }
-        
-        .message-caveats {
-            margin-top: 0.75rem;
-            padding: 0.75rem;
-            background: rgba(244, 166, 33, 0.1);
-            border-left: 3px solid var(--warning);
-            border-radius: 0 8px 8px 0;
-            font-size: 0.875rem;
-            color: var(--warning);
-        }
-        
-        /* Input area */
-        .input-area {
-            background: var(--bg-secondary);
-            border: 1px solid var(--border);
-            border-radius: 12px;
-            padding: 0.75rem;
-            margin-top: 1rem;
-        }
-        
-        .input-row {
-            display: flex;
-            gap: 0.75rem;
-        }
-        
-        .input-field {
-            flex: 1;
-            background: var(--bg-tertiary);
-            border: 1px solid var(--border);
-            border-radius: 8px;
-            padding: 0.75rem 1rem;
-            color: var(--text-primary);
-            font-size: 1rem;
-            resize: none;
-            min-height: 48px;
-            max-height: 200px;
-        }
-        
-        .input-field:focus {
-            outline: none;
-            border-color: var(--accent);
-        }
-        
-        .send-button {
-            background: var(--accent);
-            color: white;
-            border: none;
-            border-radius: 8px;
-            padding: 0 1.5rem;
-            font-size: 1rem;
-            font-weight: 600;
-            cursor: pointer;
-            transition: background 0.2s;
-        }
-        
-        .send-button:hover {
-            background: var(--accent-hover);
-        }
-        
-        .send-button:disabled {
-            opacity: 0.5;
-            cursor: not-allowed;
-        }
-        
-        /* Status bar */
-        .status-bar {
-            display: flex;
-            gap: 1rem;
-            padding: 0.5rem 0;
-            font-size: 0.75rem;
-            color: var(--text-secondary);
-        }
-        
-        .status-item {
-            display: flex;
-            align-items: center;
-            gap: 0.25rem;
-        }
-        
-        .status-dot {
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            background: var(--success);
-        }
-        
-        .status-dot.offline {
-            background: var(--danger);
-        }
-        
-        /* Profile panel */
-        .profile-panel {
-            background: var(--bg-secondary);
-            border: 1px solid var(--border);
-            border-radius: 12px;
-            padding: 1rem;
-            margin-bottom: 1rem;
-        }
-        
-        .profile-panel h3 {
-            font-size: 0.875rem;
-            margin-bottom: 0.75rem;
-            color: var(--text-secondary);
-        }
-        
-        .profile-options {
-            display: flex;
-            gap: 0.5rem;
-            flex-wrap: wrap;
-        }
-        
-        .profile-option {
-            background: var(--bg-tertiary);
-            border: 1px solid var(--border);
-            border-radius: 6px;
-            padding: 0.375rem 0.75rem;
-            font-size: 0.75rem;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        
-        .profile-option:hover {
-            border-color: var(--accent);
-        }
-        
-        .profile-option.active {
-            background: var(--accent);
-            border-color: var(--accent);
-            color: white;
-        }
-        
-        /* Loading indicator */
-        .loading {
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            color: var(--text-secondary);
-            font-size: 0.875rem;
-        }
-        
-        .loading-dots {
-            display: flex;
-            gap: 4px;
-        }
-        
-        .loading-dot {
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            background: var(--accent);
-            animation: pulse 1.4s infinite ease-in-out;
-        }
-        
-        .loading-dot:nth-child(1) { animation-delay: -0.32s; }
-        .loading-dot:nth-child(2) { animation-delay: -0.16s; }
-        
-        @keyframes pulse {
-            0%, 80%, 100% { transform: scale(0); }
-            40% { transform: scale(1); }
-        }
-        
-        /* Responsive */
-        @media (max-width: 600px) {
-            .header {
-                padding: 0.75rem 1rem;
-            }
-            
-            .container {
-                padding: 0.5rem;
-            }
-            
-            .message-content {
-                padding: 0.75rem;
-            }
-        }
-    </style>
+    <link rel="stylesheet" href="/static/app.css">
 </head>
 <body>
     <header class="header">
@@ -389,252 +133,195 @@ HTML_TEMPLATE = '''
         </div>
     </main>
     
-    <script>
-        // State
-        let sessionId = null;
-        let readingLevel = 'general';
-        let isLoading = false;
-        
-        // Elements
-        const chatArea = document.getElementById('chat-area');
-        const messageInput = document.getElementById('message-input');
-        const sendButton = document.getElementById('send-button');
-        const modeBadge = document.getElementById('mode-badge');
-        const llmStatus = document.getElementById('llm-status');
-        const llmStatusText = document.getElementById('llm-status-text');
-        const activeModule = document.getElementById('active-module');
-        const readingLevelButtons = document.querySelectorAll('[data-level]');
-        
-        // Initialize
-        async function init() {
-            const status = await fetchStatus();
-            if (status) {
-                updateStatus(status);
-            }
-        }
-        
-        // Fetch status
-        async function fetchStatus() {
-            try {
-                const response = await fetch('/api/status');
-                return await response.json();
-            } catch (e) {
-                console.error('Failed to fetch status:', e);
-                return null;
-            }
-        }
-        
-        // Update UI with status
-        function updateStatus(status) {
-            // Mode badge
-            modeBadge.textContent = status.mode.charAt(0).toUpperCase() + status.mode.slice(1);
-            modeBadge.className = 'mode-badge ' + status.mode;
-            
-            // LLM status
-            if (status.llm_available) {
-                llmStatus.classList.remove('offline');
-                llmStatusText.textContent = 'LLM Connected';
-            } else {
-                llmStatus.classList.add('offline');
-                llmStatusText.textContent = 'LLM Offline (Mock Mode)';
-            }
-        }
-        
-        // Add message to chat
-        function addMessage(role, content, module = null, caveats = null) {
-            const messageDiv = document.createElement('div');
-            messageDiv.className = `message ${role}`;
-            
-            let html = `
-                <div class="message-header">
-                    <span class="message-role ${role}">${role === 'user' ? 'You' : 'Assistant'}</span>
-                    ${module ? `<span class="message-module">${module}</span>` : ''}
-                </div>
-                <div class="message-content">${escapeHtml(content)}</div>
-            `;
-            
-            if (caveats && caveats.length > 0) {
-                html += `<div class="message-caveats">⚠️ ${caveats.join(' • ')}</div>`;
-            }
-            
-            messageDiv.innerHTML = html;
-            chatArea.appendChild(messageDiv);
-            chatArea.scrollTop = chatArea.scrollHeight;
-        }
-        
-        // Add loading indicator
-        function addLoading() {
-            const loadingDiv = document.createElement('div');
-            loadingDiv.className = 'message assistant';
-            loadingDiv.id = 'loading-message';
-            loadingDiv.innerHTML = `
-                <div class="message-header">
-                    <span class="message-role assistant">Assistant</span>
-                </div>
-                <div class="message-content">
-                    <div class="loading">
-                        <div class="loading-dots">
-                            <div class="loading-dot"></div>
-                            <div class="loading-dot"></div>
-                            <div class="loading-dot"></div>
-                        </div>
-                        <span>Thinking...</span>
-                    </div>
-                </div>
-            `;
-            chatArea.appendChild(loadingDiv);
-            chatArea.scrollTop = chatArea.scrollHeight;
-        }
-        
-        // Remove loading indicator
-        function removeLoading() {
-            const loading = document.getElementById('loading-message');
-            if (loading) loading.remove();
-        }
-        
-        // Send message
-        async function sendMessage() {
-            const message = messageInput.value.trim();
-            if (!message || isLoading) return;
-            
-            isLoading = true;
-            sendButton.disabled = true;
-            
-            // Add user message
-            addMessage('user', message);
-            messageInput.value = '';
-            messageInput.style.height = 'auto';
-            
-            // Show loading
-            addLoading();
-            
-            try {
-                const response = await fetch('/api/query', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        message: message,
-                        session_id: sessionId,
-                        reading_level: readingLevel
-                    })
-                });
-                
-                const data = await response.json();
-                
-                // Update session
-                if (data.session_id) {
-                    sessionId = data.session_id;
-                }
-                
-                // Remove loading and add response
-                removeLoading();
-                addMessage('assistant', data.response, data.module, data.caveats);
-                
-                // Update module display
-                if (data.module) {
-                    activeModule.textContent = data.module;
-                }
-                
-            } catch (e) {
-                removeLoading();
-                addMessage('assistant', 'Sorry, there was an error processing your request. Please try again.');
-                console.error('Query failed:', e);
-            }
-            
-            isLoading = false;
-            sendButton.disabled = false;
-            messageInput.focus();
-        }
-        
-        // Escape HTML
-        function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }
-        
-        // Event listeners
-        sendButton.addEventListener('click', sendMessage);
-        
-        messageInput.addEventListener('keydown', (e) => {
-            if (e.key === 'Enter' && !e.shiftKey) {
-                e.preventDefault();
-                sendMessage();
-            }
-        });
-        
-        // Auto-resize textarea
-        messageInput.addEventListener('input', () => {
-            messageInput.style.height = 'auto';
-            messageInput.style.height = Math.min(messageInput.scrollHeight, 200) + 'px';
-        });
-        
-        // Reading level selection
-        readingLevelButtons.forEach(button => {
-            button.addEventListener('click', () => {
-                readingLevelButtons.forEach(b => b.classList.remove('active'));
-                button.classList.add('active');
-                readingLevel = button.dataset.level;
-            });
-        });
-        
-        // Initialize
-        init();
-    </script>
+    <script src="/static/app.js"></script>
 </body>
 </html>
 '''
 
 
-def create_app(expert_app):
-    """Create Flask application."""
+def _fingerprint(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _versioned_assets(html: str) -> str:
+    """
+    Add a content hash to each asset URL, so /static responses can be
+    cached forever: a changed file gets a new URL.
+    """
+    for asset in ("app.css", "app.js"):
+        version = _fingerprint((STATIC_DIR / asset).read_bytes())[:12]
+        html = html.replace(f"/static/{asset}", f"/static/{asset}?v={version}")
+    return html
+
+
+def _compact_html(html: str) -> str:
+    """
+    Drop indentation and blank lines. Safe for HTML_TEMPLATE: it has no
+    <pre> content, and the newline kept between lines still separates words.
+    """
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip()) + "\n"
+
+
+_INDEX_HTML = _compact_html(_versioned_assets(HTML_TEMPLATE))
+
+# The page has no template syntax, so it is served as-is: encoded and
+# fingerprinted once instead of rendered per request
+_INDEX_BYTES = _INDEX_HTML.encode("utf-8")
+_INDEX_ETAG = _fingerprint(_INDEX_BYTES)
+
+# Content-Encoding -> pre-compressed page, in preference order
+_INDEX_ENCODED: dict[str, bytes] = {}
+if BROTLI_AVAILABLE:
+    _INDEX_ENCODED["br"] = brotli.compress(_INDEX_BYTES, quality=11)
+_INDEX_ENCODED["gzip"] = gzip.compress(_INDEX_BYTES, 9, mtime=0)
+
+
+def _json_response(obj: Any) -> "Response":
+    """JSON response via _json_bytes (faster than jsonify with orjson)."""
+    return Response(_json_bytes(obj), mimetype="application/json")
+
+
+class _BadJSON(ValueError):
+    """Request body is not a JSON object."""
+
+
+def _json_body() -> dict:
+    """
+    Parse the request body as a JSON object ({} when empty). Decoded
+    directly from the raw bytes, without get_json()'s cached copy.
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        return {}
+    try:
+        data = _json_loads(raw)
+    except ValueError as e:
+        raise _BadJSON(str(e)) from e
+    if not isinstance(data, dict):
+        raise _BadJSON("expected a JSON object")
+    return data
+
+
+def create_app(expert_app, ready: Optional[threading.Event] = None):
+    """
+    Create Flask application.
+    
+    If ready is given, /api requests get a 503 until it is set, while the
+    page and static files are served right away.
+    """
     if not FLASK_AVAILABLE:
         raise ImportError("Flask not installed. Run: pip install flask")
     
-    app = Flask(__name__)
+    app = Flask(__name__, static_folder=str(STATIC_DIR))
     app.config['SECRET_KEY'] = 'expert-in-a-box-dev-key'
+    # Behind nginx/Apache, let the front server send /static files itself
+    app.config['USE_X_SENDFILE'] = os.environ.get("EXPERT_X_SENDFILE", "0") == "1"
+    
+    @app.before_request
+    def wait_for_setup():
+        if ready is not None and not ready.is_set() and request.path.startswith('/api/'):
+            response = _json_response({"error": "Expert-in-a-Box is starting"})
+            response.status_code = 503
+            response.headers["Retry-After"] = "1"
+            return response
+    
+    @app.errorhandler(_BadJSON)
+    def bad_json(e):
+        response = _json_response({"error": f"Invalid JSON body: {e}"})
+        response.status_code = 400
+        return response
+    
+    @app.after_request
+    def cache_static(response):
+        # Fingerprinted asset URLs never change content
+        if request.path.startswith('/static/') and request.args.get('v'):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
     
     @app.route('/')
     def index():
-        return render_template_string(HTML_TEMPLATE)
+        # no-cache: browsers revalidate every load, answered with a 304 until
+        # the page changes (a new build never shows a stale shell)
+        accepted = request.accept_encodings
+        encoding = next((e for e in _INDEX_ENCODED if accepted.quality(e) > 0), None)
+        
+        if encoding:
+            response = Response(_INDEX_ENCODED[encoding], mimetype="text/html")
+            response.headers["Content-Encoding"] = encoding
+            response.set_etag(f"{_INDEX_ETAG}-{encoding}")
+        else:
+            response = Response(_INDEX_BYTES, mimetype="text/html")
+            response.set_etag(_INDEX_ETAG)
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["Vary"] = "Accept-Encoding"
+        return response.make_conditional(request)
+    
+    # (monotonic time, serialized get_status()) from the last poll
+    status_cache: Optional[tuple[float, bytes]] = None
     
     @app.route('/api/status')
     def status():
-        return jsonify(expert_app.get_status())
+        nonlocal status_cache
+        now = time.monotonic()
+        cached = status_cache
+        if cached is None or now - cached[0] >= STATUS_CACHE_TTL:
+            cached = (now, _json_bytes(expert_app.get_status()))
+            status_cache = cached
+        return Response(cached[1], mimetype="application/json")
+    
+    # (reading level, profile) last loaded by /api/query
+    level_profile: Optional[tuple[str, Any]] = None
+    # Held across the check and reload so concurrent requests don't race them
+    level_profile_lock = threading.Lock()
     
     @app.route('/api/query', methods=['POST'])
     def query():
-        data = request.get_json()
+        # Deliberately not streamed: the Auditor reviews the complete Worker
+        # answer before any of it reaches the user
+        data = _json_body()
         
         message = data.get('message', '')
         session_id = data.get('session_id')
         reading_level = data.get('reading_level', 'general')
         
-        # Update profile if reading level changed
+        # Update profile if reading level changed (a reload also resets the
+        # app's cached query context, so skip it while ours is still active)
+        nonlocal level_profile
         if reading_level:
-            expert_app.profile.load({
-                "reading_level": reading_level,
-                "format_preference": "conversational"
-            })
+            with level_profile_lock:
+                current = expert_app.profile.current_profile
+                if (
+                    current is None
+                    or level_profile is None
+                    or level_profile[0] != reading_level
+                    or current is not level_profile[1]
+                    or current.is_expired()
+                ):
+                    result = expert_app.profile.load({
+                        "reading_level": reading_level,
+                        "format_preference": "conversational"
+                    })
+                    # A rejected load (e.g. require_signature) is retried next time
+                    level_profile = (reading_level, result.profile) if result.valid else None
         
         result = expert_app.query(message, session_id=session_id)
-        return jsonify(result)
+        return _json_response(result)
     
     @app.route('/api/mode', methods=['POST'])
     def switch_mode():
-        data = request.get_json()
+        data = _json_body()
         target_mode = data.get('mode')
         key = data.get('key')
         
         result = expert_app.switch_mode(target_mode, key)
-        return jsonify(result)
+        return _json_response(result)
     
     @app.route('/api/profile', methods=['POST'])
     def load_profile():
-        data = request.get_json()
+        data = _json_body()
         
         result = expert_app.profile.load(data)
-        return jsonify({
+        return _json_response({
             "success": result.valid,
             "error": result.error,
             "warnings": result.warnings
@@ -642,29 +329,78 @@ def create_app(expert_app):
     
     @app.route('/api/audit')
     def get_audit():
-        event_types = request.args.get('types', '').split(',') if request.args.get('types') else None
-        limit = int(request.args.get('limit', 100))
-        
-        events = expert_app.audit.query(event_types=event_types, limit=limit)
-        return jsonify({
-            "events": [e.to_dict() for e in events]
-        })
+        # ?types=a&types=b; a single comma-separated value is still accepted
+        event_types = request.args.getlist('types')
+        if len(event_types) == 1 and ',' in event_types[0]:
+            event_types = event_types[0].split(',')
+        limit = min(AUDIT_QUERY_MAX_LIMIT, max(1, request.args.get('limit', 100, type=int)))
+        
+        # Log lines are already event JSON; splice them in as-is
+        lines = expert_app.audit.query_json(event_types=event_types or None, limit=limit)
+        return Response(b'{"events":[' + b','.join(lines) + b']}', mimetype="application/json")
     
     return app
 
 
-def start_server(expert_app, host: str = "0.0.0.0", port: int = 8080):
-    """Start the web server."""
+def _warm_up(setup: Callable[[], bool], ready: threading.Event, failed: threading.Event):
+    try:
+        ok = setup()
+    except Exception:
+        logger.exception("Setup raised an exception")
+        ok = False
+    
+    if ok:
+        ready.set()
+    else:
+        logger.error("Setup failed!")
+        failed.set()
+        # Stop the server (its loop exits on KeyboardInterrupt)
+        _thread.interrupt_main()
+
+
+def start_server(
+    expert_app,
+    host: str = "0.0.0.0",
+    port: int = 8080,
+    warm_up: Optional[Callable[[], bool]] = None
+) -> bool:
+    """
+    Start the web server.
+    
+    warm_up (e.g. expert_app.setup) runs in a background thread, so the
+    page loads while the LLM is probed instead of after. If it fails, the
+    server is stopped.
+    
+    Returns:
+        False if Flask is missing or warm_up failed, True after a normal stop
+    """
     if not FLASK_AVAILABLE:
         logger.error("Flask not installed. Run: pip install flask")
         print("\n❌ Flask not installed.")
         print("Install with: pip install flask")
-        return
+        return False
     
-    app = create_app(expert_app)
+    ready = threading.Event() if warm_up is not None else None
+    failed = threading.Event()
+    app = create_app(expert_app, ready=ready)
     
     print(f"\n🚀 Expert-in-a-Box Web UI")
     print(f"   Open http://localhost:{port} in your browser")
     print(f"   Press Ctrl+C to stop\n")
     
-    app.run(host=host, port=port, debug=False)
+    try:
+        if warm_up is not None:
+            threading.Thread(
+                target=_warm_up, args=(warm_up, ready, failed), name="web-warm-up", daemon=True
+            ).start()
+        
+        if WAITRESS_AVAILABLE:
+            # Production WSGI server: status polls keep being answered while
+            # worker threads wait on long LLM calls
+            waitress_serve(app, host=host, port=port, threads=max(4, os.cpu_count() or 1))
+        else:
+            app.run(host=host, port=port, debug=False, threaded=True)
+    except KeyboardInterrupt:
+        if not failed.is_set():
+            raise
+    return not failed.is_set()
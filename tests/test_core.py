@@ -2,18 +2,26 @@
 Basic tests for Expert-in-a-Box core components.
 """
 
+import os
 import sys
 import json
+import shutil
+import tempfile
+import threading
 from pathlib import Path
+from datetime import datetime, timedelta, timezone
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from core.policy import Policy, Mode, PolicyEvaluation
 from core.keys import KeyRegistry, KeyValidation
-from core.audit import AuditLogger, EventType
+from core.audit import AuditLogger, AuditBuffer, EventType
 from core.profile import ProfileManager, ProfileEnvelope
 from core.packs import PackLoader, PackManifest
+from core.cache import SemanticCache
+from core.pipeline import Pipeline, create_response_cache
+from adapters.llm_adapter import MockAdapter, CachedAdapter, BatchingAdapter, RouterLLMAdapter
 
 
 def test_policy_validation():
@@ -47,6 +55,151 @@ def test_policy_validation():
     print("✓ Policy validation passed")
 
 
+def test_policy_schema():
+    """Test the compiled schema validator and the validation cache."""
+    base = {
+        "device_id": "test-001",
+        "mode": {"current": "education", "allowed": ["education"]},
+        "modules": {"education": {"enabled": True, "loaded": True}},
+        "safety": {"require_auditor": True},
+        "output": {"default_reading_level": "general"},
+        "audit": {"log_queries": True}
+    }
+    
+    def errors(config: dict) -> list[tuple[str, str]]:
+        policy = Policy()
+        valid = policy.load_dict(config)
+        found = [(v.field, v.message) for v in policy.violations if v.severity == "error"]
+        assert valid == (not found)
+        return found
+    
+    assert errors(base) == []
+    assert errors({k: v for k, v in base.items() if k != "device_id"}) == [("device_id", "Required field missing")]
+    assert errors({**base, "device_id": 5}) == [("device_id", "Expected str, got int")]
+    assert errors({**base, "safety": []}) == [("safety", "Expected dict, got list")]
+    assert errors({**base, "mode": {"current": "party", "allowed": []}}) == [
+        ("mode.current", "Value must be one of: ['education', 'emergency', 'hybrid']")
+    ]
+    # Dynamic keys: every module entry is checked against value_schema
+    assert errors({**base, "modules": {"education": {"enabled": True}, "medical": {"loaded": "yes"}}}) == [
+        ("modules.medical.loaded", "Expected bool, got str")
+    ]
+    
+    # A reloaded file hits the validation cache with the same result
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "policy.json"
+        path.write_text(json.dumps({**base, "device_id": 5}))
+        for _ in range(2):
+            policy = Policy()
+            assert policy.load(path) == False
+            assert [(v.field, v.message) for v in policy.violations] == [("device_id", "Expected str, got int")]
+    
+    print("✓ Policy schema passed")
+
+
+def test_audit_log():
+    """Test the audit checksum chain, sidecars, queries and verification."""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "audit.jsonl"
+        audit = AuditLogger(log_path, device_id="test-001")
+        before = datetime.now(timezone.utc) - timedelta(seconds=1)
+        
+        audit.log(EventType.STARTUP, {"version": "2"})
+        audit.log(EventType.QUERY, {"query": "How do I purify water?"}, session_id="s1")
+        audit.log_batch([
+            (EventType.RESPONSE, {"response": "Boil it."}),
+            ("custom_event", {"n": 1})
+        ], session_id="s1")
+        
+        stats = audit.get_stats()
+        assert stats["events"] == 4
+        assert stats["by_type"] == {"startup": 1, "query": 1, "response": 1, "custom_event": 1}
+        assert audit.verify_integrity() == (True, [])
+        
+        # Filters: type, session, limit, time range (index and string bounds)
+        assert [e.event_type for e in audit.query(event_types=["query", "response"])] == ["query", "response"]
+        assert len(audit.query(session_id="s1")) == 3
+        assert len(audit.query(limit=2)) == 2
+        assert len(audit.query(from_time=before)) == 4
+        assert audit.query(from_time=before + timedelta(hours=1)) == []
+        assert audit.query(to_time=before) == []
+        
+        # query_json returns the stored lines, checksum included
+        lines = audit.query_json(event_types=["startup"])
+        assert json.loads(lines[0])["checksum"] == audit.query(event_types=["startup"])[0].checksum
+        audit.close()
+        
+        assert log_path.with_suffix(".idx").exists()
+        assert json.loads(log_path.with_suffix(".stats.json").read_text())["events"] == 4
+        
+        # Reopened: chain continues from the last checksum, counters from the sidecar
+        audit = AuditLogger(log_path, device_id="test-001")
+        audit.log(EventType.SHUTDOWN, {})
+        assert audit.get_stats()["events"] == 5
+        assert audit.verify_integrity() == (True, [])
+        assert len(audit.query(from_time=before)) == 5
+        audit.close()
+        
+        # A missing index is rebuilt from the log
+        log_path.with_suffix(".idx").unlink()
+        audit = AuditLogger(log_path)
+        assert len(audit.query(from_time=before, event_types=["query"])) == 1
+        audit.close()
+        
+        # Tampering with a logged event breaks verification
+        lines = log_path.read_bytes().splitlines(keepends=True)
+        lines[1] = lines[1].replace(b"purify", b"poison")
+        log_path.write_bytes(b"".join(lines))
+        valid, issues = AuditLogger(log_path).verify_integrity()
+        assert valid == False
+        assert issues == ["Line 2: Checksum mismatch"]
+        
+        # Background writer: events are visible to queries before close()
+        audit = AuditLogger(Path(tmp) / "bg.jsonl", background_writes=True)
+        for i in range(50):
+            audit.log(EventType.QUERY, {"query": f"q{i}"})
+        assert len(audit.query(event_types=["query"])) == 50
+        assert audit.verify_integrity() == (True, [])
+        audit.close()
+    
+    print("✓ Audit log passed")
+
+
+def test_audit_buffer():
+    """Test AuditBuffer batching, flush and drop reporting."""
+    delivered = []
+    buffer = AuditBuffer(lambda event_type, details: delivered.append(event_type),
+                         max_events=3, interval=60)
+    buffer("a", {})
+    buffer("b", {})
+    assert delivered == []
+    buffer("c", {})  # full batch: delivered by the caller
+    assert delivered == ["a", "b", "c"]
+    buffer("d", {})
+    assert buffer.flush() == 1
+    assert delivered == ["a", "b", "c", "d"]
+    assert buffer.flush() == 0
+    
+    # Bounded: oldest events are dropped and the count reported once
+    batches = []
+    
+    def callback(event_type, details):
+        raise AssertionError("log_batch should be used")
+    callback.log_batch = batches.append
+    
+    buffer = AuditBuffer(callback, max_events=100, interval=60, max_pending=2)
+    for event_type in ("a", "b", "c", "d", "e"):
+        buffer(event_type, {})
+    assert buffer.dropped == 3
+    buffer.flush()
+    assert batches == [[("d", {}), ("e", {}), ("audit_events_dropped", {"count": 3})]]
+    buffer("f", {})
+    buffer.flush()
+    assert batches[-1] == [("f", {})]
+    
+    print("✓ Audit buffer passed")
+
+
 def test_key_hashing():
     """Test key hashing and validation."""
     plaintext = "test-secret-key"
@@ -90,6 +243,59 @@ def test_key_validation():
     print("✓ Key validation passed")
 
 
+def test_generated_keys():
+    """Generated keys (bcrypt-stored when available) validate by scope."""
+    plaintext, stored = KeyRegistry.generate_key()
+    assert plaintext not in stored
+    
+    registry = KeyRegistry()
+    registry.load_dict({"keys": [{"id": "gen", "hash": stored, "scopes": ["mode_control"]}]})
+    for _ in range(2):  # second call takes the verified-key shortcut for bcrypt
+        result = registry.validate(plaintext, "mode_control")
+        assert result.valid == True
+        assert result.key_id == "gen"
+    assert registry.validate(plaintext, "safety_override").valid == False
+    assert registry.validate(plaintext + "x", "mode_control").valid == False
+    
+    print("✓ Generated keys passed")
+
+
+def test_key_reload_failure():
+    """A failed reload must not leave the old keys valid."""
+    registry = KeyRegistry()
+    registry.load_dict({
+        "keys": [{"id": "a", "hash": KeyRegistry.hash_key("A"), "scopes": ["*"]}]
+    })
+    assert registry.validate("A", "mode_control").valid == True
+    
+    # Entry without a hash: load fails and the registry is emptied
+    assert registry.load_dict({"keys": [{"id": "b"}]}) == False
+    assert registry.list_keys() == []
+    assert registry.validate("A", "mode_control").valid == False
+    
+    print("✓ Key reload failure passed")
+
+
+def test_malformed_key_hash():
+    """Entries with a malformed hash are skipped and audited."""
+    registry = KeyRegistry()
+    registry.load_dict({
+        "keys": [
+            {"id": "good", "hash": KeyRegistry.hash_key("good-key"), "scopes": ["*"]},
+            {"id": "short", "hash": "abc123", "scopes": ["*"]}
+        ]
+    })
+    assert [k["id"] for k in registry.list_keys()] == ["good"]
+    assert registry.validate("good-key", "mode_control").valid == True
+    
+    # Skipped before any callback existed: reported once one is set
+    events = []
+    registry.set_audit_callback(lambda event_type, details: events.append((event_type, details)))
+    assert events == [("malformed_hash_entry", {"key_id": "short"})]
+    
+    print("✓ Malformed key hash passed")
+
+
 def test_profile_envelope():
     """Test profile creation and validation."""
     profile = ProfileEnvelope(
@@ -142,16 +348,353 @@ def test_pack_manifest():
     print("✓ Pack manifest passed")
 
 
+def test_pack_loader():
+    """Test pack discovery, caches and version bumps."""
+    with tempfile.TemporaryDirectory() as tmp:
+        loader = PackLoader(Path(tmp) / "packs")
+        assert loader.get_available() == {}
+        version = loader.version
+        
+        loader.create_pack_template("alpha", "Alpha", "First pack")
+        assert loader.discover().keys() == {"alpha"}
+        assert loader.version > version
+        
+        # Unchanged rescan keeps the version
+        version = loader.version
+        loader.discover()
+        assert loader.version == version
+        
+        pack = loader.load("alpha")
+        assert loader.version > version
+        assert loader.load("alpha") is pack
+        assert loader.get_pack_for_mode("education") == [pack]
+        
+        # Rendered prompts and knowledge context are memoized
+        prompt = pack.get_worker_system("education", "teen")
+        assert "teen" in prompt
+        assert pack.get_worker_system("education", "teen") is prompt
+        context = pack.get_knowledge_context("anything")
+        assert "Alpha Knowledge Base" in context
+        assert pack.get_knowledge_context("other") is context
+        
+        # A pack added after discovery is found by load()
+        loader.create_pack_template("beta", "Beta", "Second pack")
+        assert "beta" not in loader.get_available()
+        version = loader.version
+        assert loader.load("beta") is not None
+        assert loader.version > version
+        
+        version = loader.version
+        assert loader.unload("alpha") == True
+        assert loader.version > version
+        assert [p.id for p in loader.get_pack_for_mode("education")] == ["beta"]
+        assert loader.unload("alpha") == False
+        
+        # Concurrent first loads build and register the pack once
+        loader.create_pack_template("gamma", "Gamma", "Third pack")
+        version = loader.version
+        loaded = []
+        threads = [threading.Thread(target=lambda: loaded.append(loader.load("gamma"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(loaded) == 8 and all(p is loaded[0] for p in loaded)
+        assert [p.id for p in loader.get_pack_for_mode("education")] == ["beta", "gamma"]
+        assert loader.version == version + 2  # discovery + load
+        
+        version = loader.version
+        shutil.rmtree(Path(tmp) / "packs")
+        assert loader.discover() == {}
+        assert loader.version > version
+    
+    print("✓ Pack loader passed")
+
+
+def test_semantic_cache():
+    """Test exact and semantic cache lookups."""
+    vectors = {
+        "how do I treat a burn": [1.0, 0.0, 0.0],
+        "how do i treat a burn?": [0.99, 0.01, 0.0],
+        "what is photosynthesis": [0.0, 1.0, 0.0]
+    }
+    cache = SemanticCache(embed_fn=lambda text: vectors[text], threshold=0.95)
+    
+    cache.put("how do I treat a burn", "Cool the burn with running water.")
+    
+    # Exact hit
+    assert cache.get("how do I treat a burn") == "Cool the burn with running water."
+    
+    # Semantic hit
+    assert cache.get("how do i treat a burn?") == "Cool the burn with running water."
+    
+    # Unrelated query misses
+    assert cache.get("what is photosynthesis") is None
+    
+    print("✓ Semantic cache passed")
+
+
+class CountingAdapter(MockAdapter):
+    """MockAdapter that counts generate_json calls."""
+    
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+    
+    def generate_json(self, *args, **kwargs):
+        self.calls += 1
+        return super().generate_json(*args, **kwargs)
+
+
+class BatchRecordingAdapter(MockAdapter):
+    """MockAdapter with generate_json_batch that records batch sizes."""
+    
+    def __init__(self, drop_last: bool = False):
+        super().__init__()
+        self.batches = []
+        self.drop_last = drop_last
+    
+    def generate_json_batch(self, prompts, system=None, schema=None, temperature=None):
+        self.batches.append(len(prompts))
+        results = [{"response": prompt} for prompt in prompts]
+        return results[:-1] if self.drop_last else results
+
+
+def test_llm_adapters():
+    """Test CachedAdapter, BatchingAdapter and RouterLLMAdapter."""
+    # CachedAdapter: partitioned by system prompt, results copied
+    inner = CountingAdapter()
+    cached = CachedAdapter(inner)
+    first = cached.generate_json("What is a tsunami?", "system A")
+    first["caveats"].append("mutated")
+    assert cached.generate_json("What is a tsunami?", "system A")["caveats"] == []
+    assert inner.calls == 1
+    cached.generate_json("What is a tsunami?", "system B")
+    assert inner.calls == 2
+    
+    # BatchingAdapter: concurrent calls share one batch
+    def run_concurrently(adapter, count):
+        results = [None] * count
+        
+        def call(i):
+            try:
+                results[i] = adapter.generate_json(f"prompt {i}", "system")
+            except Exception as e:
+                results[i] = e
+        
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        assert not any(thread.is_alive() for thread in threads), "caller left blocked"
+        return results
+    
+    backend = BatchRecordingAdapter()
+    results = run_concurrently(BatchingAdapter(backend, max_batch_size=4, max_latency=5), 4)
+    assert backend.batches == [4]
+    assert sorted(r["response"] for r in results) == [f"prompt {i}" for i in range(4)]
+    
+    # A short batch result fails the unmatched caller instead of hanging it
+    results = run_concurrently(BatchingAdapter(BatchRecordingAdapter(drop_last=True), max_batch_size=2, max_latency=5), 2)
+    assert sum(isinstance(r, RuntimeError) for r in results) == 1
+    
+    # RouterLLMAdapter: calls spread over backends, in-flight counts released
+    backends = [CountingAdapter(), CountingAdapter()]
+    router = RouterLLMAdapter(backends)
+    for _ in range(50):
+        router.generate_json("q")
+    assert all(b.calls > 0 for b in backends)
+    assert sum(b.calls for b in backends) == 50
+    assert router._in_flight == [0, 0]
+    
+    print("✓ LLM adapters passed")
+
+
+def test_resolver():
+    """Test auditor JSON parsing and the resolver decision table."""
+    worker = {"response": "Boil water for one minute.", "confidence": 0.9,
+              "citations": [], "caveats": ["Use clean containers."]}
+    
+    def resolve(auditor: dict):
+        adapter = MockAdapter()
+        adapter.set_json_responses([worker, auditor])
+        return Pipeline(adapter).run("How long should I boil water?", {"module": "education"}, "W", "A")
+    
+    decision = resolve({"verdict": "approve"})
+    assert decision.action == "send"
+    assert decision.caveats == ("Use clean containers.",)
+    
+    decision = resolve({"verdict": "revise", "reasoning": "Too short", "suggested_revision": "Boil for 3 minutes."})
+    assert decision.action == "send_with_caveat"
+    assert decision.response == "Boil for 3 minutes."
+    assert decision.caveats[-1] == "Note: Too short"
+    
+    decision = resolve({"verdict": "revise", "reasoning": "Too short"})
+    assert decision.response == worker["response"]
+    assert decision.caveats[-1].startswith("Note: This response may have limitations.")
+    
+    assert resolve({"verdict": "reject"}).action == "reject"
+    assert resolve({"verdict": "escalate"}).action == "escalate"
+    
+    # HARMFUL flag or critical risk rejects whatever the verdict; unknown
+    # flags are ignored
+    assert resolve({"verdict": "approve", "flags": ["harmful", "not-a-flag"]}).action == "reject"
+    assert resolve({"verdict": "approve", "risk_level": "critical"}).action == "reject"
+    assert resolve({"verdict": "approve", "flags": ["not-a-flag"]}).action == "send"
+    
+    # Unknown verdict: sent with a caveat, never silently approved
+    assert resolve({"verdict": "maybe"}).action == "send_with_caveat"
+    
+    print("✓ Resolver passed")
+
+
+def test_response_cache():
+    """Test response-cache partitions and the approvals-only rule."""
+    adapter = CountingAdapter()
+    pipeline = Pipeline(adapter, response_cache=create_response_cache())
+    context = {"module": "education", "knowledge": "Pack content v1"}
+    
+    assert pipeline.run("How do plants grow?", context, "W", "A").action == "send"
+    calls = adapter.calls
+    
+    # Repeat is served from the cache
+    assert pipeline.run("How do plants grow?", context, "W", "A").action == "send"
+    assert adapter.calls == calls
+    
+    # Updated pack knowledge, other mode or other system prompt: miss
+    pipeline.run("How do plants grow?", {**context, "knowledge": "Pack content v2"}, "W", "A")
+    assert adapter.calls > calls
+    calls = adapter.calls
+    pipeline.run("How do plants grow?", {**context, "mode": "emergency"}, "W", "A")
+    assert adapter.calls > calls
+    calls = adapter.calls
+    pipeline.run("How do plants grow?", context, "W2", "A")
+    assert adapter.calls > calls
+    
+    # Rejected answers are never cached
+    harmful = {"response": "The lethal dose to kill a person is high", "confidence": 0.9,
+               "citations": [], "caveats": []}
+    adapter.set_json_responses([harmful, harmful])
+    assert pipeline.run("Dangerous question", context, "W", "A").action == "reject"
+    calls = adapter.calls
+    assert pipeline.run("Dangerous question", context, "W", "A").action == "reject"
+    assert adapter.calls > calls
+    
+    print("✓ Response cache passed")
+
+
+def test_web_api():
+    """Test the web UI endpoints (skipped without Flask)."""
+    from ui.web import FLASK_AVAILABLE, create_app
+    if not FLASK_AVAILABLE:
+        print("- Web API skipped (Flask not installed)")
+        return
+    from main import ExpertInABox
+    
+    previous_url = os.environ.get("OLLAMA_URL")
+    os.environ["OLLAMA_URL"] = "http://127.0.0.1:9"  # unreachable: mock LLM
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            expert = ExpertInABox(config_dir=Path(tmp) / "config", data_dir=Path(tmp) / "data")
+            ready = threading.Event()
+            client = create_app(expert, ready=ready).test_client()
+            
+            # Until setup finishes the page loads and the API answers 503
+            assert client.get('/').status_code == 200
+            response = client.get('/api/status')
+            assert response.status_code == 503
+            assert response.headers["Retry-After"] == "1"
+            
+            assert expert.setup()
+            ready.set()
+            assert client.get('/api/status').get_json()["initialized"] == True
+            
+            # Repeat queries reuse the reading-level profile
+            for _ in range(2):
+                response = client.post('/api/query', json={
+                    "message": "How do I purify water?",
+                    "reading_level": "teen"
+                })
+                assert response.status_code == 200
+                assert response.get_json()["response"]
+            
+            response = client.post('/api/query', data=b"{not json", content_type="application/json")
+            assert response.status_code == 400
+            
+            # Repeated or comma-separated types; limit clamped, bad limit = default
+            events = client.get('/api/audit?types=startup&types=mode_change&limit=0').get_json()["events"]
+            assert [e["event_type"] for e in events] == ["startup"]
+            events = client.get('/api/audit?types=startup,mode_change&limit=abc').get_json()["events"]
+            assert [e["event_type"] for e in events] == ["startup"]
+            
+            # Pre-compressed page, revalidated by ETag
+            response = client.get('/', headers={"Accept-Encoding": "gzip"})
+            assert response.headers["Content-Encoding"] == "gzip"
+            response = client.get('/', headers={
+                "Accept-Encoding": "gzip",
+                "If-None-Match": response.headers["ETag"]
+            })
+            assert response.status_code == 304
+            
+            expert.shutdown()
+    finally:
+        if previous_url is None:
+            os.environ.pop("OLLAMA_URL", None)
+        else:
+            os.environ["OLLAMA_URL"] = previous_url
+    
+    print("✓ Web API passed")
+
+
+def test_query_audit_order():
+    """Test that a query's audit events are logged in the order they happened."""
+    from main import ExpertInABox
+    
+    previous_url = os.environ.get("OLLAMA_URL")
+    os.environ["OLLAMA_URL"] = "http://127.0.0.1:9"  # unreachable: mock LLM
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            expert = ExpertInABox(config_dir=Path(tmp) / "config", data_dir=Path(tmp) / "data")
+            assert expert.setup()
+            assert expert.query("How do I purify water?")["response"]
+            expert.shutdown()
+            
+            with open(Path(tmp) / "data" / "audit.jsonl") as f:
+                types = [json.loads(line)["event_type"] for line in f if line.strip()]
+            assert types.index("query") < types.index("worker_complete") < types.index("response")
+    finally:
+        if previous_url is None:
+            os.environ.pop("OLLAMA_URL", None)
+        else:
+            os.environ["OLLAMA_URL"] = previous_url
+    
+    print("✓ Query audit order passed")
+
+
 def run_all_tests():
     """Run all tests."""
     print("\n=== Expert-in-a-Box Core Tests ===\n")
     
     test_policy_validation()
+    test_policy_schema()
+    test_audit_log()
+    test_audit_buffer()
     test_key_hashing()
     test_key_validation()
+    test_generated_keys()
+    test_key_reload_failure()
+    test_malformed_key_hash()
     test_profile_envelope()
     test_profile_manager()
     test_pack_manifest()
+    test_pack_loader()
+    test_semantic_cache()
+    test_llm_adapters()
+    test_resolver()
+    test_response_cache()
+    test_query_audit_order()
+    test_web_api()
     
     print("\n=== All tests passed! ===\n")
 